@@ -24,6 +24,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utilities.logging_config import log, log_section
+from utilities.named_selection_helper import invalidate_named_selection_cache
 
 
 def run_contact_automation():
@@ -47,9 +48,110 @@ def run_bolt_force_extraction():
     bolt_force_extraction.main()
 
 
+def run_bolt_detection():
+    """Run bolt detection script (creates bolt named selections)."""
+    log_section("Running Bolt Detection")
+    from preprocessing import bolt_detection
+    bolt_detection.main()
+
+
+def run_validation():
+    """
+    Run pre-flight validation of all configured named selections.
+
+    Returns:
+        dict: Validation report
+    """
+    log_section("Running Pre-flight Validation")
+    from preprocessing import preflight
+    return preflight.main()
+
+
+def run_contact_precheck():
+    """
+    Run the initial contact status pre-check.
+
+    Returns:
+        dict: Pre-check report
+    """
+    log_section("Running Contact Pre-check")
+    from preprocessing import contact_precheck
+    return contact_precheck.main()
+
+
+def run_bolt_meshing():
+    """
+    Run bolt region mesh sizing.
+
+    Returns:
+        dict: Mesh sizing report
+    """
+    log_section("Running Bolt Mesh Sizing")
+    from preprocessing import bolt_meshing
+    return bolt_meshing.main()
+
+
+def run_beam_screening():
+    """
+    Run the beam bolt screening mode (beams instead of solid bolts).
+
+    Returns:
+        dict: Screening report
+    """
+    log_section("Running Beam Bolt Screening Mode")
+    from preprocessing import beam_bolts
+    return beam_bolts.main()
+
+
+def run_solve():
+    """
+    Run the solve orchestrator (solves and extracts as analyses finish).
+
+    Returns:
+        dict: Solve report
+    """
+    log_section("Running Solve Orchestrator")
+    from solving import solve_orchestrator
+    return solve_orchestrator.main()
+
+
+def run_solve_recommendation():
+    """
+    Print the recommended cores and mode per analysis from the solve history (dry run).
+
+    Returns:
+        list: One recommendation per configured analysis
+    """
+    log_section("Running Solve Autotuner (Dry Run)")
+    from solving import solve_autotuner
+    return solve_autotuner.main()
+
+
+def get_global_setting(config_filename, key, default):
+    """Read a global_settings value from a config file, with a default."""
+    try:
+        from utilities.config_loader import load_yaml_config, get_config_path
+        config = load_yaml_config(get_config_path(config_filename))
+        return config.get('global_settings', {}).get(key, default)
+    except Exception:
+        return default
+
+
 def run_all():
     """Run all automation scripts in sequence."""
     log_section("ANSYS Tools - Running All Automation Scripts")
+    invalidate_named_selection_cache()
+
+    if get_global_setting('bolt_detection_config.yaml', 'run_with_all', False):
+        log("\n=== Step 0: Bolt Detection ===")
+        run_bolt_detection()
+
+    if get_global_setting('preflight_config.yaml', 'run_with_all', True):
+        log("\n=== Step 0: Pre-flight Validation ===")
+        report = run_validation()
+        if report['errors'] and get_global_setting('preflight_config.yaml', 'stop_on_errors', True):
+            log_section("Stopped: pre-flight validation found errors")
+            return
 
     log("\n=== Step 1: Contact Automation ===")
     run_contact_automation()
@@ -57,8 +159,35 @@ def run_all():
     log("\n=== Step 2: Bolt Pretension Automation ===")
     run_bolt_pretension_automation()
 
-    log("\n=== Step 3: Bolt Force Extraction ===")
-    run_bolt_force_extraction()
+    if get_global_setting('bolt_meshing_config.yaml', 'run_with_all', False):
+        log("\n=== Step 2a: Bolt Mesh Sizing ===")
+        run_bolt_meshing()
+
+    if get_global_setting('beam_bolts_config.yaml', 'run_with_all', False):
+        log("\n=== Step 2b: Beam Bolt Screening Mode ===")
+        run_beam_screening()
+
+    extracted = []
+    if get_global_setting('solving_config.yaml', 'run_with_all', False):
+        if get_global_setting('contact_precheck_config.yaml', 'run_with_all', True):
+            log("\n=== Step 2c: Contact Pre-check ===")
+            report = run_contact_precheck()
+            if report['errors'] and get_global_setting('contact_precheck_config.yaml', 'stop_on_errors', True):
+                log_section("Stopped: contact pre-check found errors")
+                return
+
+        log("\n=== Step 3: Solve ===")
+        report = run_solve()
+        extracted = report['extracted']
+        if report['errors'] and get_global_setting('solving_config.yaml', 'stop_on_errors', True):
+            log_section("Stopped: solving reported errors")
+            return
+
+    if extracted:
+        log("\nBolt forces already extracted after solving")
+    else:
+        log("\n=== Step 4: Bolt Force Extraction ===")
+        run_bolt_force_extraction()
 
     log("")
     log_section("All automation scripts completed!")
@@ -74,6 +203,13 @@ def print_menu():
     print("3. Run Bolt Force Extraction")
     print("4. Run All Automation Scripts")
     print("5. Exit")
+    print("6. Run Bolt Detection")
+    print("7. Run Pre-flight Validation")
+    print("8. Run Contact Pre-check")
+    print("9. Run Bolt Mesh Sizing")
+    print("10. Run Beam Bolt Screening Mode")
+    print("11. Run Solve Orchestrator")
+    print("12. Show Solve Resource Recommendations")
     print("\n" + "="*70)
 
 
@@ -83,7 +219,7 @@ def interactive_mode():
         print_menu()
 
         try:
-            choice = input("\nEnter your choice (1-5): ").strip()
+            choice = input("\nEnter your choice (1-12): ").strip()
 
             if choice == "1":
                 run_contact_automation()
@@ -96,8 +232,22 @@ def interactive_mode():
             elif choice == "5":
                 print("\nExiting...")
                 break
+            elif choice == "6":
+                run_bolt_detection()
+            elif choice == "7":
+                run_validation()
+            elif choice == "8":
+                run_contact_precheck()
+            elif choice == "9":
+                run_bolt_meshing()
+            elif choice == "10":
+                run_beam_screening()
+            elif choice == "11":
+                run_solve()
+            elif choice == "12":
+                run_solve_recommendation()
             else:
-                print("\nInvalid choice. Please enter 1-5.")
+                print("\nInvalid choice. Please enter 1-12.")
 
         except KeyboardInterrupt:
             print("\n\nExiting...")
@@ -123,6 +273,20 @@ def main():
                           help='Run bolt pretension automation')
         parser.add_argument('--extract-forces', action='store_true',
                           help='Run bolt force extraction')
+        parser.add_argument('--detect-bolts', action='store_true',
+                          help='Run bolt detection (creates bolt named selections)')
+        parser.add_argument('--validate', action='store_true',
+                          help='Run pre-flight validation of named selections')
+        parser.add_argument('--precheck', action='store_true',
+                          help='Run initial contact status pre-check')
+        parser.add_argument('--mesh-bolts', action='store_true',
+                          help='Run bolt region mesh sizing')
+        parser.add_argument('--screening', action='store_true',
+                          help='Run beam bolt screening mode (beams instead of solid bolts)')
+        parser.add_argument('--solve', action='store_true',
+                          help='Solve the configured analyses and extract results as they finish')
+        parser.add_argument('--recommend', action='store_true',
+                          help='Print recommended solver cores and mode from the solve history (dry run)')
         parser.add_argument('--all', action='store_true',
                           help='Run all automation scripts')
         parser.add_argument('--interactive', '-i', action='store_true',
@@ -138,6 +302,20 @@ def main():
             run_bolt_pretension_automation()
         elif args.extract_forces:
             run_bolt_force_extraction()
+        elif args.detect_bolts:
+            run_bolt_detection()
+        elif args.validate:
+            run_validation()
+        elif args.precheck:
+            run_contact_precheck()
+        elif args.mesh_bolts:
+            run_bolt_meshing()
+        elif args.screening:
+            run_beam_screening()
+        elif args.solve:
+            run_solve()
+        elif args.recommend:
+            run_solve_recommendation()
         elif args.all:
             run_all()
         else:
@@ -25,10 +25,15 @@ Configuration:
 Features:
     - Reactions measured in local coordinate system aligned with each bolt face
     - Supports single or multiple named selections
+    - Faces shared by several named selections are probed once
     - Smart object reuse (avoids duplicates on re-runs)
+    - Fingerprint-based reuse: only bolts whose inputs changed are rebuilt
+    - Stable bolt numbering independent of named-selection ordering
     - Proper body scoping for accurate force extraction
     - Comprehensive logging with timestamps
     - Three operational modes: run_only, cleanup_only, run_cleanup
+    - Beam source: reads the beam connections of the beam bolt screening
+      model (preprocessing/beam_bolts.py) into the same CSV table
 
 Author:
     Lasse Jacobsen (lbj@frecon.dk)
@@ -58,22 +63,32 @@ from utilities.config_loader import load_yaml_config, get_config_path
 from utilities.named_selection_helper import (
     get_named_selection,
     named_selection_to_list,
-    normalize_named_selection_list
+    normalize_named_selection_list,
+    resolve_named_selections,
+    invalidate_named_selection_cache
 )
 from utilities.geometry_helper import (
-    create_face_aligned_coordinate_system,
-    create_surface_from_coordinate_system,
-    get_body_from_face,
-    delete_coordinate_systems_by_pattern,
-    delete_surfaces_by_pattern
+    create_face_aligned_surfaces,
+    create_axis_coordinate_systems,
+    get_body_from_face
 )
 from utilities.probe_helper import (
+    index_probes,
     create_force_reaction_probe,
     create_moment_reaction_probe,
+    create_beam_reaction_probes,
     extract_probe_results,
     manage_probe_groups,
     delete_probes_by_pattern
 )
+from utilities.cleanup_helper import (
+    delete_generated_objects,
+    delete_bolt_objects,
+    build_cleanup_trie,
+    build_bolt_object_names
+)
+from utilities.bolt_identity import assign_bolt_indices, get_identity_state
+from utilities.state_helper import get_state_path, load_state, save_state, compute_fingerprint
 
 # ============================================================================
 # ANSYS IronPython Environment Globals
@@ -105,9 +120,14 @@ EMBEDDED_CONFIG = {
     'analysis_number': 0,
     'time_steps': 'first_last',  # Options: 'first_last', 'all', or list [1, 2, 5]
     'enable_logging': True,
-    'operation_mode': 'run_only'  # Options: 'run_only', 'cleanup_only', 'run_cleanup'
+    'operation_mode': 'run_only',  # Options: 'run_only', 'cleanup_only', 'run_cleanup'
+    'state_file': None,  # None = state/<model>/bolt_force_extraction_state.json
+    'source': 'faces',  # Options: 'faces' (solid bolts), 'beams' (beam bolt screening model)
+    'beam_state_file': None  # None = state/<model>/beam_bolts_state.json
 }
 
+STATE_FILENAME = 'bolt_force_extraction_state.json'
+
 
 # ============================================================================
 # Configuration Loading
@@ -223,6 +243,30 @@ def get_time_steps_to_process(analysis_settings, time_steps_config):
         raise ValueError("Invalid time_steps configuration: {}".format(time_steps_config))
 
 
+def get_output_requirements(config=None):
+    """
+    Get the solver output this extraction reads from the result file.
+
+    Force and moment reaction probes need reactions; probes on face
+    surfaces (source 'faces') also need nodal forces.
+
+    Args:
+        config: Optional configuration (default: load_config())
+
+    Returns:
+        dict: {'outputs': list of output quantities, 'time_steps': time steps configuration}
+    """
+    if config is None:
+        config = load_config()
+    outputs = ['reactions']
+    if config.get('source', EMBEDDED_CONFIG['source']) == 'faces':
+        outputs.append('nodal_forces')
+    return {
+        'outputs': outputs,
+        'time_steps': config.get('time_steps', EMBEDDED_CONFIG['time_steps'])
+    }
+
+
 def ensure_output_directory(filepath):
     """
     Ensure the output directory exists.
@@ -250,7 +294,8 @@ def write_csv_header(writer):
         writer: CSV writer object
     """
     writer.writerow(['Bolt Force Extraction Results - All values in project units'])
-    writer.writerow(['name', 'time', 'Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz', 'x_pos', 'y_pos', 'z_pos'])
+    writer.writerow(['name', 'time', 'Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz', 'x_pos', 'y_pos', 'z_pos',
+                     'named_selection'])
 
 
 # ============================================================================
@@ -290,103 +335,129 @@ def cleanup_named_selection(solution, ns_name):
     """
     log("Cleaning up objects for named selection: {}".format(ns_name))
     
-    # Delete probes
-    force_count, moment_count = delete_probes_for_named_selection(solution, ns_name)
-    if force_count > 0 or moment_count > 0:
-        log("  Deleted {} force probes and {} moment probes".format(force_count, moment_count))
-    
-    # Delete surfaces
-    surface_pattern = "Surface_{}_".format(ns_name)
-    surface_count = delete_surfaces_by_pattern(surface_pattern)
+    counts = delete_generated_objects(solution, [ns_name])
     
-    # Delete coordinate systems
-    cs_pattern = "CS_{}_".format(ns_name)
-    cs_count = delete_coordinate_systems_by_pattern(cs_pattern)
-    
-    # Refresh tree
-    ExtAPI.DataModel.Tree.Refresh()
-    
-    return force_count, moment_count, surface_count, cs_count
+    return counts['force'], counts['moment'], counts['surface'], counts['cs']
 
 
-def cleanup_all_named_selections(solution, ns_list):
+def cleanup_all_named_selections(solution, ns_list, registry=None):
     """
     Clean up all generated objects for all named selections.
     
+    Uses a single sweep over the solution, construction geometry and
+    coordinate systems for all named selections at once, with one
+    transaction and one tree refresh.
+    
     Args:
         solution: Analysis solution object
         ns_list: List of named selection names
+        registry: Optional fingerprint registry; entries of deleted objects are removed
     """
     log_section("Cleaning Up Generated Objects")
     
-    total_force = 0
-    total_moment = 0
-    total_surface = 0
-    total_cs = 0
+    counts = delete_generated_objects(solution, ns_list)
     
-    for ns_name in ns_list:
-        force_count, moment_count, surface_count, cs_count = cleanup_named_selection(solution, ns_name)
-        total_force += force_count
-        total_moment += moment_count
-        total_surface += surface_count
-        total_cs += cs_count
+    if registry is not None:
+        trie = build_cleanup_trie(ns_list)
+        for name in [name for name in registry if trie.match(name) is not None]:
+            del registry[name]
     
     log("")
     log("Cleanup Summary:")
-    log("  Total force probes deleted: {}".format(total_force))
-    log("  Total moment probes deleted: {}".format(total_moment))
-    log("  Total surfaces deleted: {}".format(total_surface))
-    log("  Total coordinate systems deleted: {}".format(total_cs))
+    log("  Total probe groups deleted: {}".format(counts['group']))
+    log("  Total force probes deleted: {}".format(counts['force']))
+    log("  Total moment probes deleted: {}".format(counts['moment']))
+    log("  Total surfaces deleted: {}".format(counts['surface']))
+    log("  Total coordinate systems deleted: {}".format(counts['cs']))
 
 
 # ============================================================================
 # Main Processing Functions
 # ============================================================================
 
-def process_named_selection(ns_name, solution, analysis):
+def process_named_selection(ns_name, solution, analysis, registry=None, identity=None,
+                            faces=None, probe_map=None):
     """
     Process a single named selection: create probes for all faces.
     
+    With a fingerprint registry, objects whose inputs (face ID, body ID,
+    summation settings) are unchanged since the last run are left untouched
+    and only changed objects are rebuilt.
+    
+    With an identity state, each face keeps a stable bolt index across runs
+    (matched by face ID, then by centroid), so object names and CSV rows do
+    not shift when faces are added to or removed from the named selection.
+    Objects of bolts that disappeared are deleted.
+    
+    With explicit faces (e.g. only the faces owned by this named selection
+    after batch resolution), the named selection is not looked up again.
+    
     Args:
         ns_name: Name of the named selection
         solution: Analysis solution object
         analysis: Analysis object
+        registry: Optional name -> fingerprint registry (updated in place)
+        identity: Optional bolt identity state for this named selection (updated in place)
+        faces: Optional faces to process instead of the named selection contents
+        probe_map: Optional face ID -> (force_probe, moment_probe) map (updated in place)
         
     Returns:
         Tuple of (force_probes, moment_probes) lists
     """
     log("Processing named selection: {}".format(ns_name))
     
-    # Find named selection using utility function
-    named_sel = get_named_selection(ns_name)
-    if named_sel is None:
-        log("  ERROR: Named selection '{}' not found!".format(ns_name))
-        return [], []
+    if faces is None:
+        # Find named selection using utility function
+        named_sel = get_named_selection(ns_name)
+        if named_sel is None:
+            log("  ERROR: Named selection '{}' not found!".format(ns_name))
+            return [], []
+        
+        # Convert to list of faces using utility function
+        faces = named_selection_to_list(named_sel)
+        log("  Found {} faces in named selection".format(len(faces)))
+        
+        if len(faces) == 0:
+            log("  WARNING: No faces found in named selection!")
+            return [], []
+    else:
+        log("  Processing {} face(s) owned by this named selection".format(len(faces)))
     
-    # Convert to list of faces using utility function
-    faces = named_selection_to_list(named_sel)
-    log("  Found {} faces in named selection".format(len(faces)))
+    force_probes = []
+    moment_probes = []
+    
+    # Resolve stable bolt indices (positional numbering without identity state)
+    if identity is not None:
+        bolt_indices, retired = assign_bolt_indices(faces, identity)
+        if retired:
+            delete_bolt_objects(solution, ns_name, retired)
+            if registry is not None:
+                for index in retired:
+                    for name in build_bolt_object_names(ns_name, index).values():
+                        registry.pop(name, None)
+    else:
+        bolt_indices = list(range(1, len(faces) + 1))
     
     if len(faces) == 0:
-        log("  WARNING: No faces found in named selection!")
+        log("  No faces to process (empty, or all shared with other named selections)")
         return [], []
     
-    force_probes = []
-    moment_probes = []
+    object_names = [build_bolt_object_names(ns_name, index) for index in bolt_indices]
+    
+    # Create all coordinate systems and surfaces in one batched transaction
+    cs_names = [names['cs'] for names in object_names]
+    surface_names = [names['surface'] for names in object_names]
+    coordinate_systems, surfaces = create_face_aligned_surfaces(faces, cs_names, surface_names, registry)
+    
+    # Index existing probes once instead of scanning the solution per probe
+    existing_force = index_probes(solution, DataModelObjectCategory.ForceReaction)
+    existing_moment = index_probes(solution, DataModelObjectCategory.MomentReaction)
     
     # Process each face
     with Transaction():
-        for i, face in enumerate(faces):
+        for i, (face, cs, surface) in enumerate(zip(faces, coordinate_systems, surfaces)):
             log("  Processing face {} of {}".format(i + 1, len(faces)))
             
-            # Create coordinate system aligned to face using utility function
-            cs_name = "CS_{}_{}".format(ns_name, i + 1)
-            cs = create_face_aligned_coordinate_system(face, cs_name)
-            
-            # Create surface from coordinate system using utility function
-            surface_name = "Surface_{}_{}".format(ns_name, i + 1)
-            surface = create_surface_from_coordinate_system(cs, surface_name)
-            
             # Get body that owns this face using utility function
             try:
                 body_selection, body_id, body_name = get_body_from_face(face.Id)
@@ -395,14 +466,22 @@ def process_named_selection(ns_name, solution, analysis):
                 continue
             
             # Create force probe using utility function
-            force_probe_name = "Force_{}_{}".format(ns_name, i + 1)
-            force_probe = create_force_reaction_probe(solution, surface, cs, body_selection, force_probe_name)
+            force_probe_name = object_names[i]['force']
+            force_fingerprint = compute_fingerprint('force', face.Id, body_id, cs_names[i], surface_names[i])
+            force_probe = create_force_reaction_probe(solution, surface, cs, body_selection, force_probe_name,
+                                                      force_fingerprint, registry, existing_force)
             force_probes.append(force_probe)
             
             # Create moment probe using utility function
-            moment_probe_name = "Moment_{}_{}".format(ns_name, i + 1)
-            moment_probe = create_moment_reaction_probe(solution, surface, cs, body_selection, moment_probe_name)
+            moment_probe_name = object_names[i]['moment']
+            moment_fingerprint = compute_fingerprint('moment', face.Id, body_id, cs_names[i], surface_names[i],
+                                                     'OrientationSystem')
+            moment_probe = create_moment_reaction_probe(solution, surface, cs, body_selection, moment_probe_name,
+                                                        moment_fingerprint, registry, existing_moment)
             moment_probes.append(moment_probe)
+            
+            if probe_map is not None:
+                probe_map[face.Id] = (force_probe, moment_probe)
     
     # Create groups for organization using utility function
     manage_probe_groups(solution, force_probes, moment_probes, ns_name)
@@ -415,11 +494,93 @@ def process_named_selection(ns_name, solution, analysis):
     return force_probes, moment_probes
 
 
+def process_beam_bolts(solution, beam_records, registry=None):
+    """
+    Create probes for all beam bolts of the screening model in one pass.
+    
+    Each beam gets a coordinate system at its head end with the Z-axis
+    along the bolt axis, and a force and a moment reaction probe scoped to
+    the beam, so the results have the same components as face probes.
+    
+    Args:
+        solution: Analysis solution object
+        beam_records: Beam name -> bolt record (state of preprocessing/beam_bolts.py)
+        registry: Optional name -> fingerprint registry (updated in place)
+        
+    Returns:
+        List of (ns_name, force_probe, moment_probe) tuples
+    """
+    from preprocessing.beam_bolts import index_beams
+    
+    log("Processing {} beam bolt(s)".format(len(beam_records)))
+    beams = index_beams()
+    records = [record for name, record in sorted(beam_records.items()) if name in beams]
+    missing = len(beam_records) - len(records)
+    if missing:
+        log("  WARNING: {} beam(s) recorded in the state file not found in the model".format(missing))
+    if not records:
+        return []
+    
+    existing_force = index_probes(solution, DataModelObjectCategory.ForceReaction)
+    existing_moment = index_probes(solution, DataModelObjectCategory.MomentReaction)
+    
+    rows = []
+    by_group = {}
+    with Transaction():
+        coordinate_systems = create_axis_coordinate_systems(
+            [record['cs'] for record in records],
+            [record['reference_point'] for record in records],
+            [record['axis'] for record in records], "mm", registry=registry)
+        
+        for record, cs in zip(records, coordinate_systems):
+            fingerprint = compute_fingerprint('beam_probe', record['beam'], record['cs'])
+            force_probe, moment_probe = create_beam_reaction_probes(
+                solution, beams[record['beam']][0], cs, record['force'], record['moment'],
+                fingerprint, registry, existing_force, existing_moment)
+            rows.append((record['named_selection'], force_probe, moment_probe))
+            group = by_group.setdefault("Beam_{}".format(record['named_selection']), ([], []))
+            group[0].append(force_probe)
+            group[1].append(moment_probe)
+    
+    for base_name, (force_probes, moment_probes) in by_group.items():
+        manage_probe_groups(solution, force_probes, moment_probes, base_name)
+    
+    ExtAPI.DataModel.Tree.Refresh()
+    log("  Created or reused {} beam probe pair(s)".format(len(rows)))
+    return rows
+
+
+def build_report_rows(resolved, probe_map):
+    """
+    List the probe pairs to report under every named selection.
+    
+    A face shared by several named selections has one probe pair, which
+    is reported once under each named selection that contains it.
+    
+    Args:
+        resolved: Result of resolve_named_selections
+        probe_map: Face ID -> (force_probe, moment_probe)
+        
+    Returns:
+        List of (ns_name, force_probe, moment_probe) tuples
+    """
+    rows = []
+    for ns_name, faces in resolved['entities'].items():
+        for face in faces:
+            if face.Id in probe_map:
+                force_probe, moment_probe = probe_map[face.Id]
+                rows.append((ns_name, force_probe, moment_probe))
+    return rows
+
+
 def evaluate_probes_and_export(solution, analysis, all_force_probes, all_moment_probes, 
-                               csv_filepath, time_steps_config):
+                               csv_filepath, time_steps_config, report_rows=None):
     """
     Evaluate probes across time steps and export to CSV.
     
+    Each probe is evaluated once per time step; rows are written for every
+    (named selection, probe pair) entry in report_rows.
+    
     Args:
         solution: Analysis solution object
         analysis: Analysis object
@@ -427,9 +588,15 @@ def evaluate_probes_and_export(solution, analysis, all_force_probes, all_moment_
         all_moment_probes: List of all moment probes
         csv_filepath: Path to CSV output file
         time_steps_config: Time steps configuration
+        report_rows: Optional list of (ns_name, force_probe, moment_probe) tuples
+                     (default: every probe pair once, without a named selection)
     """
     log_section("Evaluating Probes and Exporting Results")
     
+    if report_rows is None:
+        report_rows = [('', force_probe, moment_probe)
+                       for force_probe, moment_probe in zip(all_force_probes, all_moment_probes)]
+    
     # Get analysis settings
     analysis_settings = analysis.AnalysisSettings
     
@@ -459,34 +626,102 @@ def evaluate_probes_and_export(solution, analysis, all_force_probes, all_moment_
             solution.EvaluateAllResults()
             
             # Extract data from each probe pair using utility function
-            for force_probe, moment_probe in zip(all_force_probes, all_moment_probes):
-                results = extract_probe_results(force_probe, moment_probe)
+            results_cache = {}
+            for ns_name, force_probe, moment_probe in report_rows:
+                key = force_probe.ObjectId
+                if key not in results_cache:
+                    results_cache[key] = extract_probe_results(force_probe, moment_probe)
+                results = results_cache[key]
                 writer.writerow([
                     results['name'], step,
                     results['fx'], results['fy'], results['fz'],
                     results['mx'], results['my'], results['mz'],
-                    results['x_pos'], results['y_pos'], results['z_pos']
+                    results['x_pos'], results['y_pos'], results['z_pos'],
+                    ns_name
                 ])
     
     log("Results exported to: {}".format(csv_filepath))
 
 
-def main():
+def run_beam_extraction(config, solution, analysis, state, state_file, csv_outfile, time_steps,
+                        operation_mode):
+    """
+    Extract the bolt forces of the beam bolt screening model.
+    
+    Uses the beams recorded by preprocessing/beam_bolts.py and writes the
+    same CSV table as the face-based extraction.
+    
+    Args:
+        config: Configuration dictionary
+        solution: Analysis solution object
+        analysis: Analysis object
+        state: Extraction state (fingerprints are updated in place)
+        state_file: Path of the extraction state file
+        csv_outfile: Path to CSV output file
+        time_steps: Time steps configuration
+        operation_mode: 'run_only', 'cleanup_only' or 'run_cleanup'
+    """
+    from preprocessing.beam_bolts import STATE_FILENAME as BEAM_STATE_FILENAME
+    
+    registry = state.setdefault('fingerprints', {})
+    beam_state = load_state(config.get('beam_state_file') or get_state_path(BEAM_STATE_FILENAME))
+    beam_records = beam_state.get('beams', {})
+    group_names = sorted(set("Beam_{}".format(record['named_selection']) for record in beam_records.values()))
+    
+    if operation_mode == 'cleanup_only':
+        cleanup_all_named_selections(solution, group_names, registry)
+        save_state(state_file, state)
+        log_section("Cleanup Complete")
+        return
+    
+    if not beam_records:
+        log("ERROR: No beam bolts recorded! Run the beam bolt screening mode first.")
+        return
+    
+    report_rows = process_beam_bolts(solution, beam_records, registry)
+    save_state(state_file, state)
+    if not report_rows:
+        log("ERROR: No beam probes were created!")
+        return
+    
+    evaluate_probes_and_export(solution, analysis,
+                               [row[1] for row in report_rows], [row[2] for row in report_rows],
+                               csv_outfile, time_steps, report_rows)
+    
+    if operation_mode == 'run_cleanup':
+        log("")
+        cleanup_all_named_selections(solution, group_names, registry)
+        save_state(state_file, state)
+    
+    log_section("Bolt Force Extraction Complete")
+
+
+def main(analysis_number=None, csv_outfile=None):
     """
     Main execution function.
+    
+    Args:
+        analysis_number: Optional analysis index overriding the configuration
+                         (e.g. when called by the solve orchestrator)
+        csv_outfile: Optional CSV output path overriding the configuration
     """
+    invalidate_named_selection_cache()
     log_section("Bolt Force Extraction - Postprocessing")
     
     # Load configuration
     config = load_config()
     
     # Extract configuration values
-    csv_outfile = config.get('csv_outfile', EMBEDDED_CONFIG['csv_outfile'])
+    if csv_outfile is None:
+        csv_outfile = config.get('csv_outfile', EMBEDDED_CONFIG['csv_outfile'])
     named_selections = normalize_named_selection_list(config.get('named_selections', EMBEDDED_CONFIG['named_selections']))
-    analysis_number = config.get('analysis_number', EMBEDDED_CONFIG['analysis_number'])
+    if analysis_number is None:
+        analysis_number = config.get('analysis_number', EMBEDDED_CONFIG['analysis_number'])
     time_steps = config.get('time_steps', EMBEDDED_CONFIG['time_steps'])
     enable_logging = config.get('enable_logging', EMBEDDED_CONFIG['enable_logging'])
     operation_mode = config.get('operation_mode', EMBEDDED_CONFIG['operation_mode'])
+    state_file = config.get('state_file') or get_state_path(STATE_FILENAME)
+    source = config.get('source', EMBEDDED_CONFIG['source'])
     
     # Setup file logging
     log_filepath = setup_file_logging(csv_outfile, enable_logging)
@@ -498,9 +733,16 @@ def main():
     log("  Analysis Number: {}".format(analysis_number))
     log("  Time Steps: {}".format(time_steps))
     log("  Operation Mode: {}".format(operation_mode))
+    log("  Source: {}".format(source))
     log("  File Logging: {}".format('Enabled' if enable_logging else 'Disabled'))
+    log("  State File: {}".format(state_file))
     log("")
     
+    # Load fingerprints of objects generated by previous runs
+    state = load_state(state_file)
+    registry = state.setdefault('fingerprints', {})
+    identities = get_identity_state(state)
+    
     # Get analysis and solution objects
     try:
         analysis = Model.Analyses[analysis_number]
@@ -510,33 +752,58 @@ def main():
         log("ERROR: Could not access analysis at index {}".format(analysis_number))
         return
     
+    if source == 'beams':
+        run_beam_extraction(config, solution, analysis, state, state_file, csv_outfile, time_steps,
+                            operation_mode)
+        if log_filepath:
+            log("Log saved to: {}".format(log_filepath))
+        return
+    
     # Execute based on operation mode
     if operation_mode == 'cleanup_only':
-        cleanup_all_named_selections(solution, named_selections)
+        cleanup_all_named_selections(solution, named_selections, registry)
+        for ns_name in named_selections:
+            identities.pop(ns_name, None)
+        save_state(state_file, state)
         log_section("Cleanup Complete")
         return
     
-    # Run mode: Create probes and export
+    # Run mode: Resolve all named selections at once so that faces shared
+    # by several named selections get a single probe set (owned by the first)
+    resolved = resolve_named_selections(named_selections)
+    for ns_name in resolved['missing']:
+        log("ERROR: Named selection '{}' not found!".format(ns_name))
+    
     all_force_probes = []
     all_moment_probes = []
-    
-    for ns_name in named_selections:
-        force_probes, moment_probes = process_named_selection(ns_name, solution, analysis)
+    probe_map = {}
+    
+    for ns_name, faces in resolved['entities'].items():
+        owned = [face for face in faces if resolved['owner'][face.Id] == ns_name]
+        shared = len(faces) - len(owned)
+        if shared:
+            log("{}: {} face(s) already probed under another named selection".format(ns_name, shared))
+        force_probes, moment_probes = process_named_selection(ns_name, solution, analysis, registry,
+                                                              identities.setdefault(ns_name, {}),
+                                                              owned, probe_map)
         all_force_probes.extend(force_probes)
         all_moment_probes.extend(moment_probes)
     
+    save_state(state_file, state)
+    
     if len(all_force_probes) == 0:
         log("ERROR: No probes were created! Check named selections.")
         return
     
     # Evaluate probes and export to CSV
     evaluate_probes_and_export(solution, analysis, all_force_probes, all_moment_probes, 
-                               csv_outfile, time_steps)
+                               csv_outfile, time_steps, build_report_rows(resolved, probe_map))
     
     # Cleanup if requested
     if operation_mode == 'run_cleanup':
         log("")
-        cleanup_all_named_selections(solution, named_selections)
+        cleanup_all_named_selections(solution, named_selections, registry)
+        save_state(state_file, state)
     
     log_section("Bolt Force Extraction Complete")
     if log_filepath:
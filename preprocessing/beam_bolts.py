@@ -0,0 +1,682 @@
+"""
+ANSYS Workbench Mechanical - Beam Bolt Screening Mode
+======================================================
+
+For early design iterations, this script replaces the solid bolts of the
+bolt named selections (the same ones bolt_pretensions.py consumes) by beam
+connections, so screening solves run without solid bolt bodies and their
+frictional contacts:
+1. The shank face of each bolt gives its axis and diameter
+2. The hole rims of the clamped parts (circular edges of planar faces on
+   the bolt axis) are matched to every bolt in one vectorized pass; the
+   outermost rims become the beam's reference (head) and mobile (nut) ends
+3. One beam connection per bolt is created with the bolt radius, ends on
+   the bolt axis and a pinball region around each end
+4. A bolt pretension is applied to each beam with the same pretension and
+   tightening sequence as bolt_pretensions.py
+5. The solid bolt bodies and their solid pretensions are suppressed
+
+Setting mode to 'solid' restores the solid bolts and suppresses the beams,
+so both model variants stay in one project. Everything is built in one
+transaction and reconciled by name and fingerprint on re-runs
+(state/<model>/beam_bolts_state.json). bolt_force_extraction.py reads the beam
+forces for all bolts at once with source: beams and writes the same CSV.
+
+Configuration is loaded from config/beam_bolts_config.yaml
+
+Usage:
+    Run this script from within ANSYS Workbench Mechanical using the scripting console
+    or as an external script file, or run main.py --screening.
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: ExtAPI, Model, LoadBehavior, etc. are provided by ANSYS Mechanical runtime environment
+
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log, log_section, set_logging
+from utilities.config_loader import load_yaml_config, get_config_path
+from utilities.named_selection_helper import (get_named_selection, named_selection_to_list, refresh_tree,
+                                              invalidate_named_selection_cache)
+from utilities.state_helper import (get_state_path, load_state, save_state, compute_fingerprint,
+                                   reconcile_objects)
+from utilities.bolt_identity import assign_bolt_indices, get_identity_state
+from utilities.face_table import iter_geo_bodies, shank_axes, build_circle_table
+from utilities.tree_group_helper import sync_tree_group
+from preprocessing.bolt_pretensions import (schedule_pretension, ensure_step_count, load_fingerprint,
+                                            configure_bolt_pretension, index_bolt_pretensions)
+
+
+EMBEDDED_CONFIG = {
+    'global_settings': {
+        'log_details': True,
+        'run_with_all': False,
+        'mode': 'beam',
+        'length_scale': 1000.0,
+        'analyses': [0],
+        'suppress_solid_bolts': True,
+        'state_file': None
+    },
+    'named_selections': None,
+    'bearing': {
+        'radial_tolerance': 0.5,
+        'hole_factor': 1.3,
+        'angle_tolerance': 5.0,
+        'axial_reach': 50.0
+    },
+    'beam': {
+        'material': None,
+        'pinball_factor': 1.0,
+        'behavior': 'deformable'
+    }
+}
+
+STATE_FILENAME = 'beam_bolts_state.json'
+MODE_BEAM = 'beam'
+MODE_SOLID = 'solid'
+
+
+def beam_object_names(ns_name, index):
+    """
+    Build the names of all objects generated for one beam bolt.
+
+    Args:
+        ns_name (str): Bolt named selection name
+        index (int): Bolt index
+
+    Returns:
+        dict: Object kind -> name
+    """
+    return {
+        'beam': f"Beam_{ns_name}_{index}",
+        'pretension': f"BeamBolt_{ns_name}_{index}",
+        'cs': f"CS_Beam_{ns_name}_{index}",
+        'force': f"Force_Beam_{ns_name}_{index}",
+        'moment': f"Moment_Beam_{ns_name}_{index}",
+    }
+
+
+# ============================================================================
+# Geometry Matching
+# ============================================================================
+
+def find_bearing_faces(axes, circles, radial_tolerance, hole_factor=1.3, angle_tolerance=5.0, axial_reach=0.0):
+    """
+    Match the hole rims of the clamped parts to every bolt axis at once.
+
+    A rim belongs to a bolt if its face is normal to the bolt axis, its
+    centre lies on the axis (within radial_tolerance) between the shank ends
+    (extended by axial_reach), and its radius is between the bolt radius and
+    hole_factor times the bolt radius. The outermost rims along the axis are
+    the head (reference) and nut (mobile) ends.
+
+    Args:
+        axes (dict): Shank axes from shank_axes (start, end, radius)
+        circles (dict): Circle table from build_circle_table (clamped parts only)
+        radial_tolerance (float): Max distance of a rim centre from the axis
+        hole_factor (float): Max rim radius / bolt radius
+        angle_tolerance (float): Max angle between face normal and bolt axis (degrees)
+        axial_reach (float): Search distance beyond the shank ends
+
+    Returns:
+        dict: Aligned arrays (length N = number of bolts):
+            - reference_face, mobile_face (N,) int: Face IDs (-1 if not found)
+            - reference_point, mobile_point (N, 3) float: Beam end points on the axis
+            - axis (N, 3) float: Unit bolt axis from head to nut
+    """
+    start = axes['start']
+    direction = axes['end'] - start
+    length = np.linalg.norm(direction, axis=1)
+    unit = direction / np.where(length > 0, length, 1.0)[:, None]
+    count = len(start)
+
+    result = {
+        'reference_face': np.full(count, -1, dtype=int),
+        'mobile_face': np.full(count, -1, dtype=int),
+        'reference_point': np.full((count, 3), np.nan),
+        'mobile_point': np.full((count, 3), np.nan),
+        'axis': unit,
+    }
+    if count == 0 or len(circles['face_id']) == 0:
+        return result
+
+    # (N bolts, M rims) relative positions along and across each axis
+    offset = circles['center'][None, :, :] - start[:, None, :]
+    axial = np.einsum('nmk,nk->nm', offset, unit)
+    radial = np.linalg.norm(offset - axial[:, :, None] * unit[:, None, :], axis=2)
+    alignment = np.abs(np.einsum('mk,nk->nm', circles['normal'], unit))
+    bolt_radius = axes['radius'][:, None]
+
+    match = ((radial <= radial_tolerance)
+             & (alignment >= np.cos(np.radians(angle_tolerance)))
+             & (circles['radius'][None, :] >= bolt_radius * 0.98)
+             & (circles['radius'][None, :] <= bolt_radius * hole_factor)
+             & (axial >= -axial_reach)
+             & (axial <= length[:, None] + axial_reach)
+             & np.isfinite(length)[:, None])
+
+    found = match.any(axis=1)
+    low = np.where(match, axial, np.inf).argmin(axis=1)
+    high = np.where(match, axial, -np.inf).argmax(axis=1)
+    rows = np.arange(count)
+    distinct = found & (circles['face_id'][low] != circles['face_id'][high])
+
+    result['reference_face'][distinct] = circles['face_id'][low[distinct]]
+    result['mobile_face'][distinct] = circles['face_id'][high[distinct]]
+    result['reference_point'][distinct] = (start + axial[rows, low][:, None] * unit)[distinct]
+    result['mobile_point'][distinct] = (start + axial[rows, high][:, None] * unit)[distinct]
+    return result
+
+
+# ============================================================================
+# Planning
+# ============================================================================
+
+def resolve_bolt_faces(ns_names):
+    """
+    Resolve the shank faces and bolt bodies of the bolt named selections.
+
+    Args:
+        ns_names (list): Bolt named selection names
+
+    Returns:
+        tuple: (faces per named selection name, set of bolt body IDs)
+    """
+    faces_by_ns = {}
+    bolt_body_ids = set()
+    for ns_name in ns_names:
+        named_selection = get_named_selection(ns_name)
+        if named_selection is None:
+            continue
+        faces = named_selection_to_list(named_selection)
+        if not faces:
+            log(f"No faces found in named selection '{ns_name}'", "WARNING")
+            continue
+        faces_by_ns[ns_name] = faces
+        for face in faces:
+            try:
+                bolt_body_ids.add(int(face.Bodies[0].Id))
+            except Exception:
+                log(f"  Face {face.Id} has no owning body", "WARNING")
+    return faces_by_ns, bolt_body_ids
+
+
+def plan_beam_bolts(ns_name, faces, pretension_force, circles, config, identity=None, sequence=None):
+    """
+    Plan the beam connections and pretensions of one bolt named selection.
+
+    Args:
+        ns_name (str): Bolt named selection name
+        faces (list): Shank faces, one per bolt
+        pretension_force (float): Pretension force in Newtons
+        circles (dict): Circle table of the clamped parts
+        config (dict): Configuration dictionary
+        identity (dict): Optional bolt identity state (updated in place)
+        sequence (dict): Optional tightening sequence
+
+    Returns:
+        dict: Plan with keys named_selection, group_name, bolts (one dict per
+              matched bolt) and the loading of schedule_pretension, or None
+    """
+    length_scale = config.get('global_settings', {}).get('length_scale', 1000.0)
+    bearing = config.get('bearing', {})
+    beam = config.get('beam', {})
+
+    if identity is not None:
+        bolt_indices, _ = assign_bolt_indices(faces, identity)
+    else:
+        bolt_indices = list(range(1, len(faces) + 1))
+
+    axes = shank_axes(faces)
+    ends = find_bearing_faces(axes, circles,
+                              bearing.get('radial_tolerance', 0.5) / length_scale,
+                              bearing.get('hole_factor', 1.3),
+                              bearing.get('angle_tolerance', 5.0),
+                              bearing.get('axial_reach', 50.0) / length_scale)
+
+    bolts = []
+    for row in np.argsort(bolt_indices, kind='stable'):
+        index = bolt_indices[row]
+        if ends['reference_face'][row] < 0:
+            log(f"  Bolt {index} of '{ns_name}' (face {faces[row].Id}): no clamped hole rims found on its axis",
+                "WARNING")
+            continue
+        radius = float(axes['radius'][row]) * length_scale
+        record = beam_object_names(ns_name, index)
+        record.update({
+            'index': int(index),
+            'named_selection': ns_name,
+            'reference_face': int(ends['reference_face'][row]),
+            'mobile_face': int(ends['mobile_face'][row]),
+            'reference_point': [round(float(v) * length_scale, 6) for v in ends['reference_point'][row]],
+            'mobile_point': [round(float(v) * length_scale, 6) for v in ends['mobile_point'][row]],
+            'axis': [round(float(v), 9) for v in ends['axis'][row]],
+            'radius': round(radius, 6),
+            'pinball': round(2.0 * radius * beam.get('pinball_factor', 1.0), 6),
+        })
+        bolts.append(record)
+
+    if not bolts:
+        return None
+
+    try:
+        loading = schedule_pretension(pretension_force, len(bolts), sequence,
+                                      np.array([bolt['reference_point'] for bolt in bolts]))
+    except (KeyError, TypeError, ValueError) as e:
+        log(f"Invalid tightening sequence for '{ns_name}': {str(e)}", "ERROR")
+        return None
+
+    log(f"  {ns_name}: {len(bolts)} of {len(faces)} bolt(s) converted to beams")
+    plan = {'named_selection': ns_name, 'group_name': f"BeamBoltGroup_{ns_name}", 'bolts': bolts}
+    plan.update(loading)
+    return plan
+
+
+def beam_fingerprint(bolt, beam_config):
+    """Fingerprint the scoping, end points and section of a planned beam."""
+    return compute_fingerprint('beam', bolt['reference_face'], bolt['mobile_face'], bolt['reference_point'],
+                               bolt['mobile_point'], bolt['radius'], bolt['pinball'],
+                               beam_config.get('material'), beam_config.get('behavior', 'deformable'))
+
+
+# ============================================================================
+# Beam Connections
+# ============================================================================
+
+def _selection(entity_ids):
+    selection = ExtAPI.SelectionManager.CreateSelectionInfo(SelectionTypeEnum.GeometryEntities)
+    selection.Ids = list(entity_ids)
+    return selection
+
+
+def index_beams():
+    """
+    Index the beam connections by name in one tree walk.
+
+    Returns:
+        dict: Mapping of beam name -> list of beam connections
+    """
+    index = {}
+    for beam in Model.Connections.GetChildren(DataModelObjectCategory.Beam, True):
+        index.setdefault(beam.Name, []).append(beam)
+    return index
+
+
+def apply_beam(beam, bolt, beam_config):
+    """
+    Apply scoping, end points, radius and pinball of a planned beam.
+
+    Args:
+        beam: Beam connection object
+        bolt (dict): Bolt record from plan_beam_bolts
+        beam_config (dict): 'beam' section of the configuration
+    """
+    behavior = LoadBehavior.Rigid if beam_config.get('behavior') == 'rigid' else LoadBehavior.Deformable
+    beam.ReferenceScoping = _selection([bolt['reference_face']])
+    beam.MobileScoping = _selection([bolt['mobile_face']])
+    beam.ReferenceBehavior = behavior
+    beam.MobileBehavior = behavior
+    beam.ReferenceXCoordinate = Quantity(bolt['reference_point'][0], "mm")
+    beam.ReferenceYCoordinate = Quantity(bolt['reference_point'][1], "mm")
+    beam.ReferenceZCoordinate = Quantity(bolt['reference_point'][2], "mm")
+    beam.MobileXCoordinate = Quantity(bolt['mobile_point'][0], "mm")
+    beam.MobileYCoordinate = Quantity(bolt['mobile_point'][1], "mm")
+    beam.MobileZCoordinate = Quantity(bolt['mobile_point'][2], "mm")
+    beam.ReferencePinballRadius = Quantity(bolt['pinball'], "mm")
+    beam.MobilePinballRadius = Quantity(bolt['pinball'], "mm")
+    beam.Radius = Quantity(bolt['radius'], "mm")
+    if beam_config.get('material'):
+        beam.Material = beam_config['material']
+
+
+def reconcile_beams(plans, beam_config, registry=None, unsettled=()):
+    """
+    Reconcile the beam connections with the planned bolts.
+
+    Beams are matched by name: matching fingerprints are kept, changed
+    beams are updated in place, missing ones are created, duplicates are
+    deleted, and beams recorded in the registry that are no longer planned
+    are deleted, except those of named selections that could not be
+    planned this run. Call inside a Transaction.
+
+    Args:
+        plans (list): Plans from plan_beam_bolts
+        beam_config (dict): 'beam' section of the configuration
+        registry (dict): Optional name -> fingerprint registry (updated in place)
+        unsettled (iterable): Bolt named selections that could not be planned
+
+    Returns:
+        tuple: (counts dict, name -> beam connection of all planned beams)
+    """
+    def create(bolt):
+        beam = Model.Connections.AddBeam()
+        beam.Name = bolt['name']
+        apply_beam(beam, bolt, beam_config)
+        return beam
+
+    def update(beam, bolt, recorded):
+        apply_beam(beam, bolt, beam_config)
+        return True
+
+    items = [dict(bolt, name=bolt['beam'], owner=bolt['named_selection'],
+                  fingerprint=beam_fingerprint(bolt, beam_config))
+             for plan in plans for bolt in plan['bolts']]
+    counts, beams = reconcile_objects(items, index_beams(), registry if registry is not None else {},
+                                      create, update, unsettled, label='beam')
+    return counts, beams
+
+
+def reconcile_beam_pretensions(analysis, plans, beams, registry=None, unsettled=()):
+    """
+    Reconcile the bolt pretensions on the beams of one analysis.
+
+    Same rules as bolt_pretensions.reconcile_bolt_pretensions, with each
+    pretension scoped to its beam connection. Pretensions whose beam is
+    not available count as failed and are kept. Call inside a Transaction.
+
+    Args:
+        analysis: Analysis object
+        plans (list): Plans from plan_beam_bolts
+        beams (dict): Beam name -> beam connection (from reconcile_beams)
+        registry (dict): Optional name -> [scope, load] fingerprint registry (updated in place)
+        unsettled (iterable): Bolt named selections that could not be planned
+
+    Returns:
+        dict: Counts of 'created', 'updated', 'unchanged', 'deleted' and 'failed' pretensions
+    """
+    registry = registry if registry is not None else {}
+    num_steps = ensure_step_count(analysis, plans)
+
+    def configure(bolt, item):
+        if item['beam'] is None:
+            raise ValueError(f"beam '{item['beam_name']}' is not available")
+        bolt.Location = item['beam']
+        configure_bolt_pretension(bolt, None, item['plan'], item['column'], num_steps, update_scoping=False)
+
+    def create(item):
+        if item['beam'] is None:
+            raise ValueError(f"beam '{item['beam_name']}' is not available")
+        bolt = analysis.AddBoltPretension()
+        bolt.Name = item['name']
+        configure(bolt, item)
+        return bolt
+
+    def update(bolt, item, recorded):
+        configure(bolt, item)
+        return True
+
+    items = []
+    for plan in plans:
+        for column, bolt_record in enumerate(plan['bolts']):
+            items.append({
+                'name': bolt_record['pretension'], 'owner': plan['named_selection'],
+                'beam': beams.get(bolt_record['beam']), 'beam_name': bolt_record['beam'], 'plan': plan, 'column': column,
+                'fingerprint': [compute_fingerprint('beam_scope', bolt_record['beam']),
+                                load_fingerprint(plan, column, num_steps)],
+            })
+
+    counts, bolts = reconcile_objects(items, index_bolt_pretensions(analysis), registry, create, update,
+                                      unsettled, label='beam pretension')
+    for plan in plans:
+        sync_tree_group(analysis, [bolts[bolt['pretension']] for bolt in plan['bolts']
+                                   if bolt['pretension'] in bolts], plan['group_name'])
+
+    return counts
+
+
+# ============================================================================
+# Mode Switching
+# ============================================================================
+
+def set_bodies_suppressed(body_ids, suppressed):
+    """
+    Suppress or unsuppress tree bodies by geometry body ID (one tree walk).
+
+    Args:
+        body_ids (set): Geometry body IDs
+        suppressed (bool): Target suppression state
+
+    Returns:
+        int: Number of bodies whose state changed
+    """
+    changed = 0
+    for body in Model.Geometry.GetChildren(DataModelObjectCategory.Body, True):
+        try:
+            if body.GetGeoBody().Id in body_ids and body.Suppressed != suppressed:
+                body.Suppressed = suppressed
+                changed += 1
+        except Exception as e:
+            log(f"Could not change suppression of body '{body.Name}': {str(e)}", "WARNING")
+    return changed
+
+
+def set_objects_suppressed(objects, suppressed):
+    """Suppress or unsuppress tree objects; returns the number changed."""
+    changed = 0
+    for obj in objects:
+        if obj.Suppressed != suppressed:
+            obj.Suppressed = suppressed
+            changed += 1
+    return changed
+
+
+def solid_pretensions(analysis, ns_names):
+    """Get the solid bolt pretensions (Bolt_<NS>_<index>) of the bolt named selections."""
+    prefixes = tuple(f"Bolt_{ns_name}_" for ns_name in ns_names)
+    return [bolt for name, bolts in index_bolt_pretensions(analysis).items()
+            if name.startswith(prefixes) for bolt in bolts]
+
+
+# ============================================================================
+# Main Processing
+# ============================================================================
+
+def get_bolt_configs(config):
+    """
+    Get the bolt named selections with their pretension and tightening sequence.
+
+    Args:
+        config (dict): Configuration dictionary
+
+    Returns:
+        dict: Named selection name -> (pretension force, tightening sequence or None),
+              taken from bolt_pretension_config.yaml (restricted to named_selections if set)
+    """
+    from preprocessing.bolt_pretensions import load_config as load_pretension_config
+    pretension_config = load_pretension_config()
+    default_sequence = pretension_config.get('tightening_sequence') or {}
+
+    selected = config.get('named_selections')
+    if isinstance(selected, str):
+        selected = [selected]
+
+    bolt_configs = {}
+    for ns_name, ns_config in (pretension_config.get('bolt_pretensions') or {}).items():
+        if selected and ns_name not in selected:
+            continue
+        pretension_force = (ns_config or {}).get('pretension')
+        if pretension_force is None:
+            log(f"No pretension force defined for '{ns_name}'. Skipping.", "WARNING")
+            continue
+        sequence = (ns_config or {}).get('tightening_sequence') or default_sequence
+        bolt_configs[ns_name] = (pretension_force, sequence if sequence.get('enabled', True) else None)
+    return bolt_configs
+
+
+def _resolve_analyses(analysis_numbers):
+    if isinstance(analysis_numbers, int):
+        analysis_numbers = [analysis_numbers]
+    analyses = []
+    for number in analysis_numbers:
+        try:
+            analyses.append((number, Model.Analyses[number]))
+        except Exception:
+            log(f"Could not access analysis at index {number}", "ERROR")
+    return analyses
+
+
+def restore_solid_bolts(state, analyses, ns_names):
+    """
+    Switch back to solid bolts: unsuppress them, suppress the generated beams.
+
+    Args:
+        state (dict): Beam bolt state
+        analyses (list): (number, analysis) pairs
+        ns_names (list): Bolt named selection names
+
+    Returns:
+        dict: Counts of changed 'bodies', 'beams' and 'pretensions'
+    """
+    counts = {'bodies': 0, 'beams': 0, 'pretensions': 0}
+    registries = state.get('fingerprints', {})
+    with Transaction():
+        counts['bodies'] = set_bodies_suppressed(set(state.get('solid_bodies', [])), False)
+        existing = index_beams()
+        counts['beams'] = set_objects_suppressed(
+            [beam for name in registries.get('beams', {}) for beam in existing.get(name, [])], True)
+        for number, analysis in analyses:
+            registry = registries.get(f"analysis_{number}", {})
+            pretensions = index_bolt_pretensions(analysis)
+            counts['pretensions'] += set_objects_suppressed(
+                [bolt for name in registry for bolt in pretensions.get(name, [])], True)
+            counts['pretensions'] += set_objects_suppressed(solid_pretensions(analysis, ns_names), False)
+    return counts
+
+
+def load_config():
+    """
+    Load configuration from YAML file, with fallback to embedded config.
+
+    Returns:
+        dict: Configuration dictionary
+    """
+    try:
+        config_path = get_config_path('beam_bolts_config.yaml')
+        config = load_yaml_config(config_path)
+        log(f"Loaded configuration from: {config_path}")
+        return config
+    except (ImportError, FileNotFoundError) as e:
+        log(f"Could not load YAML config: {str(e)}", "WARNING")
+        log("Using embedded configuration")
+        return EMBEDDED_CONFIG
+
+
+def run_from_config(config):
+    """
+    Build (or switch off) the beam bolt screening model.
+
+    Args:
+        config (dict): Configuration dictionary
+
+    Returns:
+        dict: Report with 'mode', 'beams' counts and 'pretensions' counts per analysis
+    """
+    global_settings = config.get('global_settings', {})
+    set_logging(global_settings.get('log_details', True))
+    mode = global_settings.get('mode', MODE_BEAM)
+    state_file = global_settings.get('state_file') or get_state_path(STATE_FILENAME)
+
+    invalidate_named_selection_cache()
+    log_section("ANSYS Mechanical - Beam Bolt Screening Mode")
+
+    bolt_configs = get_bolt_configs(config)
+    if not bolt_configs:
+        log("No bolt named selections with a pretension configured.", "WARNING")
+        return {}
+
+    analyses = _resolve_analyses(global_settings.get('analyses', [0]))
+    if not analyses:
+        return {}
+
+    state = load_state(state_file)
+
+    if mode == MODE_SOLID:
+        counts = restore_solid_bolts(state, analyses, list(bolt_configs))
+        save_state(state_file, state)
+        refresh_tree()
+        log(f"Solid bolts restored: {counts['bodies']} body(ies) unsuppressed, "
+            f"{counts['beams']} beam(s) and {counts['pretensions']} pretension(s) switched")
+        log_section("Beam bolt screening mode off")
+        return {'mode': mode, 'restored': counts}
+
+    registries = state.setdefault('fingerprints', {})
+    identities = get_identity_state(state)
+
+    # Hoisted geometry: bolt faces and bodies, then every hole rim of the clamped parts once
+    faces_by_ns, bolt_body_ids = resolve_bolt_faces(list(bolt_configs))
+    clamped_bodies = [body for body in iter_geo_bodies() if body.Id not in bolt_body_ids]
+    circles = build_circle_table(clamped_bodies)
+
+    plans = []
+    unsettled = [ns_name for ns_name in bolt_configs if ns_name not in faces_by_ns]
+    for ns_name, faces in faces_by_ns.items():
+        pretension_force, sequence = bolt_configs[ns_name]
+        plan = plan_beam_bolts(ns_name, faces, pretension_force, circles, config,
+                               identities.setdefault(ns_name, {}), sequence)
+        if plan is not None:
+            plans.append(plan)
+        else:
+            unsettled.append(ns_name)
+    if not plans:
+        log("No bolts could be converted to beams.", "WARNING")
+        return {}
+
+    beam_config = config.get('beam', {})
+    report = {'mode': mode, 'pretensions': {}}
+    with Transaction():
+        report['beams'], beams = reconcile_beams(plans, beam_config, registries.setdefault('beams', {}),
+                                                  unsettled)
+        set_objects_suppressed(beams.values(), False)
+        for number, analysis in analyses:
+            log(f"\n--- Beam pretensions in '{analysis.Name}' ---")
+            registry = registries.setdefault(f"analysis_{number}", {})
+            report['pretensions'][analysis.Name] = reconcile_beam_pretensions(analysis, plans, beams, registry,
+                                                                                unsettled)
+            pretensions = index_bolt_pretensions(analysis)
+            set_objects_suppressed([bolt for name in registry for bolt in pretensions.get(name, [])], False)
+            if global_settings.get('suppress_solid_bolts', True):
+                set_objects_suppressed(solid_pretensions(analysis, list(faces_by_ns)), True)
+        if global_settings.get('suppress_solid_bolts', True):
+            suppressed = set_bodies_suppressed(bolt_body_ids, True)
+            log(f"Suppressed {suppressed} solid bolt body(ies)")
+
+    # Beam records for bolt_force_extraction.py (source: beams)
+    state['solid_bodies'] = sorted(bolt_body_ids)
+    kept = {name: bolt for name, bolt in state.get('beams', {}).items()
+            if bolt.get('named_selection') in unsettled and name in registries['beams']}
+    kept.update((bolt['beam'], bolt) for plan in plans for bolt in plan['bolts'] if bolt['beam'] in beams)
+    state['beams'] = kept
+    save_state(state_file, state)
+    refresh_tree()
+
+    counts = report['beams']
+    log("")
+    log(f"Beams: {counts['created']} created, {counts['updated']} updated, "
+        f"{counts['unchanged']} unchanged, {counts['deleted']} deleted")
+    for analysis_name, counts in report['pretensions'].items():
+        log(f"{analysis_name}: {counts['created']} created, {counts['updated']} updated, "
+            f"{counts['unchanged']} unchanged, {counts['deleted']} deleted beam pretension(s)")
+    log_section("Beam bolt screening model ready!")
+    return report
+
+
+def main():
+    """
+    Main function to build or switch off the beam bolt screening model.
+
+    Returns:
+        dict: Screening report
+    """
+    return run_from_config(load_config())
+
+
+# Run the script
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+ANSYS Workbench Mechanical - Automated Bolt Detection
+======================================================
+
+This script classifies bolt faces by size and creates the named selections
+consumed by the other automation scripts:
+- M<size>_Bolts: cylindrical shank faces (bolt pretensions)
+- M<size>_export: planar annular bearing faces (bolt force extraction)
+
+All faces are read in a single geometry pass into NumPy arrays, classified
+with vectorized filters, clustered into bolts along their common axis with
+a spatial index, and the named selections are created in one transaction.
+
+Configuration is loaded from config/bolt_detection_config.yaml
+
+Usage:
+    Run this script from within ANSYS Workbench Mechanical using the scripting console
+    or as an external script file.
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: ExtAPI, Model, Transaction, etc. are provided by ANSYS Mechanical runtime environment
+
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log, log_section, set_logging
+from utilities.named_selection_helper import (create_or_update_named_selections, refresh_tree,
+                                              invalidate_named_selection_cache)
+from utilities.face_table import build_face_table, subset_face_table, SURFACE_PLANE, SURFACE_CYLINDER
+from utilities.spatial_index import cluster_coaxial_faces
+
+
+EMBEDDED_CONFIG = {
+    'global_settings': {
+        'log_details': True,
+        'run_with_all': False,
+        'length_scale': 1000.0
+    },
+    'bolt_sizes': [6, 8, 10, 12, 16, 20, 24, 30, 36, 42, 48, 56, 64],
+    'shank_faces': {
+        'enabled': True,
+        'diameter_tolerance': 0.03,
+        'name': 'M{size}_Bolts'
+    },
+    'bearing_faces': {
+        'enabled': True,
+        'inner_diameter_range': [0.98, 1.20],
+        'min_outer_ratio': 1.3,
+        'name': 'M{size}_export'
+    },
+    'clustering': {
+        'enabled': True,
+        'radial_tolerance': 0.1,
+        'axial_reach': 200.0,
+        'angle_tolerance': 2.0
+    }
+}
+
+
+# ============================================================================
+# Vectorized Classification
+# ============================================================================
+
+def classify_shank_faces(table, sizes, tolerance, length_scale=1.0):
+    """
+    Match cylindrical faces to nominal bolt sizes by diameter.
+
+    Args:
+        table (dict): Face table from build_face_table
+        sizes (list): Nominal bolt diameters in mm
+        tolerance (float): Relative diameter tolerance
+        length_scale (float): Factor converting geometry lengths to mm
+
+    Returns:
+        np.ndarray: Matched nominal size per face (0 where not a shank face)
+    """
+    sizes = np.asarray(sizes, dtype=float)
+    diameters = 2.0 * table['radius'] * length_scale
+    is_cylinder = table['surface_type'] == SURFACE_CYLINDER
+
+    relative_error = np.abs(diameters[:, None] - sizes[None, :]) / sizes[None, :]
+    relative_error = np.where(np.isnan(relative_error), np.inf, relative_error)
+    best = np.argmin(relative_error, axis=1)
+    best_error = relative_error[np.arange(len(best)), best]
+
+    matched = is_cylinder & (best_error <= tolerance)
+    return np.where(matched, sizes[best], 0.0)
+
+
+def classify_bearing_faces(table, sizes, inner_range, min_outer_ratio, length_scale=1.0):
+    """
+    Match planar annular faces to nominal bolt sizes by their inner diameter.
+
+    Args:
+        table (dict): Face table from build_face_table
+        sizes (list): Nominal bolt diameters in mm
+        inner_range (list): [min, max] inner diameter / nominal diameter
+        min_outer_ratio (float): Minimum outer / inner diameter ratio
+        length_scale (float): Factor converting geometry lengths to mm
+
+    Returns:
+        np.ndarray: Matched nominal size per face (0 where not a bearing face)
+    """
+    sizes = np.asarray(sizes, dtype=float)
+    inner = 2.0 * table['radius'] * length_scale
+    outer = 2.0 * table['outer_radius'] * length_scale
+    low, high = float(inner_range[0]), float(inner_range[1])
+
+    is_annulus = ((table['surface_type'] == SURFACE_PLANE)
+                  & (table['circle_count'] >= 2)
+                  & (outer >= min_outer_ratio * inner))
+
+    ratio = inner[:, None] / sizes[None, :]
+    in_range = (ratio >= low) & (ratio <= high)
+    score = np.where(in_range, np.abs(ratio - 0.5 * (low + high)), np.inf)
+    best = np.argmin(score, axis=1)
+    matched = is_annulus & np.isfinite(score[np.arange(len(best)), best])
+    return np.where(matched, sizes[best], 0.0)
+
+
+def group_faces_by_size(face_ids, matched_sizes, name_template):
+    """
+    Group face IDs into named selections by matched size.
+
+    Args:
+        face_ids (np.ndarray): Face IDs
+        matched_sizes (np.ndarray): Matched nominal size per face (0 = none)
+        name_template (str): Name template containing '{size}'
+
+    Returns:
+        dict: Mapping of named selection name -> list of face IDs
+    """
+    selections = {}
+    for size in np.unique(matched_sizes[matched_sizes > 0]):
+        name = name_template.format(size=int(size) if float(size).is_integer() else size)
+        selections[name] = face_ids[matched_sizes == size].tolist()
+    return selections
+
+
+# ============================================================================
+# Bolt Clustering
+# ============================================================================
+
+def cluster_bolt_faces(table, shank_sizes, bearing_sizes, clustering_config, length_scale=1.0):
+    """
+    Cluster classified faces into bolts and pick one face of each kind per bolt.
+
+    Shank and bearing faces that share a common axis belong to the same bolt.
+    Each bolt contributes its largest shank face and its largest bearing face,
+    so split shanks or head-plus-nut faces never produce duplicate bolts.
+    The bolt size is the size matched by the picked face.
+
+    Args:
+        table (dict): Face table from build_face_table
+        shank_sizes (np.ndarray): Matched shank size per face (0 = none)
+        bearing_sizes (np.ndarray): Matched bearing size per face (0 = none)
+        clustering_config (dict): radial_tolerance, axial_reach (mm), angle_tolerance (deg)
+        length_scale (float): Factor converting geometry lengths to mm
+
+    Returns:
+        tuple: (shank_sizes, bearing_sizes) with all but one face per bolt set to 0
+    """
+    candidates = np.flatnonzero((shank_sizes > 0) | (bearing_sizes > 0))
+    if len(candidates) == 0:
+        return shank_sizes, bearing_sizes
+
+    subset = subset_face_table(table, candidates)
+    labels = cluster_coaxial_faces(
+        subset['centroid'], subset['axis'],
+        clustering_config.get('radial_tolerance', 0.1) / length_scale,
+        clustering_config.get('axial_reach', 200.0) / length_scale,
+        clustering_config.get('angle_tolerance', 2.0))
+
+    picked_shank = np.zeros_like(shank_sizes)
+    picked_bearing = np.zeros_like(bearing_sizes)
+    areas = subset['area']
+
+    for label in range(labels.max() + 1):
+        members = candidates[labels == label]
+        member_areas = areas[labels == label]
+        for sizes, picked in ((shank_sizes, picked_shank), (bearing_sizes, picked_bearing)):
+            matching = sizes[members] > 0
+            if np.any(matching):
+                best = members[matching][np.argmax(member_areas[matching])]
+                picked[best] = sizes[best]
+
+    log(f"Clustered {len(candidates)} bolt face(s) into {labels.max() + 1} bolt(s)")
+    return picked_shank, picked_bearing
+
+
+# ============================================================================
+# Main Processing
+# ============================================================================
+
+def run_from_config(config):
+    """
+    Run bolt detection based on configuration dictionary.
+
+    Args:
+        config (dict): Configuration dictionary
+
+    Returns:
+        dict: Mapping of created named selection name -> list of face IDs
+    """
+    global_settings = config.get('global_settings', {})
+    set_logging(global_settings.get('log_details', True))
+    length_scale = global_settings.get('length_scale', 1000.0)
+    sizes = config.get('bolt_sizes', EMBEDDED_CONFIG['bolt_sizes'])
+
+    invalidate_named_selection_cache()
+    log_section("ANSYS Mechanical - Automated Bolt Detection Script")
+    log(f"Bolt sizes: {', '.join('M{}'.format(size) for size in sizes)}")
+
+    table = build_face_table()
+    if len(table['face_id']) == 0:
+        log("No faces found in geometry.", "WARNING")
+        return {}
+
+    selections = {}
+    no_match = np.zeros(len(table['face_id']))
+
+    shank_config = config.get('shank_faces', {})
+    shank_sizes = no_match
+    if shank_config.get('enabled', True):
+        shank_sizes = classify_shank_faces(
+            table, sizes, shank_config.get('diameter_tolerance', 0.03), length_scale)
+
+    bearing_config = config.get('bearing_faces', {})
+    bearing_sizes = no_match
+    if bearing_config.get('enabled', True):
+        bearing_sizes = classify_bearing_faces(
+            table, sizes, bearing_config.get('inner_diameter_range', [0.98, 1.20]),
+            bearing_config.get('min_outer_ratio', 1.3), length_scale)
+
+    clustering_config = config.get('clustering', {})
+    if clustering_config.get('enabled', True):
+        shank_sizes, bearing_sizes = cluster_bolt_faces(
+            table, shank_sizes, bearing_sizes, clustering_config, length_scale)
+
+    selections.update(group_faces_by_size(
+        table['face_id'], shank_sizes, shank_config.get('name', 'M{size}_Bolts')))
+    selections.update(group_faces_by_size(
+        table['face_id'], bearing_sizes, bearing_config.get('name', 'M{size}_export')))
+
+    if not selections:
+        log("No bolt faces detected.", "WARNING")
+        return {}
+
+    for name, ids in sorted(selections.items()):
+        log(f"  {name}: {len(ids)} face(s)")
+
+    create_or_update_named_selections(selections)
+    refresh_tree()
+
+    log("")
+    log_section("Bolt detection complete!")
+    return selections
+
+
+def load_config():
+    """
+    Load configuration from YAML file, with fallback to embedded config.
+
+    Returns:
+        dict: Configuration dictionary
+    """
+    try:
+        from utilities.config_loader import load_yaml_config, get_config_path
+
+        config_path = get_config_path('bolt_detection_config.yaml')
+        config = load_yaml_config(config_path)
+        log(f"Loaded configuration from: {config_path}")
+        return config
+
+    except (ImportError, FileNotFoundError) as e:
+        log(f"Could not load YAML config: {str(e)}", "WARNING")
+        log("Using embedded configuration")
+        return EMBEDDED_CONFIG
+
+
+def main():
+    """
+    Main function to load configuration and create bolt named selections.
+    """
+    run_from_config(load_config())
+
+
+# Run the script
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+"""
+ANSYS Workbench Mechanical - Automated Bolt Region Mesh Sizing
+===============================================================
+
+This script adds mesh controls to the bolt bodies of the bolt named
+selections (the same ones bolt_pretensions.py consumes), sized from the
+bolt diameter instead of the global default sizing:
+- Body sizing: element size = size_factor x bolt diameter
+- Sweep method: bolt shanks are meshed as swept hex/wedge bodies
+- Body of influence (optional): refines/coarsens the bodies of a scope
+  named selection (e.g. flanges) around the bolts
+
+The bolt diameter is taken from the circular edges of the named selection
+faces, from a per-named-selection override, or from the M<size> name.
+All controls are created or updated in one transaction and reconciled by
+name and fingerprint on re-runs (state/<model>/bolt_meshing_state.json). With
+measure_dof, an estimated DOF count (3 x nodes) is reported before (from the
+existing mesh) and after (the mesh is generated once, if controls changed).
+
+Configuration is loaded from config/bolt_meshing_config.yaml
+
+Usage:
+    Run this script from within ANSYS Workbench Mechanical using the scripting console
+    or as an external script file, or run main.py --mesh-bolts.
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: ExtAPI, Model, MethodType, SizingType, etc. are provided by ANSYS Mechanical runtime environment
+
+import sys
+import os
+import re
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log, log_section, set_logging
+from utilities.config_loader import load_yaml_config, get_config_path
+from utilities.named_selection_helper import (get_named_selection, named_selection_to_list, refresh_tree,
+                                              invalidate_named_selection_cache)
+from utilities.state_helper import (get_state_path, load_state, save_state, compute_fingerprint,
+                                   reconcile_objects)
+from utilities.face_table import circular_edge_radii
+
+
+EMBEDDED_CONFIG = {
+    'global_settings': {
+        'log_details': True,
+        'run_with_all': False,
+        'length_scale': 1000.0,
+        'measure_dof': False,
+        'state_file': None
+    },
+    'named_selections': None,
+    'sizing': {
+        'enabled': True,
+        'size_factor': 0.5
+    },
+    'sweep': {
+        'enabled': True,
+        'divisions': 0
+    },
+    'body_of_influence': {
+        'enabled': False,
+        'scope': None,
+        'size_factor': 0.75
+    },
+    'overrides': {}
+}
+
+STATE_FILENAME = 'bolt_meshing_state.json'
+CONTROL_PREFIX = 'BoltMesh'
+DOF_PER_NODE = 3
+
+
+# ============================================================================
+# Planning
+# ============================================================================
+
+def nominal_diameter_from_name(ns_name):
+    """
+    Read the nominal diameter from an M<size> named selection name.
+
+    Args:
+        ns_name (str): Named selection name (e.g. 'M12_Bolts')
+
+    Returns:
+        float: Nominal diameter in mm, or None if the name has no M<size>
+    """
+    match = re.search(r'M(\d+(?:\.\d+)?)', ns_name)
+    return float(match.group(1)) if match else None
+
+
+def estimate_bolt_diameter(faces, length_scale=1000.0):
+    """
+    Estimate the bolt diameter from the circular edges of the bolt faces.
+
+    Args:
+        faces (list): Bolt faces (shank or cross-section faces)
+        length_scale (float): Geometry length unit -> mm
+
+    Returns:
+        float: Median diameter in mm, or None if no face has a circular edge
+    """
+    radii = circular_edge_radii(faces)
+    radii = radii[np.isfinite(radii)]
+    if len(radii) == 0:
+        return None
+    return float(np.median(radii)) * 2.0 * length_scale
+
+
+def control_names(ns_name):
+    """
+    Build the names of the mesh controls of one bolt named selection.
+
+    Args:
+        ns_name (str): Named selection name
+
+    Returns:
+        dict: Control kind ('sizing', 'sweep', 'body_of_influence') -> name
+    """
+    return {
+        'sizing': f"{CONTROL_PREFIX}_Sizing_{ns_name}",
+        'sweep': f"{CONTROL_PREFIX}_Sweep_{ns_name}",
+        'body_of_influence': f"{CONTROL_PREFIX}_BOI_{ns_name}",
+    }
+
+
+def plan_bolt_mesh_controls(ns_name, config, scope_body_ids=None):
+    """
+    Plan the mesh controls of one bolt named selection.
+
+    Args:
+        ns_name (str): Named selection name
+        config (dict): Configuration dictionary
+        scope_body_ids (list): Body IDs of the body-of-influence scope (None = no BOI)
+
+    Returns:
+        list: Control specs with keys name, named_selection, kind, body_ids,
+              element_size (mm), divisions and scope_ids, or None if the named
+              selection cannot be planned
+    """
+    global_settings = config.get('global_settings', {})
+    length_scale = global_settings.get('length_scale', 1000.0)
+    override = (config.get('overrides') or {}).get(ns_name) or {}
+
+    named_selection = get_named_selection(ns_name)
+    if named_selection is None:
+        return None
+    faces = named_selection_to_list(named_selection)
+    if not faces:
+        log(f"No faces found in named selection '{ns_name}'", "WARNING")
+        return None
+
+    body_ids = set()
+    for face in faces:
+        try:
+            body_ids.add(int(face.Bodies[0].Id))
+        except Exception:
+            log(f"  Face {face.Id} has no owning body", "WARNING")
+    body_ids = sorted(body_ids)
+    if not body_ids:
+        return None
+
+    diameter = override.get('diameter') or estimate_bolt_diameter(faces, length_scale) \
+        or nominal_diameter_from_name(ns_name)
+    if not diameter:
+        log(f"Could not determine the bolt diameter of '{ns_name}'; set overrides.{ns_name}.diameter",
+            "WARNING")
+        return None
+
+    names = control_names(ns_name)
+    specs = []
+
+    sizing = config.get('sizing', {})
+    if sizing.get('enabled', True):
+        size_factor = override.get('size_factor', sizing.get('size_factor', 0.5))
+        specs.append({'name': names['sizing'], 'named_selection': ns_name, 'kind': 'sizing', 'body_ids': body_ids,
+                      'element_size': diameter * size_factor, 'divisions': 0, 'scope_ids': []})
+
+    sweep = config.get('sweep', {})
+    if sweep.get('enabled', True):
+        specs.append({'name': names['sweep'], 'named_selection': ns_name, 'kind': 'sweep', 'body_ids': body_ids,
+                      'element_size': 0.0, 'divisions': int(override.get('divisions', sweep.get('divisions', 0))),
+                      'scope_ids': []})
+
+    influence = config.get('body_of_influence', {})
+    if influence.get('enabled', False) and scope_body_ids:
+        size_factor = override.get('influence_size_factor', influence.get('size_factor', 0.75))
+        scope_ids = sorted(set(scope_body_ids) - set(body_ids))
+        if scope_ids:
+            specs.append({'name': names['body_of_influence'], 'named_selection': ns_name,
+                          'kind': 'body_of_influence', 'body_ids': body_ids,
+                          'element_size': diameter * size_factor, 'divisions': 0, 'scope_ids': scope_ids})
+
+    log(f"  {ns_name}: {len(body_ids)} bolt body(ies), diameter {diameter:.3g} mm, {len(specs)} control(s)")
+    return specs
+
+
+def mesh_control_fingerprint(spec):
+    """Fingerprint the scoping and settings of a planned mesh control."""
+    return compute_fingerprint(spec['kind'], spec['body_ids'], round(spec['element_size'], 9),
+                               spec['divisions'], spec['scope_ids'])
+
+
+# ============================================================================
+# Mesh Controls
+# ============================================================================
+
+def _selection(entity_ids):
+    selection = ExtAPI.SelectionManager.CreateSelectionInfo(SelectionTypeEnum.GeometryEntities)
+    selection.Ids = list(entity_ids)
+    return selection
+
+
+def index_mesh_controls():
+    """
+    Index the mesh controls by name in one walk of the mesh children.
+
+    Returns:
+        dict: Mapping of control name -> list of mesh controls
+    """
+    index = {}
+    for control in Model.Mesh.Children:
+        index.setdefault(control.Name, []).append(control)
+    return index
+
+
+def add_mesh_control(kind):
+    """Add an empty mesh control of the given kind."""
+    if kind == 'sweep':
+        return Model.Mesh.AddAutomaticMethod()
+    return Model.Mesh.AddSizing()
+
+
+def apply_mesh_control(control, spec):
+    """
+    Apply scoping and settings of a planned mesh control.
+
+    Args:
+        control: Sizing or method control
+        spec (dict): Control spec from plan_bolt_mesh_controls
+    """
+    if spec['kind'] == 'sweep':
+        control.Location = _selection(spec['body_ids'])
+        control.Method = MethodType.Sweep
+        if spec['divisions'] > 0:
+            control.SweepNumberDivisions = spec['divisions']
+    elif spec['kind'] == 'body_of_influence':
+        control.Location = _selection(spec['scope_ids'])
+        control.Type = SizingType.BodyOfInfluence
+        control.BodyOfInfluence = _selection(spec['body_ids'])
+        control.ElementSize = Quantity(spec['element_size'], "mm")
+    else:
+        control.Location = _selection(spec['body_ids'])
+        control.ElementSize = Quantity(spec['element_size'], "mm")
+
+
+def reconcile_mesh_controls(specs, registry=None, unsettled=()):
+    """
+    Reconcile the bolt mesh controls with the planned specs.
+
+    Controls are matched by name: matching fingerprints are kept, changed
+    controls are updated in place, missing ones are created, duplicates
+    are deleted, and controls recorded in the registry that are no longer
+    planned are deleted unless their named selection could not be planned
+    this run. Call inside a Transaction.
+
+    Args:
+        specs (list): Control specs from plan_bolt_mesh_controls
+        registry (dict): Optional name -> {'owner', 'fingerprint'} registry (updated in place)
+        unsettled (iterable): Named selections that could not be planned
+
+    Returns:
+        dict: Counts of 'created', 'updated', 'unchanged', 'deleted' and 'failed' controls
+    """
+    def create(spec):
+        control = add_mesh_control(spec['kind'])
+        control.Name = spec['name']
+        apply_mesh_control(control, spec)
+        return control
+
+    def update(control, spec, recorded):
+        apply_mesh_control(control, spec)
+        return True
+
+    items = [dict(spec, owner=spec['named_selection'], fingerprint=mesh_control_fingerprint(spec))
+             for spec in specs]
+    counts, _ = reconcile_objects(items, index_mesh_controls(), registry if registry is not None else {},
+                                  create, update, unsettled, label='mesh control')
+    return counts
+
+
+# ============================================================================
+# DOF Report
+# ============================================================================
+
+def count_dof(generate=False):
+    """
+    Estimate the model DOF as 3 x mesh nodes.
+
+    Args:
+        generate (bool): Generate the mesh first (only regenerates what changed);
+                         otherwise the statistics of the existing mesh are read
+
+    Returns:
+        int: Estimated DOF count, or None if there is no mesh
+    """
+    try:
+        if generate:
+            Model.Mesh.GenerateMesh()
+        nodes = int(Model.Mesh.Nodes)
+        return nodes * DOF_PER_NODE if nodes else None
+    except Exception as e:
+        log(f"Could not read the mesh node count: {str(e)}", "WARNING")
+        return None
+
+
+def dof_reduction(dof_before, dof_after):
+    """
+    Compare DOF counts before and after the bolt mesh controls.
+
+    Returns:
+        float: Relative reduction (0.25 = 25% fewer DOF), or None if unknown
+    """
+    if not dof_before or dof_after is None:
+        return None
+    return 1.0 - float(dof_after) / float(dof_before)
+
+
+# ============================================================================
+# Main Processing
+# ============================================================================
+
+def get_bolt_named_selections(config):
+    """
+    Get the bolt named selections to mesh.
+
+    Args:
+        config (dict): Configuration dictionary
+
+    Returns:
+        list: Named selection names (default: those of bolt_pretension_config.yaml)
+    """
+    names = config.get('named_selections')
+    if names:
+        return [names] if isinstance(names, str) else list(names)
+
+    from preprocessing.bolt_pretensions import load_config as load_pretension_config
+    return list((load_pretension_config().get('bolt_pretensions') or {}).keys())
+
+
+def _scope_body_ids(config):
+    scope = (config.get('body_of_influence') or {}).get('scope')
+    if not scope:
+        return None
+    named_selection = get_named_selection(scope)
+    if named_selection is None:
+        return None
+    body_ids = set()
+    for entity in named_selection_to_list(named_selection):
+        try:
+            if entity.Type == GeoCellTypeEnum.GeoBody:
+                body_ids.add(int(entity.Id))
+            else:
+                body_ids.add(int(entity.Bodies[0].Id))
+        except Exception:
+            continue
+    return sorted(body_ids)
+
+
+def load_config():
+    """
+    Load configuration from YAML file, with fallback to embedded config.
+
+    Returns:
+        dict: Configuration dictionary
+    """
+    try:
+        config_path = get_config_path('bolt_meshing_config.yaml')
+        config = load_yaml_config(config_path)
+        log(f"Loaded configuration from: {config_path}")
+        return config
+    except (ImportError, FileNotFoundError) as e:
+        log(f"Could not load YAML config: {str(e)}", "WARNING")
+        log("Using embedded configuration")
+        return EMBEDDED_CONFIG
+
+
+def run_from_config(config):
+    """
+    Add bolt region mesh controls based on configuration dictionary.
+
+    Args:
+        config (dict): Configuration dictionary
+
+    Returns:
+        dict: Report with reconciliation counts, dof_before, dof_after and reduction
+    """
+    global_settings = config.get('global_settings', {})
+    set_logging(global_settings.get('log_details', True))
+    measure_dof = global_settings.get('measure_dof', False)
+    state_file = global_settings.get('state_file') or get_state_path(STATE_FILENAME)
+
+    invalidate_named_selection_cache()
+    log_section("ANSYS Mechanical - Automated Bolt Region Mesh Sizing")
+
+    ns_names = get_bolt_named_selections(config)
+    if not ns_names:
+        log("No bolt named selections configured.", "WARNING")
+        return {}
+
+    scope_body_ids = _scope_body_ids(config)
+    specs = []
+    unsettled = []
+    for ns_name in ns_names:
+        ns_specs = plan_bolt_mesh_controls(ns_name, config, scope_body_ids)
+        if ns_specs is None:
+            unsettled.append(ns_name)
+        else:
+            specs.extend(ns_specs)
+
+    dof_before = count_dof(generate=False) if measure_dof else None
+
+    state = load_state(state_file)
+    with Transaction():
+        counts = reconcile_mesh_controls(specs, state.setdefault('fingerprints', {}), unsettled)
+    save_state(state_file, state)
+    refresh_tree()
+
+    changed = counts['created'] + counts['updated'] + counts['deleted']
+    dof_after = (count_dof(generate=True) if changed else dof_before) if measure_dof else None
+    reduction = dof_reduction(dof_before, dof_after)
+
+    log("")
+    log(f"Mesh controls: {counts['created']} created, {counts['updated']} updated, "
+        f"{counts['unchanged']} unchanged, {counts['deleted']} deleted")
+    if measure_dof:
+        log(f"Estimated DOF (3 x nodes) before: {dof_before if dof_before is not None else 'no mesh'}, "
+            f"after: {dof_after if dof_after is not None else 'n/a'}"
+            + (f" ({reduction:.1%} reduction)" if reduction is not None else ""))
+    log_section("Bolt mesh sizing complete!")
+
+    report = dict(counts)
+    report.update({'dof_before': dof_before, 'dof_after': dof_after, 'reduction': reduction})
+    return report
+
+
+def main():
+    """
+    Main function to add bolt region mesh controls.
+
+    Returns:
+        dict: Mesh sizing report
+    """
+    return run_from_config(load_config())
+
+
+# Run the script
+if __name__ == "__main__":
+    main()
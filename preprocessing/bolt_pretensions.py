@@ -4,7 +4,23 @@ ANSYS Workbench Mechanical - Automated Bolt Pretension Creation
 
 This script automates the creation of bolt pretensions based on named selections.
 Each named selection contains multiple faces (one per bolt), all of the same bolt type.
-Creates pretension loads in step 1, and locks them in all subsequent steps.
+By default pretension loads are created in step 1 and locked in all subsequent steps.
+With a tightening sequence (simultaneous, sequential or star pattern, several
+passes) each bolt follows the Open/Load/Lock/Increment step table built by
+tightening_sequence.py, packed into the fewest load steps.
+
+All pretensions for all named selections and all configured analyses are
+built in one transaction: named selections, bolt numbering, preload
+quantities and analysis step counts are resolved once up front, and the
+tree is refreshed once at the end.
+
+Re-runs reconcile per bolt instead of rebuilding the groups: unchanged
+bolts are kept, changed bolts only get the differing scoping or step loads,
+and only added or removed faces create or delete bolts, so Mechanical
+keeps the results it can. Bolt numbering and fingerprints are stored in
+state/<model>/bolt_pretensions_state.json.
+
+Configuration is loaded from config/bolt_pretension_config.yaml
 
 Usage:
     Run this script from within ANSYS Workbench Mechanical using the scripting console
@@ -15,7 +31,25 @@ Usage:
 # type: ignore
 # Note: ExtAPI, BoltPretension, etc. are provided by ANSYS Mechanical runtime environment
 
-# Parameters - Edit these as needed
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log, log_section, set_logging
+from utilities.named_selection_helper import (get_named_selection, named_selection_to_list, refresh_tree,
+                                              invalidate_named_selection_cache)
+from utilities.state_helper import (get_state_path, load_state, save_state, compute_fingerprint,
+                                   reconcile_objects)
+from utilities.bolt_identity import assign_bolt_indices, get_identity_state
+from utilities.tree_group_helper import sync_tree_group
+from preprocessing.tightening_sequence import (OPEN, LOAD, LOCK, INCREMENT, PATTERN_STAR,
+                                               schedule_bolts)
+
+# Fallback bolt pretension definitions (used without YAML support)
 BOLT_PRETENSION_CONFIGS = {
     # Example configuration - modify for your named selections
     # Format: "NamedSelectionName": {"pretension": value_in_newtons}
@@ -28,265 +62,404 @@ BOLT_PRETENSION_CONFIGS = {
     # Add more named selections as needed
 }
 
-# Global settings
-LOG_DETAILS = True  # Set to True for detailed logging
+EMBEDDED_CONFIG = {
+    'global_settings': {
+        'log_details': True,
+        'analyses': [0],
+        'state_file': None
+    },
+    'tightening_sequence': {
+        'enabled': False,
+        'pattern': 'simultaneous',
+        'passes': [100],
+        'group_size': 1
+    },
+    'bolt_pretensions': BOLT_PRETENSION_CONFIGS
+}
+
+STATE_FILENAME = 'bolt_pretensions_state.json'
 
+# Load in step 1, lock afterwards (used without a tightening sequence)
+DEFAULT_SEQUENCE = {'pattern': 'simultaneous', 'passes': [100]}
 
-def log(message):
-    """Simple logging function"""
-    if LOG_DETAILS:
-        print(message)
 
+# ============================================================================
+# Bolt Pretension Objects
+# ============================================================================
 
-def get_named_selection(named_selection_name):
+def index_bolt_pretensions(analysis):
     """
-    Retrieve a named selection by name using ANSYS best practice API.
+    Index the bolt pretensions of an analysis by name in one tree walk.
 
     Args:
-        named_selection_name (str): Name of the named selection
+        analysis: Analysis object
 
     Returns:
-        Named selection object or None if not found
+        dict: Mapping of bolt pretension name -> list of bolt pretensions
     """
-    try:
-        # Use GetObjectsByName as per ANSYS best practices
-        results = ExtAPI.DataModel.GetObjectsByName(named_selection_name)
+    index = {}
+    for bolt in analysis.GetChildren(DataModelObjectCategory.BoltPretension, True):
+        index.setdefault(bolt.Name, []).append(bolt)
+    return index
 
-        if results and len(results) > 0:
-            log(f"Found named selection '{named_selection_name}'")
-            return results[0]
-        else:
-            log(f"WARNING: Named selection '{named_selection_name}' not found")
-            return None
 
-    except Exception as e:
-        log(f"ERROR getting named selection '{named_selection_name}': {str(e)}")
+def _face_selection(face_id):
+    selection = ExtAPI.SelectionManager.CreateSelectionInfo(SelectionTypeEnum.GeometryEntities)
+    selection.Ids = [face_id]
+    return selection
+
+
+def _location_ids(bolt):
+    try:
+        return [int(entity_id) for entity_id in bolt.Location.Ids]
+    except Exception:
         return None
 
 
-def get_faces_from_named_selection(named_selection):
-    """
-    Extract individual faces from a named selection.
+def _define_by(code):
+    return {
+        OPEN: BoltLoadDefineBy.Open,
+        LOAD: BoltLoadDefineBy.Load,
+        LOCK: BoltLoadDefineBy.Lock,
+        INCREMENT: BoltLoadDefineBy.Increment,
+    }[code]
 
-    Args:
-        named_selection: Named selection object
 
-    Returns:
-        list: List of face objects from the named selection
+def configure_bolt_pretension(bolt, face_id, plan, column, num_steps, update_scoping=True, update_loads=True):
     """
-    try:
-        faces = []
-        selection_info = named_selection.Location
+    Apply scoping and the per-step definitions of one bolt of a plan.
 
-        # Convert to list if it's a single item
-        if hasattr(selection_info, '__iter__'):
-            for item in selection_info:
-                faces.append(item)
-        else:
-            faces.append(selection_info)
+    Steps beyond the plan's step table keep the bolt locked.
 
-        log(f"Extracted {len(faces)} face(s) from named selection")
-        return faces
+    Args:
+        bolt: Bolt pretension object
+        face_id (int): Bolt face ID (unused without update_scoping)
+        plan (dict): Plan with a step table and hoisted quantities (see schedule_pretension)
+        column (int): Position of the bolt in the plan
+        num_steps (int): Number of analysis steps
+        update_scoping (bool): Assign the face scoping
+        update_loads (bool): Assign the step definitions and values
+    """
+    if update_scoping:
+        bolt.Location = _face_selection(face_id)
+    if not update_loads:
+        return
 
-    except Exception as e:
-        log(f"ERROR extracting faces from named selection: {str(e)}")
-        return []
+    schedule = plan['schedule']
+    for step in range(1, num_steps + 1):
+        index = step - 1
+        code = int(schedule['codes'][index, column]) if index < schedule['num_steps'] else LOCK
+        bolt.SetDefineBy(step, _define_by(code))
+        if code == LOAD:
+            bolt.Preload.Output.SetDiscreteValue(index, plan['loads'][float(schedule['fractions'][index, column])])
+        elif code == INCREMENT:
+            bolt.Increment.Output.SetDiscreteValue(
+                index, plan['increments'][float(schedule['increments'][index, column])])
 
 
-def find_existing_bolt_group(group_name):
+def load_fingerprint(plan, column, num_steps):
     """
-    Find an existing bolt pretension group by name using GetObjectsByName.
+    Fingerprint the loading of one bolt: pretension, step count and its step table column.
 
     Args:
-        group_name (str): Name of the bolt pretension group to find
+        plan (dict): Plan from plan_bolt_pretensions
+        column (int): Position of the bolt in the plan
+        num_steps (int): Number of analysis steps
 
     Returns:
-        Bolt pretension group object if found, None otherwise
+        str: Fingerprint
     """
-    try:
-        # Use GetObjectsByName for efficient lookup
-        results = ExtAPI.DataModel.GetObjectsByName(group_name)
+    schedule = plan['schedule']
+    return compute_fingerprint('load', plan['pretension'], num_steps,
+                               schedule['codes'][:, column].tolist(),
+                               schedule['fractions'][:, column].tolist(),
+                               schedule['increments'][:, column].tolist())
 
-        if results and len(results) > 0:
-            # Verify it's a bolt pretension object
-            obj = results[0]
-            if 'BoltPretension' in str(type(obj)):
-                log(f"Found existing bolt group: '{group_name}'")
-                return obj
 
-        return None
-
-    except Exception as e:
-        log(f"ERROR searching for existing group: {str(e)}")
-        return None
+# ============================================================================
+# Planning and Reconciliation
+# ============================================================================
 
-
-def delete_group_children(group):
+def schedule_pretension(pretension_force, count, sequence=None, centroids=None):
     """
-    Delete all children from a bolt pretension group.
+    Build the step table and hoisted step quantities of a group of bolts.
 
     Args:
-        group: The bolt pretension group object
-    """
-    try:
-        # Get all children
-        children_to_delete = []
-        for child in group.Children:
-            children_to_delete.append(child)
-
-        # Delete each child
-        for child in children_to_delete:
-            child.Delete()
-
-        log(f"Deleted {len(children_to_delete)} children from group '{group.Name}'")
+        pretension_force (float): Final pretension force in Newtons
+        count (int): Number of bolts
+        sequence (dict): Tightening sequence (default: load in step 1, lock afterwards)
+        centroids: (N, 3) bolt centroids (star pattern)
 
-    except Exception as e:
-        log(f"ERROR deleting group children: {str(e)}")
-
-
-def create_bolt_pretension_group(group_name):
+    Returns:
+        dict: pretension, schedule (step table), loads (fraction -> force
+              Quantity) and increments (length -> Quantity), one Quantity per
+              distinct step value shared by all bolts and analyses
     """
-    Create a new bolt pretension group or recreate if it exists.
+    schedule = schedule_bolts(count, sequence or DEFAULT_SEQUENCE, centroids)
+    return {
+        'pretension': pretension_force,
+        'schedule': schedule,
+        'loads': {float(fraction): Quantity(float(fraction) * pretension_force, "N")
+                  for fraction in np.unique(schedule['fractions'])},
+        'increments': {float(length): Quantity(float(length), "mm")
+                       for length in np.unique(schedule['increments'])}
+    }
+
+
+def plan_bolt_pretensions(named_selection_name, pretension_force, identity=None, sequence=None):
+    """
+    Resolve the bolts of one named selection once for all analyses.
 
     Args:
-        group_name (str): Name for the bolt pretension group
+        named_selection_name (str): Name of the named selection containing bolt faces
+        pretension_force (float): Pretension force in Newtons
+        identity (dict): Optional bolt identity state for this named selection (updated in place)
+        sequence (dict): Tightening sequence (pattern, passes, group_size);
+                         None loads every bolt in step 1 and locks it afterwards
 
     Returns:
-        Bolt pretension group object
+        dict: Plan with keys named_selection, group_name, faces, names,
+              pretension, schedule (step table), loads (fraction -> force
+              Quantity) and increments (length -> Quantity), or None if there
+              are no faces
     """
-    try:
-        connections = ExtAPI.DataModel.Project.Model.Connections
-
-        # Check if group already exists
-        existing_group = find_existing_bolt_group(group_name)
-
-        if existing_group is not None:
-            log(f"Found existing group '{group_name}' - deleting children and recreating")
-            # Delete all children
-            delete_group_children(existing_group)
-            # Delete the group itself
-            existing_group.Delete()
+    log(f"\nProcessing Named Selection: '{named_selection_name}'")
 
-        # Create new bolt pretension group
-        bolt_group = connections.AddBoltPretension()
-        bolt_group.Name = group_name
+    named_selection = get_named_selection(named_selection_name)
+    if not named_selection:
+        log(f"Named selection '{named_selection_name}' not found", "WARNING")
+        return None
 
-        log(f"Created bolt pretension group: {bolt_group.Name}")
-        return bolt_group
+    faces = named_selection_to_list(named_selection)
+    if not faces:
+        log(f"No faces found in named selection '{named_selection_name}'", "WARNING")
+        return None
 
-    except Exception as e:
-        log(f"ERROR creating bolt pretension group: {str(e)}")
+    # Stable bolt numbering (positional numbering without identity state)
+    if identity is not None:
+        bolt_indices, _ = assign_bolt_indices(faces, identity)
+    else:
+        bolt_indices = list(range(1, len(faces) + 1))
+
+    # Order the plan by bolt number so sequential patterns follow the numbering
+    order = sorted(range(len(faces)), key=lambda position: bolt_indices[position])
+    faces = [faces[position] for position in order]
+    bolt_indices = [bolt_indices[position] for position in order]
+
+    sequence = sequence or DEFAULT_SEQUENCE
+    centroids = None
+    if sequence.get('pattern') == PATTERN_STAR:
+        centroids = np.array([list(face.Centroid) for face in faces], dtype=float)
+    try:
+        loading = schedule_pretension(pretension_force, len(faces), sequence, centroids)
+    except (KeyError, TypeError, ValueError) as e:
+        log(f"Invalid tightening sequence for '{named_selection_name}': {str(e)}", "ERROR")
         return None
 
+    log(f"  {len(faces)} bolt(s), pretension {pretension_force} N, "
+        f"{sequence.get('pattern', 'simultaneous')} sequence in {loading['schedule']['num_steps']} step(s)")
+    plan = {
+        'named_selection': named_selection_name,
+        'group_name': f"BoltGroup_{named_selection_name}",
+        'faces': faces,
+        'names': [f"Bolt_{named_selection_name}_{index}" for index in bolt_indices],
+    }
+    plan.update(loading)
+    return plan
 
-def create_bolt_pretensions(named_selection_name, pretension_force):
-    """
-    Create bolt pretensions for all faces in a named selection.
 
-    - Creates one bolt pretension per face
-    - Groups all pretensions under a single parent
-    - Applies force in step 1, locks in subsequent steps
+def ensure_step_count(analysis, plans):
+    """
+    Raise the number of analysis steps to fit the longest tightening sequence.
 
     Args:
-        named_selection_name (str): Name of the named selection containing bolt faces
-        pretension_force (float): Pretension force in Newtons
+        analysis: Analysis object
+        plans (list): Plans from plan_bolt_pretensions
+
+    Returns:
+        int: Number of analysis steps
     """
-    log(f"\n--- Creating Bolt Pretensions for '{named_selection_name}' ---")
+    num_steps = analysis.AnalysisSettings.NumberOfSteps
+    required = max([plan['schedule']['num_steps'] for plan in plans] or [1])
+    if required > num_steps:
+        analysis.AnalysisSettings.NumberOfSteps = required
+        log(f"  Raised number of steps from {num_steps} to {required} for the tightening sequence")
+        num_steps = required
+    return num_steps
 
-    # Get named selection using best practice API
-    named_selection = get_named_selection(named_selection_name)
 
-    if not named_selection:
-        log(f"WARNING: Named selection '{named_selection_name}' not found")
-        return
+def reconcile_bolt_pretensions(analysis, plans, registry=None, unsettled=()):
+    """
+    Reconcile the bolt pretensions of one analysis with the planned bolts.
 
-    # Get faces from named selection
-    faces = get_faces_from_named_selection(named_selection)
+    Bolts are matched by name (Bolt_<NamedSelection>_<BoltIndex>); the
+    registry stores a scoping and a loading fingerprint per bolt:
+    - Bolts whose recorded fingerprints match are kept untouched
+    - Changed bolts only get the part that differs (scoping or step loads);
+      a changed step count or sequence re-applies the step definitions
+    - Missing bolts are created and grouped under BoltGroup_<NamedSelection>
+    - Generated bolts recorded in the registry that are no longer planned are
+      deleted, unless their named selection could not be planned this run
+    - Bolts that fail to reconcile keep their object, group membership and
+      registry entry
 
-    if not faces:
-        log(f"WARNING: No faces found in named selection '{named_selection_name}'")
-        return
+    Call inside a Transaction.
 
-    try:
-        # Create or recreate the bolt pretension group
-        group_name = f"BoltGroup_{named_selection_name}"
-        bolt_group = create_bolt_pretension_group(group_name)
+    Args:
+        analysis: Analysis object
+        plans (list): Plans from plan_bolt_pretensions
+        registry (dict): Optional name -> {'owner', 'fingerprint': [scope, load]}
+                         registry for this analysis (updated in place)
+        unsettled (iterable): Configured named selections that could not be planned
+
+    Returns:
+        dict: Counts of 'created', 'updated', 'unchanged' and 'deleted' bolts
+    """
+    registry = registry if registry is not None else {}
+    num_steps = ensure_step_count(analysis, plans)
+
+    def create(item):
+        bolt = analysis.AddBoltPretension()
+        bolt.Name = item['name']
+        configure_bolt_pretension(bolt, item['face'].Id, item['plan'], item['column'], num_steps)
+        return bolt
+
+    def update(bolt, item, recorded):
+        update_scoping = _location_ids(bolt) != [item['face'].Id]
+        update_loads = not isinstance(recorded, list) or recorded[1] != item['fingerprint'][1]
+        if not (update_scoping or update_loads):
+            return False
+        configure_bolt_pretension(bolt, item['face'].Id, item['plan'], item['column'], num_steps,
+                                  update_scoping, update_loads)
+        return ', '.join(part for part, changed in (('scoping', update_scoping), ('loads', update_loads))
+                         if changed)
+
+    items = []
+    for plan in plans:
+        for column, (face, name) in enumerate(zip(plan['faces'], plan['names'])):
+            items.append({
+                'name': name, 'owner': plan['named_selection'], 'face': face, 'plan': plan, 'column': column,
+                'fingerprint': [compute_fingerprint('scope', face.Id), load_fingerprint(plan, column, num_steps)],
+            })
+
+    counts, bolts = reconcile_objects(items, index_bolt_pretensions(analysis), registry, create, update,
+                                      unsettled, label='bolt pretension')
+    for plan in plans:
+        sync_tree_group(analysis, [bolts[name] for name in plan['names'] if name in bolts], plan['group_name'])
+
+    return counts
+
+
+# ============================================================================
+# Main Processing
+# ============================================================================
+
+def run_from_config(config):
+    """
+    Build bolt pretensions for all named selections and analyses in one pass.
 
-        if bolt_group is None:
-            log(f"ERROR: Failed to create bolt group for '{named_selection_name}'")
-            return
+    Args:
+        config (dict): Configuration dictionary
 
-        # Create individual bolt pretensions for each face
-        bolt_count = 0
-        for idx, face in enumerate(faces, start=1):
-            try:
-                # Add bolt pretension to the group
-                bolt = bolt_group.AddBoltPretension()
-                bolt.Name = f"Bolt_{named_selection_name}_{idx}"
+    Returns:
+        dict: Mapping of analysis name -> reconciliation counts
+    """
+    global_settings = config.get('global_settings', {})
+    set_logging(global_settings.get('log_details', True))
+    analysis_numbers = global_settings.get('analyses', [0])
+    if isinstance(analysis_numbers, int):
+        analysis_numbers = [analysis_numbers]
+    state_file = global_settings.get('state_file') or get_state_path(STATE_FILENAME)
+
+    invalidate_named_selection_cache()
+    log_section("ANSYS Mechanical - Automated Bolt Pretension Creation Script")
+
+    pretensions = config.get('bolt_pretensions') or {}
+    if not pretensions:
+        log("No bolt pretension configurations defined in config file.", "WARNING")
+        return {}
+
+    # Hoisted lookups: analyses, named selections, bolt numbering and preloads
+    analyses = []
+    for number in analysis_numbers:
+        try:
+            analyses.append((number, Model.Analyses[number]))
+        except Exception:
+            log(f"Could not access analysis at index {number}", "ERROR")
+    if not analyses:
+        return {}
+    log(f"Analyses: {', '.join(analysis.Name for _, analysis in analyses)}")
+
+    state = load_state(state_file)
+    registries = state.setdefault('fingerprints', {})
+    identities = get_identity_state(state)
+
+    default_sequence = config.get('tightening_sequence') or {}
+
+    # Named selections that cannot be planned keep their existing bolts
+    plans = []
+    unsettled = []
+    for ns_name, ns_config in pretensions.items():
+        pretension_force = (ns_config or {}).get("pretension")
+        if pretension_force is None:
+            log(f"No pretension force defined for '{ns_name}'. Skipping.", "WARNING")
+            unsettled.append(ns_name)
+            continue
+        sequence = (ns_config or {}).get('tightening_sequence') or default_sequence
+        plan = plan_bolt_pretensions(ns_name, pretension_force, identities.setdefault(ns_name, {}),
+                                     sequence if sequence.get('enabled', True) else None)
+        if plan is not None:
+            plans.append(plan)
+        else:
+            unsettled.append(ns_name)
 
-                # Set the geometry (face)
-                bolt.Location = face
+    # Create or update all pretensions in one transaction
+    results = {}
+    with Transaction():
+        for number, analysis in analyses:
+            log(f"\n--- Bolt pretensions in '{analysis.Name}' ---")
+            registry = registries.setdefault(f"analysis_{number}", {})
+            results[analysis.Name] = reconcile_bolt_pretensions(analysis, plans, registry, unsettled)
 
-                # Define pretension load in Step 1
-                # Get the analysis settings to determine number of steps
-                analysis = ExtAPI.DataModel.Project.Model.Analyses[0]
+    save_state(state_file, state)
 
-                # Add load for Step 1 (apply force)
-                bolt.Preload.Output.DiscreteValues = [Quantity(pretension_force, "N")]
+    # Refresh tree to show new bolt pretensions
+    refresh_tree()
 
-                # Set to lock in subsequent steps
-                # In ANSYS, after initial preload, subsequent steps default to "lock"
-                # This is typically handled by the Define By property
-                bolt.DefineBy = BoltLoadDefineBy.Lock  # Lock after step 1
+    log("")
+    for analysis_name, counts in results.items():
+        log(f"{analysis_name}: {counts['created']} created, {counts['updated']} updated, "
+            f"{counts['unchanged']} unchanged, {counts['deleted']} deleted")
+    log_section("Bolt pretension creation complete!")
+    return results
 
-                bolt_count += 1
 
-                log(f"  Created bolt pretension {idx}/{len(faces)}: {bolt.Name}")
-                log(f"    Pretension: {pretension_force} N")
-                log(f"    Step 1: Apply Force, Step 2+: Lock")
+def load_config():
+    """
+    Load configuration from YAML file, with fallback to embedded config.
 
-            except Exception as e:
-                log(f"  ERROR creating bolt pretension {idx}: {str(e)}")
-                continue
+    Returns:
+        dict: Configuration dictionary
+    """
+    try:
+        from utilities.config_loader import load_yaml_config, get_config_path
 
-        log(f"\nSuccessfully created {bolt_count}/{len(faces)} bolt pretensions in group '{group_name}'")
+        config_path = get_config_path('bolt_pretension_config.yaml')
+        config = load_yaml_config(config_path)
+        log(f"Loaded configuration from: {config_path}")
+        return config
 
-    except Exception as e:
-        log(f"ERROR in create_bolt_pretensions: {str(e)}")
+    except (ImportError, FileNotFoundError) as e:
+        log(f"Could not load YAML config: {str(e)}", "WARNING")
+        log("Using embedded configuration")
+        return EMBEDDED_CONFIG
 
 
 def main():
     """
     Main function to process all configured named selections and create bolt pretensions.
     """
-    log("="*70)
-    log("ANSYS Mechanical - Automated Bolt Pretension Creation Script")
-    log("="*70)
-
-    if not BOLT_PRETENSION_CONFIGS:
-        log("WARNING: No bolt pretension configurations defined.")
-        log("Please update BOLT_PRETENSION_CONFIGS dictionary.")
-        return
-
-    # Process each named selection
-    for ns_name, config in BOLT_PRETENSION_CONFIGS.items():
-        log(f"\nProcessing Named Selection: '{ns_name}'")
-
-        pretension_force = config.get("pretension")
-
-        if pretension_force is None:
-            log(f"WARNING: No pretension force defined for '{ns_name}'. Skipping.")
-            continue
-
-        # Create bolt pretensions
-        create_bolt_pretensions(ns_name, pretension_force)
-
-    # Refresh tree to show new bolt pretensions
-    ExtAPI.DataModel.Tree.Refresh()
-
-    log("\n" + "="*70)
-    log("Bolt pretension creation complete!")
-    log("="*70)
+    run_from_config(load_config())
 
 
 # Run the script
@@ -0,0 +1,196 @@
+"""
+ANSYS Workbench Mechanical - Contact Pair Detection
+====================================================
+
+Finds the body pairs of a named selection whose surfaces actually come
+within the pinball distance of each other, so that contacts can be created
+as explicit pairwise regions instead of one region searching across all
+bodies:
+1. Face bounding boxes, sample points and surface triangles (a
+   triangulated parameter grid) are read in one geometry pass
+2. Candidate face pairs on different bodies are found with a vectorized
+   sweep-and-prune over the boxes (inflated by the pinball radius)
+3. Candidates are confirmed by the distance from the sample points of each
+   face to the surface of the other face. Distances between the sample
+   points themselves would be about half the sample spacing even for faces
+   in full contact, so real contacts with coarse samples would be rejected.
+4. Confirmed face pairs are grouped per body pair (contact / target faces)
+5. Optionally, each body pair gets its own pinball radius derived from the
+   distribution of sampled gaps across its interface
+
+On curved faces the triangles are chords of the surface, so gaps carry an
+error up to the chord height of the parameter grid; raise
+samples_per_direction for tight fits on small radii.
+
+Used by contacts.py when detection is set to 'pairwise' in
+config/contact_config.yaml.
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: GeoCellTypeEnum etc. are provided by ANSYS Mechanical runtime environment
+
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log
+from utilities.named_selection_helper import named_selection_to_list
+from utilities.face_table import build_face_boxes
+from utilities.spatial_index import sweep_and_prune, nearest_distances, nearest_surface_distances
+
+
+def collect_contact_faces(named_selection):
+    """
+    Collect the faces of a named selection, expanding bodies into their faces.
+
+    Args:
+        named_selection: Named selection object
+
+    Returns:
+        list: Geometry face entities (each face once)
+    """
+    faces = []
+    seen = set()
+    for entity in named_selection_to_list(named_selection):
+        if entity.Type == GeoCellTypeEnum.GeoBody:
+            candidates = list(entity.Faces)
+        elif entity.Type == GeoCellTypeEnum.GeoFace:
+            candidates = [entity]
+        else:
+            continue
+        for face in candidates:
+            if face.Id not in seen:
+                seen.add(face.Id)
+                faces.append(face)
+    return faces
+
+
+def surface_gaps(boxes, source, target):
+    """
+    Gaps from the sample points of one face to the surface of another.
+
+    Falls back to the nearest sample point when the target face has no
+    surface triangles (e.g. a degenerate parameter grid).
+
+    Args:
+        boxes (dict): Face box table from build_face_boxes
+        source (int): Row of the face whose sample points are measured
+        target (int): Row of the face measured against
+
+    Returns:
+        np.ndarray: Gap per sample point of the source face
+    """
+    triangles = boxes['triangles'][target] if 'triangles' in boxes else None
+    if triangles is not None and len(triangles):
+        return nearest_surface_distances(boxes['points'][source], triangles)
+    return nearest_distances(boxes['points'][source], boxes['points'][target])
+
+
+def find_contact_pairs(boxes, pinball):
+    """
+    Find body pairs whose faces come within the pinball distance.
+
+    Args:
+        boxes (dict): Face box table from build_face_boxes
+        pinball (float): Pinball radius in geometry units
+
+    Returns:
+        dict: Mapping of (body_a, body_b) with body_a < body_b -> dict with:
+            - source: Sorted face IDs on body_a
+            - target: Sorted face IDs on body_b
+            - min_gap: Smallest point-to-surface gap between the bodies (geometry units)
+            - gaps: Point-to-surface interface gaps within the pinball (geometry units)
+    """
+    candidates = sweep_and_prune(boxes['low'], boxes['high'], pinball, boxes['body_id'])
+    log(f"Sweep-and-prune: {len(candidates)} candidate face pair(s) from {len(boxes['face_id'])} face(s)")
+
+    pairs = {}
+    for first, second in candidates:
+        if boxes['body_id'][first] > boxes['body_id'][second]:
+            first, second = second, first
+
+        forward = surface_gaps(boxes, first, second)
+        if forward.min() > pinball:
+            continue
+        backward = surface_gaps(boxes, second, first)
+        gaps = np.concatenate([forward, backward])
+
+        key = (int(boxes['body_id'][first]), int(boxes['body_id'][second]))
+        pair = pairs.setdefault(key, {'source': set(), 'target': set(), 'min_gap': np.inf, 'gaps': []})
+        pair['source'].add(int(boxes['face_id'][first]))
+        pair['target'].add(int(boxes['face_id'][second]))
+        pair['min_gap'] = min(pair['min_gap'], float(gaps.min()))
+        pair['gaps'].append(gaps[gaps <= pinball])
+
+    for pair in pairs.values():
+        pair['source'] = sorted(pair['source'])
+        pair['target'] = sorted(pair['target'])
+        pair['gaps'] = np.concatenate(pair['gaps'])
+
+    log(f"Confirmed {len(pairs)} body pair(s) within the pinball distance")
+    return pairs
+
+
+def detect_contact_pairs(named_selection, pinball, samples_per_direction=5):
+    """
+    Detect contact body pairs within a named selection.
+
+    Args:
+        named_selection: Named selection object (bodies and/or faces)
+        pinball (float): Pinball radius in geometry units
+        samples_per_direction (int): Parameter grid size per face (samples and triangles)
+
+    Returns:
+        dict: Body pairs as returned by find_contact_pairs
+    """
+    faces = collect_contact_faces(named_selection)
+    if not faces:
+        return {}
+    boxes = build_face_boxes(faces, samples_per_direction)
+    return find_contact_pairs(boxes, pinball)
+
+
+def auto_pinball_radius(gaps, safety_factor=1.5, min_radius=0.0, max_radius=np.inf, percentile=95.0):
+    """
+    Choose the smallest pinball radius that still captures a contact interface.
+
+    The radius covers the given percentile of the point-to-surface
+    interface gaps from find_contact_pairs, scaled by a safety factor and
+    clamped to [min_radius, max_radius].
+
+    Args:
+        gaps: Point-to-surface interface gaps
+        safety_factor (float): Multiplier on the gap percentile
+        min_radius (float): Lower bound of the radius
+        max_radius (float): Upper bound of the radius
+        percentile (float): Gap percentile to capture (100 = every sample)
+
+    Returns:
+        float: Pinball radius (same units as the gaps)
+    """
+    gaps = np.asarray(gaps, dtype=float)
+    if len(gaps) == 0:
+        return float(max_radius)
+    radius = float(np.percentile(gaps, percentile)) * safety_factor
+    return float(np.clip(radius, min_radius, max_radius))
+
+
+def contact_region_name(contact_type, ns_name, body_a, body_b):
+    """
+    Build the name of a pairwise contact region.
+
+    Args:
+        contact_type (str): Contact type label (e.g. 'Bonded')
+        ns_name (str): Named selection name
+        body_a (int): Contact body ID
+        body_b (int): Target body ID
+
+    Returns:
+        str: '<Type>_<NS>_<idA>_<idB>'
+    """
+    return f"{contact_type}_{ns_name}_{body_a}_{body_b}"
@@ -0,0 +1,334 @@
+"""
+ANSYS Workbench Mechanical - Initial Contact Status Pre-check
+==============================================================
+
+This script checks the initial contact status of the contact regions
+created by contacts.py before the model is solved, so that mis-scoped
+regions are caught in seconds instead of after a failed solve:
+- Regions that start open (Near Open / Far Open)
+- Regions with zero elements in contact
+- Regions whose initial penetration exceeds a threshold
+
+One Contact Tool covering all regions is added (or reused), the initial
+contact information is generated once, exported to a text file and parsed
+in one pass.
+
+Configuration is loaded from config/contact_precheck_config.yaml
+
+Usage:
+    Run this script from within ANSYS Workbench Mechanical using the scripting console
+    or as an external script file, or run main.py --precheck.
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: ExtAPI, Model, etc. are provided by ANSYS Mechanical runtime environment
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log, log_section, set_logging
+from utilities.named_selection_helper import invalidate_named_selection_cache
+from utilities.config_loader import load_yaml_config, get_config_path
+from utilities.state_helper import get_state_path, load_state
+
+
+EMBEDDED_CONFIG = {
+    'global_settings': {
+        'log_details': True,
+        'run_with_all': True,
+        'stop_on_errors': True,
+        'contact_tool_name': 'Contact_Precheck',
+        'regions': 'generated'
+    },
+    'checks': {
+        'open': 'error',
+        'zero_contacting': 'error',
+        'max_penetration': 0.1,
+        'penetration': 'warning'
+    }
+}
+
+CONTACTS_STATE_FILENAME = 'contacts_state.json'
+
+# Initial contact information columns (matched case-insensitively by prefix)
+COLUMN_NAME = 'name'
+COLUMN_STATUS = 'status'
+COLUMN_CONTACTING = 'number contacting'
+COLUMN_PENETRATION = 'penetration'
+OPEN_STATUSES = ('far open', 'near open')
+
+
+# ============================================================================
+# Contact Tool
+# ============================================================================
+
+def get_generated_contact_names(state_file=None):
+    """
+    Get the names of the contact regions created by contacts.py.
+
+    Args:
+        state_file (str): Contacts state file (default: state/<model>/contacts_state.json)
+
+    Returns:
+        set: Contact region names recorded by the last contacts.py run
+    """
+    state = load_state(state_file or get_state_path(CONTACTS_STATE_FILENAME))
+    return set(state.get('fingerprints', {}))
+
+
+def get_or_create_contact_tool(tool_name):
+    """
+    Find the pre-check Contact Tool by name or add it to the connections.
+
+    Args:
+        tool_name (str): Contact Tool name
+
+    Returns:
+        Contact Tool object
+    """
+    connections = ExtAPI.DataModel.Project.Model.Connections
+    for tool in connections.GetChildren(DataModelObjectCategory.ContactTool, True):
+        if tool.Name == tool_name:
+            log(f"Reusing Contact Tool '{tool_name}'")
+            return tool
+
+    tool = connections.AddContactTool()
+    tool.Name = tool_name
+    log(f"Created Contact Tool '{tool_name}'")
+    return tool
+
+
+def find_initial_information(tool):
+    """
+    Find the Initial Information object of a Contact Tool.
+
+    Looked up by category rather than position, since users can add other
+    results (or reorder them) under the tool.
+
+    Args:
+        tool: Contact Tool object
+
+    Returns:
+        Initial Information object, or None if the tool has none
+    """
+    for child in tool.GetChildren(DataModelObjectCategory.InitialInformation, False):
+        return child
+    return None
+
+
+def export_initial_information(tool, export_path):
+    """
+    Generate initial contact results once and export them to a text file.
+
+    Raises ValueError if the tool has no Initial Information object.
+
+    Args:
+        tool: Contact Tool object
+        export_path (str): Path of the exported text file
+
+    Returns:
+        str: Exported file content
+    """
+    initial_information = find_initial_information(tool)
+    if initial_information is None:
+        raise ValueError(f"Contact Tool '{tool.Name}' has no Initial Information object")
+    tool.GenerateInitialContactResults()
+    initial_information.ExportToTextFile(export_path)
+    with open(export_path, 'r') as f:
+        return f.read()
+
+
+# ============================================================================
+# Parsing and Checks
+# ============================================================================
+
+def _to_float(value):
+    try:
+        return float(str(value).strip().split()[0])
+    except (ValueError, IndexError):
+        return None
+
+
+def parse_initial_information(text):
+    """
+    Parse exported initial contact information (tab-separated, one header row).
+
+    Args:
+        text (str): Exported file content
+
+    Returns:
+        list: One dict per row with keys 'name', 'status', 'contacting'
+              and 'penetration' (None where a column is missing or blank)
+    """
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return []
+
+    header = [column.strip().lower() for column in lines[0].split('\t')]
+
+    def column(prefix):
+        for index, title in enumerate(header):
+            if title.startswith(prefix):
+                return index
+        return None
+
+    columns = {
+        'name': column(COLUMN_NAME),
+        'status': column(COLUMN_STATUS),
+        'contacting': column(COLUMN_CONTACTING),
+        'penetration': column(COLUMN_PENETRATION),
+    }
+
+    rows = []
+    for line in lines[1:]:
+        cells = line.split('\t')
+
+        def cell(key):
+            index = columns[key]
+            return cells[index].strip() if index is not None and index < len(cells) else None
+
+        rows.append({
+            'name': cell('name'),
+            'status': cell('status'),
+            'contacting': _to_float(cell('contacting')),
+            'penetration': _to_float(cell('penetration')),
+        })
+    return rows
+
+
+def evaluate_initial_status(rows, checks, region_names=None):
+    """
+    Flag regions that are open, have no elements in contact, or are over-penetrated.
+
+    Args:
+        rows (list): Parsed rows from parse_initial_information
+        checks (dict): Severity per check ('error', 'warning' or 'off') and max_penetration
+        region_names (set): Optional region names to check (default: all rows)
+
+    Returns:
+        dict: Report with keys:
+            - errors: List of {'region', 'message'}
+            - warnings: List of {'region', 'message'}
+            - checked: Number of regions checked
+    """
+    report = {'errors': [], 'warnings': [], 'checked': 0}
+
+    def issue(check, region, message):
+        severity = checks.get(check, EMBEDDED_CONFIG['checks'][check])
+        if severity in ('error', 'warning'):
+            report[severity + 's'].append({'region': region, 'message': message})
+
+    max_penetration = checks.get('max_penetration', EMBEDDED_CONFIG['checks']['max_penetration'])
+
+    for row in rows:
+        name = row['name']
+        if region_names is not None and name not in region_names:
+            continue
+        report['checked'] += 1
+
+        status = (row['status'] or '').lower()
+        if status in OPEN_STATUSES:
+            issue('open', name, f"Initially {row['status']}")
+        if row['contacting'] is not None and row['contacting'] == 0:
+            issue('zero_contacting', name, "No elements in contact")
+        if row['penetration'] is not None and row['penetration'] > max_penetration:
+            issue('penetration', name,
+                  f"Initial penetration {row['penetration']:.4g} exceeds {max_penetration}")
+
+    return report
+
+
+def log_report(report):
+    """
+    Log a pre-check report.
+
+    Args:
+        report (dict): Report from evaluate_initial_status
+    """
+    log(f"Checked {report['checked']} contact region(s)")
+    for kind, level in (('errors', 'ERROR'), ('warnings', 'WARNING')):
+        for entry in report[kind]:
+            log(f"{entry['region']}: {entry['message']}", level)
+    log(f"Pre-check finished: {len(report['errors'])} error(s), {len(report['warnings'])} warning(s)")
+
+
+# ============================================================================
+# Main Processing
+# ============================================================================
+
+def load_config():
+    """
+    Load configuration from YAML file, with fallback to embedded config.
+
+    Returns:
+        dict: Configuration dictionary
+    """
+    try:
+        config_path = get_config_path('contact_precheck_config.yaml')
+        config = load_yaml_config(config_path)
+        log(f"Loaded configuration from: {config_path}")
+        return config
+    except (ImportError, FileNotFoundError) as e:
+        log(f"Could not load YAML config: {str(e)}", "WARNING")
+        log("Using embedded configuration")
+        return EMBEDDED_CONFIG
+
+
+def run_from_config(config):
+    """
+    Run the initial contact status pre-check based on configuration dictionary.
+
+    Args:
+        config (dict): Configuration dictionary
+
+    Returns:
+        dict: Pre-check report (see evaluate_initial_status)
+    """
+    global_settings = config.get('global_settings', {})
+    set_logging(global_settings.get('log_details', True))
+    invalidate_named_selection_cache()
+    log_section("ANSYS Mechanical - Initial Contact Status Pre-check")
+
+    region_names = None
+    if global_settings.get('regions', 'generated') == 'generated':
+        region_names = get_generated_contact_names(global_settings.get('contacts_state_file'))
+        if not region_names:
+            log("No contact regions recorded by contacts.py; checking all regions", "WARNING")
+            region_names = None
+
+    export_path = global_settings.get('export_file') or get_state_path('contact_initial_information.txt')
+    export_directory = os.path.dirname(export_path)
+    if export_directory and not os.path.exists(export_directory):
+        os.makedirs(export_directory)
+
+    try:
+        tool = get_or_create_contact_tool(global_settings.get('contact_tool_name', 'Contact_Precheck'))
+        text = export_initial_information(tool, export_path)
+    except Exception as e:
+        log(f"Could not evaluate initial contact information: {str(e)}", "ERROR")
+        return {'errors': [{'region': '-', 'message': f"Initial contact information unavailable: {str(e)}"}],
+                'warnings': [], 'checked': 0}
+
+    rows = parse_initial_information(text)
+    report = evaluate_initial_status(rows, config.get('checks', {}), region_names)
+    log_report(report)
+    return report
+
+
+def main():
+    """
+    Main function to pre-check the initial status of all contact regions.
+
+    Returns:
+        dict: Pre-check report
+    """
+    return run_from_config(load_config())
+
+
+# Run the script
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,19 @@ ANSYS Workbench Mechanical - Automated Contact Creation
 This script automates the creation of contact regions based on named selections.
 Supports both bonded and frictional contacts with customizable parameters.
 
+Two detection modes are available:
+- all_bodies: one region per named selection searching across all bodies
+- pairwise: one explicit region per body pair whose surfaces come within
+  the pinball distance (see contact_detection.py)
+
+Re-running is idempotent: regions are reconciled by name and fingerprint
+(recorded in state/<model>/contacts_state.json), unchanged regions are left alone,
+changed ones are updated in place and orphaned ones are removed.
+
+Contact settings come from named contact profiles. New regions are cloned
+from one configured template region per profile, so each clone only needs
+its name and scoping; the templates are deleted afterwards.
+
 Configuration is loaded from config/contact_config.yaml
 
 Usage:
@@ -23,139 +36,417 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utilities.logging_config import log, log_section, set_logging
-from utilities.named_selection_helper import get_named_selection, refresh_tree
+from utilities.named_selection_helper import get_named_selection, refresh_tree, invalidate_named_selection_cache
+from utilities.state_helper import (get_state_path, load_state, save_state, compute_fingerprint,
+                                   reconcile_objects)
+from preprocessing.contact_detection import detect_contact_pairs, contact_region_name, auto_pinball_radius
+
+
+DETECTION_ALL_BODIES = 'all_bodies'
+DETECTION_PAIRWISE = 'pairwise'
+
+PINBALL_FIXED = 'fixed'
+PINBALL_AUTO = 'auto'
 
+STATE_FILENAME = 'contacts_state.json'
 
-def create_bonded_contacts(named_selection_name, named_selection, pinball_radius=1.0):
+TEMPLATE_PREFIX = '_Template_'
+
+
+def configure_bonded_contact(contact_region, pinball_radius=1.0):
     """
-    Create automatic bonded contacts between bodies in a named selection.
-    Uses MPC formulation for better efficiency and robustness.
+    Apply bonded contact settings (MPC formulation) to a contact region.
 
     Args:
-        named_selection_name (str): Name of the named selection
-        named_selection: Named selection object
+        contact_region: Contact region object
         pinball_radius (float): Pinball radius in mm
     """
-    log(f"\n--- Creating Bonded Contacts for '{named_selection_name}' ---")
+    contact_region.ContactType = ContactType.Bonded
+    contact_region.ContactFormulation = ContactFormulation.MPC
+    contact_region.Behavior = ContactBehavior.Asymmetric
+    contact_region.DetectionMethod = ContactDetectionPoint.NodalProjectedNormalFromContact
 
-    try:
-        # Create contact region
-        connections = ExtAPI.DataModel.Project.Model.Connections
-        contact_region = connections.AddContactRegion()
-        contact_region.Name = f"Bonded_{named_selection_name}"
+    contact_region.PinballRegion = ContactPinballType.Radius
+    contact_region.PinballRadius = Quantity(pinball_radius, "mm")
 
-        # Scope to named selection
-        contact_region.SourceLocation = named_selection
-        contact_region.TargetLocation = named_selection
 
-        # Configure as bonded with MPC formulation (best practice per ANSYS docs)
-        contact_region.ContactType = ContactType.Bonded
-        contact_region.ContactFormulation = ContactFormulation.MPC
-        contact_region.Behavior = ContactBehavior.Asymmetric
-        contact_region.DetectionMethod = ContactDetectionPoint.NodalProjectedNormalFromContact
+def configure_frictional_contact(contact_region, friction_coefficient=0.2, pinball_radius=1.0):
+    """
+    Apply frictional contact settings (Augmented Lagrange) to a contact region.
 
-        # Set pinball radius for automatic detection
-        contact_region.PinballRegion = ContactPinballType.Radius
-        contact_region.PinballRadius = Quantity(pinball_radius, "mm")
+    Args:
+        contact_region: Contact region object
+        friction_coefficient (float): Coefficient of friction
+        pinball_radius (float): Pinball radius in mm
+    """
+    contact_region.ContactType = ContactType.Frictional
+    contact_region.ContactFormulation = ContactFormulation.AugmentedLagrange
+    contact_region.Behavior = ContactBehavior.Asymmetric
+    contact_region.DetectionMethod = ContactDetectionPoint.NodalProjectedNormalFromContact
 
-        # Use automatic contact detection across all bodies
-        contact_region.SearchAcross = ContactSearchAcrossType.AllBodies
+    contact_region.FrictionCoefficient = friction_coefficient
+    contact_region.DynamicCoefficient = friction_coefficient
 
-        log(f"  Contact Type: Bonded")
-        log(f"  Formulation: MPC")
-        log(f"  Behavior: Asymmetric")
-        log(f"  Pinball Radius: {pinball_radius} mm")
-        log(f"Successfully created bonded contact region: {contact_region.Name}")
+    contact_region.PinballRegion = ContactPinballType.Radius
+    contact_region.PinballRadius = Quantity(pinball_radius, "mm")
 
-    except Exception as e:
-        log(f"Error creating bonded contacts: {str(e)}", "ERROR")
+    contact_region.UpdateStiffness = UpdateContactStiffness.EachIteration
+    contact_region.InterfaceTreatment = ContactInterfaceTreatmentType.AdjustToTouch
 
 
-def create_frictional_contacts(named_selection_name, named_selection, friction_coefficient=0.2, pinball_radius=1.0):
+def resolve_contact_profile(contact_config, profiles):
     """
-    Create automatic frictional contacts between bodies in a named selection.
-    Uses Augmented Lagrange formulation with proper behavior settings.
+    Resolve the contact profile of a contact definition.
+
+    A definition either names a profile from contact_profiles or gives the
+    type and friction coefficient inline, which forms an implicit profile.
+
+    Args:
+        contact_config (dict): Contact definition (profile, or type / friction_coefficient)
+        profiles (dict): Contact profiles from the configuration
+
+    Returns:
+        tuple: (profile_name, profile dict with lower-case 'type'), or (None, None) if unknown
+    """
+    profile_name = contact_config.get("profile")
+    if profile_name is not None:
+        if profile_name not in profiles:
+            log(f"Unknown contact profile '{profile_name}'", "WARNING")
+            return None, None
+        profile = dict(profiles[profile_name])
+    else:
+        profile = {key: value for key, value in contact_config.items() if key != "detection"}
+
+    profile['type'] = profile.get("type", "bonded").lower()
+    if profile['type'] == "frictional":
+        profile.setdefault("friction_coefficient", 0.2)
+    else:
+        profile.pop("friction_coefficient", None)
+
+    if profile_name is None:
+        profile_name = profile['type']
+        if 'friction_coefficient' in profile:
+            profile_name += f"_mu{profile['friction_coefficient']}"
+    return profile_name, profile
+
+
+def configure_contact_profile(contact_region, profile, pinball_radius=1.0):
+    """
+    Apply a contact profile to a contact region.
+
+    The type defaults (configure_bonded_contact / configure_frictional_contact)
+    are applied first, then any optional overrides of the profile.
+
+    Args:
+        contact_region: Contact region object
+        profile (dict): Contact profile (type, friction_coefficient, optional overrides)
+        pinball_radius (float): Pinball radius in mm
+    """
+    if profile['type'] == "frictional":
+        configure_frictional_contact(contact_region, profile['friction_coefficient'], pinball_radius)
+    else:
+        configure_bonded_contact(contact_region, pinball_radius)
+
+    # Optional overrides: profile key -> (region property, enum of its values)
+    overrides = {
+        'formulation': ('ContactFormulation', ContactFormulation),
+        'behavior': ('Behavior', ContactBehavior),
+        'detection_method': ('DetectionMethod', ContactDetectionPoint),
+        'update_stiffness': ('UpdateStiffness', UpdateContactStiffness),
+        'interface_treatment': ('InterfaceTreatment', ContactInterfaceTreatmentType),
+    }
+    for key, (attribute, enum) in overrides.items():
+        if key in profile:
+            setattr(contact_region, attribute, getattr(enum, profile[key]))
+
+
+def plan_all_bodies_contact(named_selection_name, named_selection, profile_name, profile, pinball_radius=1.0):
+    """
+    Plan one contact region per named selection searching across all bodies.
+
+    Bonded regions use the MPC formulation, frictional regions Augmented
+    Lagrange (see configure_bonded_contact / configure_frictional_contact).
 
     Args:
         named_selection_name (str): Name of the named selection
         named_selection: Named selection object
-        friction_coefficient (float): Coefficient of friction
+        profile_name (str): Contact profile name
+        profile (dict): Contact profile (see resolve_contact_profile)
         pinball_radius (float): Pinball radius in mm
+
+    Returns:
+        dict: Contact region specification (see apply_contact_spec)
     """
-    log(f"\n--- Creating Frictional Contacts for '{named_selection_name}' ---")
+    return {
+        'name': f"{profile['type'].capitalize()}_{named_selection_name}",
+        'named_selection': named_selection_name,
+        'profile_name': profile_name,
+        'profile': profile,
+        'pinball_radius': pinball_radius,
+        'source': named_selection,
+        'target': named_selection,
+        'scope_key': ['ns', named_selection_name],
+        'search_all_bodies': True
+    }
+
+
+def plan_pairwise_contacts(named_selection_name, named_selection, profile_name, profile,
+                           pinball_radius=1.0, pairwise_config=None, pinball_config=None):
+    """
+    Plan one explicit contact region per body pair that comes within the pinball distance.
 
-    try:
-        # Create contact region
-        connections = ExtAPI.DataModel.Project.Model.Connections
-        contact_region = connections.AddContactRegion()
-        contact_region.Name = f"Frictional_{named_selection_name}"
+    Regions are named <Type>_<NamedSelection>_<BodyA>_<BodyB> and scoped to
+    the faces of body A (contact) and body B (target) that were found close
+    to each other.
 
-        # Scope to named selection
-        contact_region.SourceLocation = named_selection
-        contact_region.TargetLocation = named_selection
+    With pinball mode 'auto', pinball_radius is only the search distance and
+    each region gets the smallest radius that covers its point-to-surface
+    interface gaps (see auto_pinball_radius). The default mode is 'fixed'.
 
-        # Configure contact type and formulation
-        contact_region.ContactType = ContactType.Frictional
-        contact_region.ContactFormulation = ContactFormulation.AugmentedLagrange
-        contact_region.Behavior = ContactBehavior.Asymmetric
-        contact_region.DetectionMethod = ContactDetectionPoint.NodalProjectedNormalFromContact
+    Args:
+        named_selection_name (str): Name of the named selection
+        named_selection: Named selection object
+        profile_name (str): Contact profile name
+        profile (dict): Contact profile (see resolve_contact_profile)
+        pinball_radius (float): Pinball radius in mm
+        pairwise_config (dict): Pairwise detection settings (length_scale, samples_per_direction)
+        pinball_config (dict): Pinball settings (mode, safety_factor, min_radius, max_radius, percentile)
 
-        # Friction coefficients (static and dynamic)
-        contact_region.FrictionCoefficient = friction_coefficient
-        contact_region.DynamicCoefficient = friction_coefficient
+    Returns:
+        list: Contact region specifications (see apply_contact_spec)
+    """
+    pairwise_config = pairwise_config or {}
+    pinball_config = pinball_config or {}
+    pinball_mode = pinball_config.get('mode', PINBALL_FIXED)
+    contact_type = profile['type']
+    length_scale = pairwise_config.get('length_scale', 1000.0)
+
+    log(f"\n--- Detecting {contact_type} contact pairs for '{named_selection_name}' ---")
+
+    pairs = detect_contact_pairs(named_selection, pinball_radius / length_scale,
+                                 pairwise_config.get('samples_per_direction', 5))
+    if not pairs:
+        log(f"No body pairs within {pinball_radius} mm found in '{named_selection_name}'", "WARNING")
+        return []
+
+    specs = []
+    for (body_a, body_b), pair in sorted(pairs.items()):
+        radius = pinball_radius
+        if pinball_mode == PINBALL_AUTO:
+            radius = auto_pinball_radius(pair['gaps'] * length_scale,
+                                         pinball_config.get('safety_factor', 1.5),
+                                         pinball_config.get('min_radius', 0.1),
+                                         pinball_config.get('max_radius', pinball_radius),
+                                         pinball_config.get('percentile', 95.0))
+        name = contact_region_name(contact_type.capitalize(), named_selection_name, body_a, body_b)
+        specs.append({
+            'name': name,
+            'named_selection': named_selection_name,
+            'profile_name': profile_name,
+            'profile': profile,
+            'pinball_radius': radius,
+            'source': pair['source'],
+            'target': pair['target'],
+            'scope_key': ['faces', pair['source'], pair['target']],
+            'search_all_bodies': False
+        })
+        log(f"  {name}: {len(pair['source'])} contact / {len(pair['target'])} target face(s), "
+            f"min gap {pair['min_gap'] * length_scale:.4g} mm, pinball {radius:.4g} mm")
+
+    return specs
+
+
+def contact_fingerprint(spec):
+    """
+    Compute the fingerprint of a contact region specification.
 
-        # Set pinball radius for contact detection
-        contact_region.PinballRegion = ContactPinballType.Radius
-        contact_region.PinballRadius = Quantity(pinball_radius, "mm")
+    Args:
+        spec (dict): Contact region specification
 
-        # Update stiffness each iteration (best for nonlinear)
-        contact_region.UpdateStiffness = UpdateContactStiffness.EachIteration
+    Returns:
+        str: Fingerprint of profile settings, pinball radius, scoping and search mode
+    """
+    return compute_fingerprint('contact', spec['profile'], round(float(spec['pinball_radius']), 9),
+                               spec['scope_key'], spec['search_all_bodies'])
+
+
+def _location(scope):
+    """Return a named selection as-is, or a selection of geometry entity IDs."""
+    if isinstance(scope, (list, tuple)):
+        selection = ExtAPI.SelectionManager.CreateSelectionInfo(SelectionTypeEnum.GeometryEntities)
+        selection.Ids = list(scope)
+        return selection
+    return scope
 
-        # Interface treatment: Adjust to Touch (eliminates initial gaps)
-        contact_region.InterfaceTreatment = ContactInterfaceTreatmentType.AdjustToTouch
 
+def apply_contact_spec(contact_region, spec):
+    """
+    Apply a contact region specification: name, scoping and contact settings.
+
+    Args:
+        contact_region: Contact region object (new or existing)
+        spec (dict): Contact region specification with keys name, profile_name,
+            profile, pinball_radius, source, target (named selection or
+            list of face IDs) and search_all_bodies
+    """
+    contact_region.Name = spec['name']
+    contact_region.SourceLocation = _location(spec['source'])
+    contact_region.TargetLocation = _location(spec['target'])
+
+    configure_contact_profile(contact_region, spec['profile'], spec['pinball_radius'])
+
+    if spec['search_all_bodies']:
         # Use automatic contact detection across all bodies
         contact_region.SearchAcross = ContactSearchAcrossType.AllBodies
 
-        log(f"  Contact Type: Frictional")
-        log(f"  Friction Coefficient (Static): {friction_coefficient}")
-        log(f"  Friction Coefficient (Dynamic): {friction_coefficient}")
-        log(f"  Formulation: Augmented Lagrange")
-        log(f"  Behavior: Asymmetric")
-        log(f"  Detection Method: Nodal Projected Normal From Contact")
-        log(f"  Update Stiffness: Each Iteration")
-        log(f"  Interface Treatment: Adjust to Touch")
-        log(f"  Pinball Radius: {pinball_radius} mm")
-        log(f"Successfully created frictional contact region: {contact_region.Name}")
 
-    except Exception as e:
-        log(f"Error creating frictional contacts: {str(e)}", "ERROR")
+def create_profile_template(connections, profile_name, profile, pinball_radius):
+    """
+    Add a fully configured template region for a contact profile.
+
+    Args:
+        connections: Model connections object
+        profile_name (str): Contact profile name
+        profile (dict): Contact profile
+        pinball_radius (float): Pinball radius of the template in mm
+
+    Returns:
+        Template contact region (unscoped)
+    """
+    template = connections.AddContactRegion()
+    template.Name = f"{TEMPLATE_PREFIX}{profile_name}"
+    configure_contact_profile(template, profile, pinball_radius)
+    return template
+
+
+def clone_contact_region(template, template_radius, spec):
+    """
+    Clone a profile template and assign only what differs per region.
+
+    Args:
+        template: Template contact region of the spec's profile
+        template_radius (float): Pinball radius of the template in mm
+        spec (dict): Contact region specification
+
+    Returns:
+        Cloned contact region
+    """
+    contact_region = template.Duplicate()
+    contact_region.Name = spec['name']
+    contact_region.SourceLocation = _location(spec['source'])
+    contact_region.TargetLocation = _location(spec['target'])
+
+    if spec['pinball_radius'] != template_radius:
+        contact_region.PinballRadius = Quantity(spec['pinball_radius'], "mm")
+    if spec['search_all_bodies']:
+        contact_region.SearchAcross = ContactSearchAcrossType.AllBodies
+    return contact_region
+
+
+def index_contact_regions():
+    """
+    Index all contact regions of the model by name in one tree walk.
+
+    Returns:
+        dict: Mapping of contact region name -> list of contact regions
+    """
+    index = {}
+    connections = ExtAPI.DataModel.Project.Model.Connections
+    for region in connections.GetChildren(DataModelObjectCategory.ContactRegion, True):
+        index.setdefault(region.Name, []).append(region)
+    return index
+
+
+def reconcile_contacts(specs, registry=None, unsettled=()):
+    """
+    Reconcile contact regions with their specifications in one transaction.
+
+    Existing regions are matched by name. A region whose recorded
+    fingerprint matches its specification is left alone, a changed one is
+    updated in place, a missing one is created, and extra regions sharing
+    a planned name (duplicates from earlier runs) are deleted. Regions
+    recorded in the registry that are no longer planned are orphans and
+    are deleted, unless their named selection could not be planned this
+    run; regions created by hand are never touched.
+
+    Missing regions are cloned from one template region per contact
+    profile, created on first use and deleted at the end of the transaction.
+
+    Args:
+        specs (list): Contact region specifications
+        registry (dict): Optional name -> {'owner', 'fingerprint'} registry (updated in place)
+        unsettled (iterable): Configured named selections that could not be planned
+
+    Returns:
+        dict: Counts of 'created', 'updated', 'unchanged', 'deleted' and 'failed' regions
+    """
+    tracked = registry if registry is not None else {}
+    index = index_contact_regions()
+    connections = ExtAPI.DataModel.Project.Model.Connections
+    templates = {}
+
+    def create(spec):
+        profile_name = spec['profile_name']
+        if profile_name not in templates:
+            templates[profile_name] = (
+                create_profile_template(connections, profile_name, spec['profile'], spec['pinball_radius']),
+                spec['pinball_radius'])
+        template, template_radius = templates[profile_name]
+        return clone_contact_region(template, template_radius, spec)
+
+    def update(region, spec, recorded):
+        apply_contact_spec(region, spec)
+        return True
+
+    items = [dict(spec, owner=spec['named_selection'], fingerprint=contact_fingerprint(spec)) for spec in specs]
+    with Transaction():
+        counts, _ = reconcile_objects(items, index, tracked, create, update, unsettled, label='contact region')
+        for template, _ in templates.values():
+            template.Delete()
+
+    return counts
 
 
 def run_from_config(config):
     """
     Run contact automation based on configuration dictionary.
 
+    All contact regions are planned first and then reconciled against the
+    model in one transaction with one tree refresh, so re-running the
+    script never creates duplicates.
+
     Args:
         config (dict): Configuration dictionary with contacts and settings
     """
     # Get global settings
     global_settings = config.get('global_settings', {})
     pinball_radius = global_settings.get('pinball_radius', 1.0)
+    default_detection = global_settings.get('detection', DETECTION_ALL_BODIES)
+    pairwise_config = config.get('pairwise', {})
+    pinball_config = dict(config.get('pinball', {}))
+    pinball_config['mode'] = global_settings.get('pinball_mode', PINBALL_FIXED)
+    state_file = global_settings.get('state_file') or get_state_path(STATE_FILENAME)
+    profiles = config.get('contact_profiles', {}) or {}
     log_enabled = global_settings.get('log_details', True)
     set_logging(log_enabled)
 
+    invalidate_named_selection_cache()
     log_section("ANSYS Mechanical - Automated Contact Creation Script")
-    log(f"Pinball Radius: {pinball_radius} mm\n")
+    log(f"Pinball Radius: {pinball_radius} mm")
+    log(f"Detection: {default_detection}")
+    log(f"Pinball Mode: {pinball_config['mode']}\n")
 
     # Get contact definitions
-    contacts = config.get('contacts', {})
+    contacts = config.get('contacts', {}) or {}
 
     if not contacts:
         log("No contact configurations defined in config file.", "WARNING")
         return
 
-    # Process each named selection
+    # Plan every contact region before touching the model; named selections
+    # that cannot be planned keep their existing regions
+    specs = []
+    unsettled = []
     for ns_name, contact_config in contacts.items():
         log(f"\nProcessing Named Selection: '{ns_name}'")
 
@@ -163,24 +454,47 @@ def run_from_config(config):
         named_selection = get_named_selection(ns_name)
 
         if not named_selection:
+            unsettled.append(ns_name)
             continue
 
-        # Create contacts based on type
-        contact_type = contact_config.get("type", "bonded").lower()
+        profile_name, profile = resolve_contact_profile(contact_config, profiles)
+        detection = contact_config.get("detection", default_detection)
+
+        if profile is None:
+            unsettled.append(ns_name)
+            continue
 
-        if contact_type == "bonded":
-            create_bonded_contacts(ns_name, named_selection, pinball_radius)
+        elif profile['type'] not in ("bonded", "frictional"):
+            log(f"Unknown contact type '{profile['type']}' for '{ns_name}'", "WARNING")
+            unsettled.append(ns_name)
 
-        elif contact_type == "frictional":
-            friction_coef = contact_config.get("friction_coefficient", 0.2)
-            create_frictional_contacts(ns_name, named_selection, friction_coef, pinball_radius)
+        elif detection == DETECTION_PAIRWISE:
+            specs.extend(plan_pairwise_contacts(ns_name, named_selection, profile_name, profile,
+                                                pinball_radius, pairwise_config, pinball_config))
 
         else:
-            log(f"Unknown contact type '{contact_type}' for '{ns_name}'", "WARNING")
+            specs.append(plan_all_bodies_contact(ns_name, named_selection, profile_name, profile,
+                                                 pinball_radius))
+
+    # Reconcile with existing regions (one transaction)
+    log("")
+    state = load_state(state_file)
+    counts = reconcile_contacts(specs, state.setdefault('fingerprints', {}), unsettled)
+    save_state(state_file, state)
 
     # Refresh tree to show new contacts
     refresh_tree()
 
+    log("")
+    log(f"Contact regions: {counts['created']} created, {counts['updated']} updated, "
+        f"{counts['unchanged']} unchanged, {counts['deleted']} deleted")
+
+    if pinball_config['mode'] == PINBALL_AUTO and specs:
+        log("")
+        log("Pinball radii:")
+        for spec in sorted(specs, key=lambda spec: spec['name']):
+            log(f"  {spec['name']}: {spec['pinball_radius']:.4g} mm")
+
     log("")
     log_section("Contact creation complete!")
 
@@ -208,7 +522,23 @@ def main():
         config = {
             'global_settings': {
                 'pinball_radius': 1.0,
-                'log_details': True
+                'log_details': True,
+                'detection': DETECTION_ALL_BODIES,
+                'pinball_mode': PINBALL_FIXED,
+                'state_file': None
+            },
+            'pinball': {
+                'safety_factor': 1.5,
+                'min_radius': 0.1,
+                'percentile': 95.0
+            },
+            'pairwise': {
+                'length_scale': 1000.0,
+                'samples_per_direction': 5
+            },
+            'contact_profiles': {
+                'bonded': {'type': 'bonded'},
+                'frictional': {'type': 'frictional', 'friction_coefficient': 0.2}
             },
             'contacts': {
                 # Add your configurations here if running without YAML support
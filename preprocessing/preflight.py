@@ -0,0 +1,323 @@
+"""
+ANSYS Workbench Mechanical - Pre-flight Model Validation
+=========================================================
+
+This script checks every named selection configured for contacts, bolt
+pretensions and bolt force extraction in one batched pass, and reports all
+problems up front instead of failing one at a time mid-run:
+- Missing or empty named selections
+- Edges or vertices where faces are required
+- Faces without an owning body
+- Inconsistent normals of planar faces (flip the sign of bolt axial forces)
+
+Configuration is loaded from config/preflight_config.yaml
+
+Usage:
+    Run this script from within ANSYS Workbench Mechanical using the scripting console
+    or as an external script file, or run main.py --validate.
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: ExtAPI, Model, GeoCellTypeEnum, GeoSurfaceTypeEnum, etc. are provided by ANSYS Mechanical runtime environment
+
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log, log_section, set_logging
+from utilities.config_loader import load_yaml_config, get_config_path
+from utilities.named_selection_helper import (normalize_named_selection_list, get_named_selection_ids,
+                                              invalidate_named_selection_cache)
+
+
+EMBEDDED_CONFIG = {
+    'global_settings': {
+        'log_details': True,
+        'run_with_all': True,
+        'stop_on_errors': True
+    },
+    'normal_check': {
+        'enabled': True,
+        'angle_tolerance': 10.0
+    }
+}
+
+# Usages and the geometry they require
+USAGE_CONTACTS = 'contacts'
+USAGE_PRETENSIONS = 'bolt_pretensions'
+USAGE_EXTRACTION = 'bolt_force_extraction'
+FACE_USAGES = (USAGE_PRETENSIONS, USAGE_EXTRACTION)
+
+
+# ============================================================================
+# Configuration Collection
+# ============================================================================
+
+def _load_optional_config(filename):
+    try:
+        return load_yaml_config(get_config_path(filename)) or {}
+    except Exception as e:
+        log(f"Could not load {filename}: {str(e)}", "WARNING")
+        return {}
+
+
+def collect_named_selection_usages():
+    """
+    Collect every configured named selection and the workflows that use it.
+
+    The extraction named selections are left out when the extraction reads
+    the beams of the screening model (source: beams), since they are not
+    used then.
+
+    Returns:
+        dict: Mapping of named selection name -> list of usages
+    """
+    usages = {}
+
+    def add(names, usage):
+        for name in names:
+            usages.setdefault(name, [])
+            if usage not in usages[name]:
+                usages[name].append(usage)
+
+    contact_config = _load_optional_config('contact_config.yaml')
+    add(list((contact_config.get('contacts') or {}).keys()), USAGE_CONTACTS)
+
+    pretension_config = _load_optional_config('bolt_pretension_config.yaml')
+    pretensions = pretension_config.get('bolt_pretensions')
+    if not pretensions:
+        from preprocessing.bolt_pretensions import BOLT_PRETENSION_CONFIGS
+        pretensions = BOLT_PRETENSION_CONFIGS
+    add(list(pretensions.keys()), USAGE_PRETENSIONS)
+
+    from postprocessing.bolt_force_extraction import load_config as load_extraction_config
+    extraction_config = load_extraction_config()
+    if extraction_config.get('source', 'faces') != 'beams':
+        add(normalize_named_selection_list(extraction_config.get('named_selections', [])), USAGE_EXTRACTION)
+
+    return usages
+
+
+# ============================================================================
+# Checks
+# ============================================================================
+
+def _entity_kind(entity):
+    entity_type = entity.Type
+    if entity_type == GeoCellTypeEnum.GeoFace:
+        return 'face'
+    if entity_type == GeoCellTypeEnum.GeoBody:
+        return 'body'
+    if entity_type == GeoCellTypeEnum.GeoEdge:
+        return 'edge'
+    if entity_type == GeoCellTypeEnum.GeoVertex:
+        return 'vertex'
+    return 'other'
+
+
+def _planar_face_normal(entity):
+    """Normal of a planar face, or None for curved faces (their normal varies over the face)."""
+    try:
+        if entity.SurfaceType != GeoSurfaceTypeEnum.GeoSurfacePlane:
+            return None
+        return [float(v) for v in entity.NormalAtParam(0.5, 0.5)]
+    except Exception:
+        return None
+
+
+def find_flipped_normals(face_ids, normals, angle_tolerance):
+    """
+    Find faces whose normals point opposite to parallel faces in the same set.
+
+    Faces are grouped by unsigned direction; within each group the faces in
+    the minority orientation are reported.
+
+    Args:
+        face_ids (list): Face IDs
+        normals: (N, 3) face normals
+        angle_tolerance (float): Maximum angle between parallel faces in degrees
+
+    Returns:
+        list: Face IDs with flipped normals
+    """
+    normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = lengths > 0
+    normals = normals[valid] / lengths[valid, None]
+    face_ids = np.asarray(face_ids)[valid]
+
+    cos_tolerance = np.cos(np.radians(angle_tolerance))
+    unassigned = np.ones(len(face_ids), dtype=bool)
+    flipped = []
+
+    while np.any(unassigned):
+        seed = np.flatnonzero(unassigned)[0]
+        dots = normals @ normals[seed]
+        group = unassigned & (np.abs(dots) >= cos_tolerance)
+        unassigned &= ~group
+
+        same = group & (dots > 0)
+        opposite = group & (dots < 0)
+        if np.any(opposite):
+            minority = opposite if opposite.sum() <= same.sum() else same
+            flipped.extend(face_ids[minority].tolist())
+
+    return sorted(flipped)
+
+
+def validate_named_selections(usages, normal_check=None):
+    """
+    Validate all named selections in one batched pass.
+
+    Named selections are resolved through the shared resolution cache, and
+    every geometry entity is looked up once even if it appears in several
+    named selections.
+
+    Args:
+        usages (dict): Mapping of named selection name -> list of usages
+        normal_check (dict): Normal check settings (enabled, angle_tolerance)
+
+    Returns:
+        dict: Validation report with keys:
+            - errors: List of {'named_selection', 'usages', 'message'}
+            - warnings: List of {'named_selection', 'usages', 'message'}
+            - checked: Number of named selections checked
+    """
+    normal_check = normal_check or {}
+    report = {'errors': [], 'warnings': [], 'checked': len(usages)}
+
+    def issue(kind, name, message):
+        report[kind].append({'named_selection': name, 'usages': usages[name], 'message': message})
+
+    geo_data = ExtAPI.DataModel.GeoData
+    entity_cache = {}
+
+    for name in sorted(usages):
+        ids = get_named_selection_ids(name)
+        if ids is None:
+            issue('errors', name, "Named selection not found or unreadable")
+            continue
+        if not ids:
+            issue('errors', name, "Named selection is empty")
+            continue
+
+        for entity_id in ids:
+            if entity_id not in entity_cache:
+                entity_cache[entity_id] = geo_data.GeoEntityById(entity_id)
+        entities = [entity_cache[entity_id] for entity_id in ids]
+        kinds = [_entity_kind(entity) for entity in entities]
+
+        needs_faces = any(usage in FACE_USAGES for usage in usages[name])
+        if needs_faces:
+            wrong = [kind for kind in kinds if kind != 'face']
+            if wrong:
+                counts = {kind: wrong.count(kind) for kind in set(wrong)}
+                summary = ', '.join(f"{count} {kind}(s)" for kind, count in sorted(counts.items()))
+                issue('errors', name, f"Faces required but found {summary}")
+
+            faces = [entity for entity, kind in zip(entities, kinds) if kind == 'face']
+            orphans = [face.Id for face in faces if not face.Bodies or len(face.Bodies) == 0]
+            if orphans:
+                issue('errors', name, f"Faces without an owning body: {orphans}")
+
+            if normal_check.get('enabled', True) and len(faces) > 1:
+                # Only planar faces have one normal; the normal of a cylindrical
+                # shank face depends on where it is evaluated
+                planar = [(face.Id, _planar_face_normal(face)) for face in faces]
+                planar = [(face_id, normal) for face_id, normal in planar if normal is not None]
+                flipped = find_flipped_normals([face_id for face_id, _ in planar],
+                                               [normal for _, normal in planar],
+                                               normal_check.get('angle_tolerance', 10.0))
+                if flipped:
+                    issue('warnings', name,
+                          f"Inconsistent face normals (axial force sign flips): faces {flipped}")
+
+        if USAGE_CONTACTS in usages[name]:
+            if any(kind in ('edge', 'vertex') for kind in kinds):
+                issue('errors', name, "Contacts require bodies or faces, found edges/vertices")
+            bodies = set()
+            for entity, kind in zip(entities, kinds):
+                if kind == 'body':
+                    bodies.add(entity.Id)
+                elif kind == 'face':
+                    bodies.update(body.Id for body in entity.Bodies)
+            if len(bodies) < 2:
+                issue('warnings', name, f"Contacts need at least 2 bodies, found {len(bodies)}")
+
+    return report
+
+
+def log_report(report):
+    """
+    Log a validation report.
+
+    Args:
+        report (dict): Report from validate_named_selections
+    """
+    log(f"Checked {report['checked']} named selection(s)")
+    for kind, level in (('errors', 'ERROR'), ('warnings', 'WARNING')):
+        for entry in report[kind]:
+            log(f"{entry['named_selection']} ({', '.join(entry['usages'])}): {entry['message']}", level)
+    log(f"Validation finished: {len(report['errors'])} error(s), {len(report['warnings'])} warning(s)")
+
+
+# ============================================================================
+# Main Processing
+# ============================================================================
+
+def load_config():
+    """
+    Load configuration from YAML file, with fallback to embedded config.
+
+    Returns:
+        dict: Configuration dictionary
+    """
+    try:
+        config_path = get_config_path('preflight_config.yaml')
+        config = load_yaml_config(config_path)
+        log(f"Loaded configuration from: {config_path}")
+        return config
+    except (ImportError, FileNotFoundError) as e:
+        log(f"Could not load YAML config: {str(e)}", "WARNING")
+        log("Using embedded configuration")
+        return EMBEDDED_CONFIG
+
+
+def run_from_config(config):
+    """
+    Run pre-flight validation based on configuration dictionary.
+
+    Args:
+        config (dict): Configuration dictionary
+
+    Returns:
+        dict: Validation report (see validate_named_selections)
+    """
+    set_logging(config.get('global_settings', {}).get('log_details', True))
+    invalidate_named_selection_cache()
+    log_section("ANSYS Mechanical - Pre-flight Model Validation")
+
+    usages = collect_named_selection_usages()
+    report = validate_named_selections(usages, config.get('normal_check', {}))
+    log_report(report)
+    return report
+
+
+def main():
+    """
+    Main function to validate the model against all automation configs.
+
+    Returns:
+        dict: Validation report
+    """
+    return run_from_config(load_config())
+
+
+# Run the script
+if __name__ == "__main__":
+    main()
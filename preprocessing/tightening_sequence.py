@@ -0,0 +1,193 @@
+"""
+Bolt Tightening Sequence Scheduler
+===================================
+
+Packs a bolt tightening sequence into the fewest load steps. Bolts that
+are tightened together (all bolts, one group at a time, or diametrically
+opposite pairs in a star pattern) share a step, and each pass of the
+sequence applies a percentage of the final pretension (or a length
+increment) to every group in turn.
+
+The result is a step table with one Define By code per step and bolt:
+- OPEN: not tightened yet
+- LOAD: preload applied in this step (fraction of the final pretension)
+- LOCK: locked at the value reached earlier
+- INCREMENT: length increment applied on top of the locked state
+
+Used by bolt_pretensions.py when tightening_sequence is enabled in
+config/bolt_pretension_config.yaml.
+"""
+import numpy as np
+
+
+# Define By codes used in the step table
+OPEN = 0
+LOAD = 1
+LOCK = 2
+INCREMENT = 3
+
+PATTERN_SIMULTANEOUS = 'simultaneous'
+PATTERN_SEQUENTIAL = 'sequential'
+PATTERN_STAR = 'star'
+
+
+def order_bolts_by_angle(centroids):
+    """
+    Order bolts by their angle around the centre of the bolt pattern.
+
+    The angle is measured in the best-fit plane of the bolt centroids, so
+    bolt circles in any orientation are handled.
+
+    Args:
+        centroids: (N, 3) bolt face centroids
+
+    Returns:
+        np.ndarray: Bolt positions in angular order
+    """
+    centroids = np.asarray(centroids, dtype=float).reshape(-1, 3)
+    if len(centroids) < 3:
+        return np.arange(len(centroids))
+
+    centered = centroids - centroids.mean(axis=0)
+    _, _, basis = np.linalg.svd(centered, full_matrices=False)
+    angles = np.arctan2(centered @ basis[1], centered @ basis[0])
+    return np.argsort(angles, kind='stable')
+
+
+def star_groups(order):
+    """
+    Group bolts in angular order into a star (cross) tightening pattern.
+
+    An even number of bolts is tightened in diametrically opposite pairs,
+    alternating between the two halves of the circle (8 bolts: 1-5, 3-7,
+    2-6, 4-8). An odd number is tightened one at a time, each bolt roughly
+    opposite the previous one (5 bolts: 1, 4, 2, 5, 3).
+
+    Args:
+        order: Bolt positions in angular order
+
+    Returns:
+        list: Arrays of bolt positions, one per group in tightening order
+    """
+    order = np.asarray(order, dtype=int)
+    count = len(order)
+    if count == 0:
+        return []
+
+    if count % 2 == 0:
+        half = count // 2
+        quarter = (half + 1) // 2
+        starts = np.empty(half, dtype=int)
+        starts[0::2] = np.arange(quarter)
+        starts[1::2] = np.arange(quarter, half)
+        return [order[[start, start + half]] for start in starts]
+
+    step = (count + 1) // 2
+    return [order[[(k * step) % count]] for k in range(count)]
+
+
+def tightening_groups(count, pattern=PATTERN_SIMULTANEOUS, group_size=1, centroids=None):
+    """
+    Split bolts into groups that are tightened in the same step.
+
+    Args:
+        count (int): Number of bolts
+        pattern (str): 'simultaneous', 'sequential' or 'star'
+        group_size (int): Bolts per group for the sequential pattern
+        centroids: (N, 3) bolt centroids (star pattern; default: given order)
+
+    Returns:
+        list: Arrays of bolt positions, one per group in tightening order
+    """
+    if count == 0:
+        return []
+    if pattern == PATTERN_SIMULTANEOUS:
+        return [np.arange(count)]
+    if pattern == PATTERN_SEQUENTIAL:
+        group_size = max(int(group_size), 1)
+        return [np.arange(start, min(start + group_size, count)) for start in range(0, count, group_size)]
+    if pattern == PATTERN_STAR:
+        order = order_bolts_by_angle(centroids) if centroids is not None else np.arange(count)
+        return star_groups(order)
+    raise ValueError(f"Unknown tightening pattern: {pattern}")
+
+
+def _parse_pass(entry):
+    """Return (code, value) for a pass: a percentage (LOAD) or {'increment': length}."""
+    if isinstance(entry, dict):
+        return INCREMENT, float(entry['increment'])
+    return LOAD, float(entry) / 100.0
+
+
+def build_step_table(groups, count, passes=(100,)):
+    """
+    Build the minimum step table for a tightening sequence.
+
+    Every pass visits the groups in order, one step per group, so the
+    table has len(passes) * len(groups) steps. Before its first step a
+    bolt is OPEN; afterwards it is LOCK except in the steps of later passes.
+
+    Args:
+        groups (list): Arrays of bolt positions from tightening_groups
+        count (int): Number of bolts
+        passes (list): Per pass, a percentage of the final pretension
+                       or {'increment': length}
+
+    Returns:
+        dict: Step table with keys:
+            - codes (S, N) int: Define By code per step and bolt
+            - fractions (S, N) float: Fraction of the final pretension (LOAD steps)
+            - increments (S, N) float: Length increment (INCREMENT steps)
+            - num_steps: Number of steps S
+    """
+    parsed = [_parse_pass(entry) for entry in passes]
+    group_of = np.full(count, -1, dtype=int)
+    for index, members in enumerate(groups):
+        group_of[np.asarray(members, dtype=int)] = index
+    if np.any(group_of < 0):
+        raise ValueError("Every bolt must belong to a tightening group")
+
+    num_groups = len(groups)
+    num_steps = len(parsed) * num_groups
+    bolts = np.arange(count)
+
+    codes = np.full((num_steps, count), OPEN, dtype=int)
+    fractions = np.zeros((num_steps, count))
+    increments = np.zeros((num_steps, count))
+
+    # Step of each (pass, bolt): pass p tightens group g in step p * G + g
+    step_of = np.arange(len(parsed))[:, None] * num_groups + group_of[None, :]
+    first_step = step_of[0]
+    codes[np.arange(num_steps)[:, None] > first_step[None, :]] = LOCK
+
+    for pass_index, (code, value) in enumerate(parsed):
+        steps = step_of[pass_index]
+        codes[steps, bolts] = code
+        if code == LOAD:
+            fractions[steps, bolts] = value
+        else:
+            increments[steps, bolts] = value
+
+    # Locked bolts keep the last loaded fraction
+    loaded = np.where(codes == LOAD, fractions, np.nan)
+    filled = np.fmax.accumulate(np.nan_to_num(loaded, nan=-1.0), axis=0)
+    fractions = np.where(codes == OPEN, 0.0, np.maximum(filled, 0.0))
+
+    return {'codes': codes, 'fractions': fractions, 'increments': increments, 'num_steps': num_steps}
+
+
+def schedule_bolts(count, sequence_config, centroids=None):
+    """
+    Build the step table of a tightening sequence from its configuration.
+
+    Args:
+        count (int): Number of bolts
+        sequence_config (dict): pattern, passes, group_size
+        centroids: (N, 3) bolt centroids (star pattern)
+
+    Returns:
+        dict: Step table (see build_step_table)
+    """
+    groups = tightening_groups(count, sequence_config.get('pattern', PATTERN_SIMULTANEOUS),
+                               sequence_config.get('group_size', 1), centroids)
+    return build_step_table(groups, count, sequence_config.get('passes', [100]))
@@ -0,0 +1,8 @@
+"""
+ANSYS Tools - Solving Module
+=============================
+
+Solve orchestration: queued, non-blocking solves with per-analysis resources.
+"""
+
+__version__ = "0.1.0"
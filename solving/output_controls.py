@@ -0,0 +1,187 @@
+"""
+Output Controls
+===============
+
+Trims the Analysis Settings output controls to what the enabled
+postprocessing reads from the result file.
+
+By default every quantity (stress, strain, miscellaneous records, ...) is
+written at every substep, which makes result files tens of GB. The bolt
+force extraction only needs reactions and nodal forces at the step ends of
+its configured time steps. Before an analysis is solved, the outputs no
+enabled postprocessing needs are switched off and results are stored at
+the last time point of each step only. Quantities listed under 'keep'
+stay on, e.g. for stress results added to the tree by hand.
+
+Mechanical stores at least the last time point of every step, so steps
+outside the extraction time steps cannot be dropped; they are reduced to
+their last time point as well.
+
+Every setting that is changed on an analysis is logged as a warning, since
+it changes what the result file contains. Used by solve_orchestrator.py
+when output_controls.enabled is set in config/solving_config.yaml (off by
+default).
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: OutputControlsNodalForcesType, TimePointsOptions are provided by ANSYS Mechanical runtime environment
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log
+
+
+# Output quantity -> Analysis Settings output control property
+OUTPUT_PROPERTIES = {
+    'stress': 'Stress',
+    'strain': 'Strain',
+    'nodal_forces': 'NodalForces',
+    'reactions': 'CalculateReactions',
+    'contact': 'ContactMiscellaneous',
+    'general_miscellaneous': 'GeneralMiscellaneous',
+    'volume_energy': 'CalculateVolumeEnergy',
+    'euler_angles': 'CalculateEulerAngles',
+}
+
+STORE_LAST_TIME_POINT = 'last_time_point'
+STORE_ALL_TIME_POINTS = 'all'
+
+
+# ============================================================================
+# Planning
+# ============================================================================
+
+def merge_time_steps(time_steps_configs):
+    """
+    Merge the time step configurations of several requirements.
+
+    Args:
+        time_steps_configs (list): 'first_last', 'all' or lists of 1-indexed steps
+
+    Returns:
+        'all', or a dict {'first_last': bool, 'steps': sorted list of steps}
+    """
+    merged = {'first_last': False, 'steps': set()}
+    for time_steps in time_steps_configs:
+        if time_steps == 'all':
+            return 'all'
+        if time_steps == 'first_last':
+            merged['first_last'] = True
+        elif isinstance(time_steps, (list, tuple)):
+            merged['steps'].update(int(step) for step in time_steps)
+        else:
+            raise ValueError(f"Invalid time_steps configuration: {time_steps}")
+    merged['steps'] = sorted(merged['steps'])
+    return merged
+
+
+def required_steps(time_steps, num_steps):
+    """
+    Resolve merged time steps against the number of steps of an analysis.
+
+    Args:
+        time_steps: Result of merge_time_steps
+        num_steps (int): Number of steps of the analysis
+
+    Returns:
+        list: Sorted 1-indexed steps
+    """
+    if time_steps == 'all':
+        return list(range(1, num_steps + 1))
+    steps = set(time_steps['steps'])
+    if time_steps['first_last']:
+        steps.update((1, num_steps))
+    return sorted(steps)
+
+
+def plan_output_controls(requirements, keep=(), store_results_at=STORE_LAST_TIME_POINT):
+    """
+    Plan the output controls of an analysis from the postprocessing requirements.
+
+    Args:
+        requirements (list): Dicts with 'outputs' (quantities) and 'time_steps'
+        keep (iterable): Quantities kept on in addition to the requirements
+        store_results_at (str): 'last_time_point' or 'all' (leave the time points unchanged)
+
+    Returns:
+        dict: outputs (quantity -> on/off for every known quantity),
+              time_steps (merged) and store_results_at
+    """
+    needed = set(keep)
+    for requirement in requirements:
+        needed.update(requirement.get('outputs', ()))
+    unknown = sorted(needed - set(OUTPUT_PROPERTIES))
+    if unknown:
+        raise ValueError(f"Unknown output quantities: {', '.join(unknown)}")
+    if store_results_at not in (STORE_LAST_TIME_POINT, STORE_ALL_TIME_POINTS):
+        raise ValueError(f"Invalid store_results_at: {store_results_at}")
+
+    return {
+        'outputs': {quantity: quantity in needed for quantity in OUTPUT_PROPERTIES},
+        'time_steps': merge_time_steps([requirement.get('time_steps', 'all') for requirement in requirements]),
+        'store_results_at': store_results_at,
+    }
+
+
+# ============================================================================
+# Mechanical
+# ============================================================================
+
+def _output_value(quantity, enabled):
+    if quantity == 'nodal_forces':
+        return OutputControlsNodalForcesType.Yes if enabled else OutputControlsNodalForcesType.Off
+    return bool(enabled)
+
+
+def apply_output_controls(analysis, plan):
+    """
+    Apply planned output controls to the Analysis Settings of an analysis.
+
+    Args:
+        analysis: Analysis object
+        plan (dict): From plan_output_controls
+
+    Returns:
+        dict: outputs switched off, steps changed to the last time point and
+              required steps missing from the analysis
+    """
+    settings = analysis.AnalysisSettings
+    switched_off = []
+    for quantity, enabled in plan['outputs'].items():
+        name = OUTPUT_PROPERTIES[quantity]
+        value = _output_value(quantity, enabled)
+        try:
+            if getattr(settings, name) == value:
+                continue
+            setattr(settings, name, value)
+        except Exception as e:
+            log(f"  Could not set output '{quantity}': {str(e)}", "WARNING")
+            continue
+        log(f"  {analysis.Name}: output control {name} switched {'on' if enabled else 'off'}", "WARNING")
+        if not enabled:
+            switched_off.append(quantity)
+
+    num_steps = settings.NumberOfSteps
+    steps = required_steps(plan['time_steps'], num_steps)
+    missing = [step for step in steps if step < 1 or step > num_steps]
+    if missing:
+        log(f"  Extraction time steps not in {analysis.Name}: {missing}", "WARNING")
+
+    trimmed = []
+    if plan['store_results_at'] == STORE_LAST_TIME_POINT:
+        current = settings.CurrentStepNumber
+        for step in range(1, num_steps + 1):
+            settings.CurrentStepNumber = step
+            if settings.StoreResultsAt != TimePointsOptions.LastTimePoint:
+                settings.StoreResultsAt = TimePointsOptions.LastTimePoint
+                trimmed.append(step)
+        settings.CurrentStepNumber = current
+    if trimmed:
+        log(f"  {analysis.Name}: results of step(s) {trimmed} now stored at the last time point only", "WARNING")
+
+    return {'switched_off': switched_off, 'trimmed_steps': trimmed, 'missing_steps': missing}
@@ -0,0 +1,284 @@
+"""
+Solve Autotuner
+===============
+
+Recommends the core count and distributed/shared-memory mode of a solve
+from the solve history recorded by solve_telemetry.py.
+
+For a new solve, the DOF count is estimated (3 x mesh nodes, or the DOF of
+the last solve of the analysis). Successful solves of similar models
+(DOF within dof_tolerance) are grouped by cores and mode; their wall times
+and memory are scaled linearly to the new DOF count, and the configuration
+with the lowest median wall time is recommended. The configured cores are
+only replaced if the recommendation is expected to be at least min_gain
+faster, and configurations above max_cores or max_memory_mb are skipped.
+
+Analyses with cores or distributed set explicitly in their 'analyses'
+entry are never changed. In dry-run mode the recommendations are only
+logged.
+
+Configuration is loaded from the autotune section of
+config/solving_config.yaml
+
+Usage:
+    Run main.py --solve to tune and solve, or main.py --recommend to only
+    print the recommendations.
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log, log_section, set_logging
+from utilities.named_selection_helper import invalidate_named_selection_cache
+from solving.solve_telemetry import query_history
+
+
+DEFAULT_SETTINGS = {
+    'enabled': True,
+    'dry_run': False,
+    'dof_tolerance': 0.25,
+    'min_samples': 1,
+    'min_gain': 0.05,
+    'max_cores': None,
+    'max_memory_mb': None
+}
+
+
+# ============================================================================
+# Estimation
+# ============================================================================
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return 0.5 * (values[middle - 1] + values[middle])
+
+
+def _mode_name(distributed):
+    return 'distributed' if distributed else 'shared memory'
+
+
+def load_tuning_history(history_file=None):
+    """
+    Load the successful solves usable for tuning.
+
+    Args:
+        history_file (str): Optional history path (default: state/solve_history.jsonl)
+
+    Returns:
+        list: Records with status 'done', a DOF count, a wall time and cores
+    """
+    return query_history(history_file, status='done',
+                         where=lambda record: record.get('dof') and record.get('wall_time') is not None
+                         and record.get('cores'))
+
+
+def estimate_dof(backend, analysis_number, history):
+    """
+    Estimate the DOF count of the next solve of an analysis.
+
+    Args:
+        backend: Solver backend (solve_inputs)
+        analysis_number (int): Analysis number
+        history (list): From load_tuning_history
+
+    Returns:
+        int: Estimated DOF count, or None if unknown
+    """
+    try:
+        mesh = backend.solve_inputs(analysis_number, []).get('mesh') or {}
+        if mesh.get('nodes'):
+            return 3 * int(mesh['nodes'])
+    except Exception as e:
+        log(f"Could not read the mesh of analysis {analysis_number}: {str(e)}", "WARNING")
+
+    previous = [record for record in history if record.get('analysis') == analysis_number]
+    return previous[-1]['dof'] if previous else None
+
+
+def estimate_configurations(history, dof, settings):
+    """
+    Estimate wall time and memory per cores/mode configuration for a DOF count.
+
+    Args:
+        history (list): From load_tuning_history
+        dof (int): DOF count of the new solve
+        settings (dict): dof_tolerance, min_samples, max_cores, max_memory_mb
+
+    Returns:
+        list: Candidate dicts (cores, distributed, expected_wall_time,
+              expected_memory_mb, samples), fastest first
+    """
+    tolerance = settings.get('dof_tolerance', DEFAULT_SETTINGS['dof_tolerance'])
+    groups = {}
+    for record in history:
+        if abs(record['dof'] - dof) > tolerance * dof:
+            continue
+        scale = float(dof) / record['dof']
+        group = groups.setdefault((int(record['cores']), bool(record.get('distributed'))), {'times': [], 'memory': []})
+        group['times'].append(record['wall_time'] * scale)
+        if record.get('memory_mb'):
+            group['memory'].append(record['memory_mb'] * scale)
+
+    max_cores = settings.get('max_cores')
+    max_memory = settings.get('max_memory_mb')
+    candidates = []
+    for (cores, distributed), group in groups.items():
+        if len(group['times']) < settings.get('min_samples', DEFAULT_SETTINGS['min_samples']):
+            continue
+        if max_cores is not None and cores > max_cores:
+            continue
+        memory = _median(group['memory']) if group['memory'] else None
+        if max_memory is not None and memory is not None and memory > max_memory:
+            continue
+        candidates.append({
+            'cores': cores,
+            'distributed': distributed,
+            'expected_wall_time': round(_median(group['times']), 1),
+            'expected_memory_mb': round(memory, 1) if memory is not None else None,
+            'samples': len(group['times']),
+        })
+    candidates.sort(key=lambda candidate: (candidate['expected_wall_time'], candidate['cores']))
+    return candidates
+
+
+def recommend_configuration(job, dof, history, settings):
+    """
+    Recommend the cores and mode of one job.
+
+    Args:
+        job (dict): Job from build_solve_jobs
+        dof (int): Estimated DOF count (None = unknown)
+        history (list): From load_tuning_history
+        settings (dict): Autotune settings
+
+    Returns:
+        dict: analysis, dof, configured and recommended (cores, distributed),
+              expected wall times, change (bool) and reason
+    """
+    recommendation = {
+        'analysis': job['analysis'],
+        'dof': dof,
+        'configured': {'cores': job['cores'], 'distributed': job['distributed']},
+        'recommended': None,
+        'configured_wall_time': None,
+        'expected_wall_time': None,
+        'change': False,
+        'reason': None,
+    }
+    if job.get('pinned'):
+        recommendation['reason'] = 'cores set explicitly'
+        return recommendation
+    if not dof:
+        recommendation['reason'] = 'DOF count unknown'
+        return recommendation
+
+    candidates = estimate_configurations(history, dof, settings)
+    if not candidates:
+        recommendation['reason'] = 'no similar solves in the history'
+        return recommendation
+
+    best = candidates[0]
+    recommendation['recommended'] = {'cores': best['cores'], 'distributed': best['distributed']}
+    recommendation['expected_wall_time'] = best['expected_wall_time']
+    for candidate in candidates:
+        if candidate['cores'] == job['cores'] and candidate['distributed'] == job['distributed']:
+            recommendation['configured_wall_time'] = candidate['expected_wall_time']
+
+    if recommendation['recommended'] == recommendation['configured']:
+        recommendation['reason'] = 'configured cores are the fastest'
+        return recommendation
+    current = recommendation['configured_wall_time']
+    min_gain = settings.get('min_gain', DEFAULT_SETTINGS['min_gain'])
+    if current is not None and best['expected_wall_time'] > (1.0 - min_gain) * current:
+        recommendation['reason'] = f"expected gain below {min_gain:.0%}"
+        return recommendation
+    recommendation['change'] = True
+    recommendation['reason'] = f"fastest of {len(candidates)} configuration(s) from {best['samples']} solve(s)"
+    return recommendation
+
+
+# ============================================================================
+# Tuning
+# ============================================================================
+
+def log_recommendation(name, recommendation):
+    """Log one recommendation."""
+    configured = recommendation['configured']
+    dof = f"~{recommendation['dof']} DOF" if recommendation['dof'] else "DOF unknown"
+    if recommendation['recommended'] is None:
+        log(f"{name} ({dof}): keeping {configured['cores']} core(s), {_mode_name(configured['distributed'])} "
+            f"({recommendation['reason']})")
+        return
+    recommended = recommendation['recommended']
+    current = recommendation['configured_wall_time']
+    current = f"expected {current:.1f} s" if current is not None else "not in history"
+    log(f"{name} ({dof}): recommended {recommended['cores']} core(s), {_mode_name(recommended['distributed'])} "
+        f"(expected {recommendation['expected_wall_time']:.1f} s); configured {configured['cores']} core(s), "
+        f"{_mode_name(configured['distributed'])} ({current}); {recommendation['reason']}")
+
+
+def autotune_jobs(jobs, backend, settings, history_file=None):
+    """
+    Recommend and, unless dry_run is set, apply cores and mode to the jobs.
+
+    Args:
+        jobs (list): Jobs from build_solve_jobs (updated in place)
+        backend: Solver backend (name, solve_inputs)
+        settings (dict): Autotune settings
+        history_file (str): Optional history path
+
+    Returns:
+        list: One recommendation per job
+    """
+    settings = dict(DEFAULT_SETTINGS, **(settings or {}))
+    history = load_tuning_history(history_file)
+    log(f"Autotune: {len(history)} successful solve(s) in the history"
+        f"{' (dry run)' if settings['dry_run'] else ''}")
+
+    recommendations = []
+    for job in jobs:
+        dof = estimate_dof(backend, job['analysis'], history)
+        recommendation = recommend_configuration(job, dof, history, settings)
+        log_recommendation(backend.name(job['analysis']), recommendation)
+        if recommendation['change'] and not settings['dry_run']:
+            job.update(recommendation['recommended'])
+        recommendations.append(recommendation)
+    return recommendations
+
+
+# ============================================================================
+# Main Processing
+# ============================================================================
+
+def main():
+    """
+    Print the recommendations for the configured analyses without solving.
+
+    Returns:
+        list: One recommendation per configured analysis
+    """
+    from solving import solve_orchestrator
+
+    config = solve_orchestrator.load_config()
+    global_settings = config.get('global_settings', {})
+    set_logging(global_settings.get('log_details', True))
+    invalidate_named_selection_cache()
+    log_section("Solve Autotuner - Recommendations")
+
+    jobs = solve_orchestrator.build_solve_jobs(config)
+    backend = solve_orchestrator.create_backend(global_settings)
+    settings = dict(config.get('autotune') or {}, dry_run=True)
+    recommendations = autotune_jobs(jobs, backend, settings, (config.get('telemetry') or {}).get('history_file'))
+
+    log_section("Autotuner complete!")
+    return recommendations
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Solve Cache
+===========
+
+Skips solves whose inputs have not changed since the last successful solve.
+
+Each analysis gets an input fingerprint over:
+- The contents (entity IDs) of every named selection used by the automation
+- The contact and bolt pretension definitions from the YAML configs
+- The analysis settings (global and per step) and output controls
+- The objects of the analysis tree (loads, supports, bolt pretensions, ...)
+  and of the connections: category, name, suppression, scoping and key
+  properties
+- The bodies: suppression, material assignment, stiffness behavior and volume
+- The mesh statistics (nodes, elements)
+
+Inputs outside the fingerprint are not seen: material property values
+edited in Engineering Data, step-dependent (tabular) values beyond the
+current step, and geometry changes that keep every body volume. Disable
+the cache or clear the solve of an analysis after such edits.
+
+If the fingerprint matches the one recorded after the last successful
+solve and the result file is still intact (same size and modification
+time as recorded), the solve is skipped. Records are kept in
+state/<model>/solve_cache.json.
+
+Used by solve_orchestrator.py when cache.enabled is set in
+config/solving_config.yaml.
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: Model, DataModelObjectCategory are provided by ANSYS Mechanical runtime environment
+
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log
+from utilities.config_loader import load_yaml_config, get_config_path
+from utilities.named_selection_helper import get_named_selection_ids
+from utilities.state_helper import get_state_path, load_state, save_state, compute_fingerprint
+
+
+STATE_FILENAME = 'solve_cache.json'
+RESULT_FILENAME = 'file.rst'
+
+# Config sections that define solver inputs (logging and run switches are left out)
+CONFIG_INPUT_SECTIONS = {
+    'contact_config.yaml': ('contacts', 'contact_profiles', 'pairwise', 'pinball'),
+    'bolt_pretension_config.yaml': ('bolt_pretensions', 'tightening_sequence'),
+}
+CONFIG_INPUT_SETTINGS = {
+    'contact_config.yaml': ('pinball_radius', 'detection', 'pinball_mode'),
+    'bolt_pretension_config.yaml': ('analyses',),
+}
+
+# Analysis settings read for the fingerprint (missing properties are skipped)
+ANALYSIS_PROPERTIES = ('NumberOfSteps', 'LargeDeflection', 'WeakSprings', 'SolverType', 'SolverPivotChecking',
+                       'InertiaRelief', 'NewtonRaphsonOption')
+STEP_PROPERTIES = ('StepEndTime', 'AutomaticTimeStepping', 'DefineBy', 'InitialSubsteps', 'MinimumSubsteps',
+                   'MaximumSubsteps', 'InitialTimeStep', 'MinimumTimeStep', 'MaximumTimeStep',
+                   'StoreResultsAt', 'StoreResultsAtValue')
+OUTPUT_PROPERTIES = ('NodalForces', 'ContactMiscellaneous', 'GeneralMiscellaneous', 'Stress', 'Strain',
+                     'ElasticStrain', 'PlasticStrain', 'CalculateReactions', 'CalculateVolumeEnergy',
+                     'CalculateEulerAngles', 'CalculateThermalFlux')
+
+# Tree object properties read for the fingerprint (loads, supports, pretensions, contacts, joints, ...)
+OBJECT_PROPERTIES = ('Suppressed', 'DefineBy', 'Magnitude', 'XComponent', 'YComponent', 'ZComponent',
+                     'Preload', 'Increment', 'ContactType', 'Behavior', 'FrictionCoefficient', 'Formulation',
+                     'PinballRegion', 'PinballRadius', 'InterfaceTreatment', 'Offset', 'Type', 'Stiffness')
+OBJECT_SCOPINGS = ('Location', 'SourceLocation', 'TargetLocation')
+BODY_PROPERTIES = ('Suppressed', 'Material', 'StiffnessBehavior', 'Volume')
+
+# Tree objects that do not change the solve (analysis settings are read separately)
+SKIPPED_CATEGORIES = ('AnalysisSettings', 'Solution', 'SolutionInformation', 'ContactTool', 'Comment', 'Figure',
+                      'Image')
+
+
+# ============================================================================
+# Input Collection
+# ============================================================================
+
+def load_config_inputs():
+    """
+    Collect the solver-relevant sections of the contact and pretension configs.
+
+    Returns:
+        dict: Config filename -> {section or setting: value}
+    """
+    inputs = {}
+    for filename, sections in CONFIG_INPUT_SECTIONS.items():
+        try:
+            config = load_yaml_config(get_config_path(filename)) or {}
+        except Exception as e:
+            log(f"Could not load {filename}: {str(e)}", "WARNING")
+            config = {}
+        global_settings = config.get('global_settings') or {}
+        entry = {section: config.get(section) for section in sections}
+        entry.update({key: global_settings.get(key) for key in CONFIG_INPUT_SETTINGS.get(filename, ())})
+        inputs[filename] = entry
+    return inputs
+
+
+def _read_properties(obj, names):
+    values = {}
+    for name in names:
+        try:
+            values[name] = str(getattr(obj, name))
+        except Exception:
+            continue
+    return values
+
+
+def _read_scoping(obj, name):
+    try:
+        location = getattr(obj, name)
+    except Exception:
+        return None
+    if location is None:
+        return None
+    ids = getattr(location, 'Ids', None)
+    if ids is not None:
+        return sorted(int(entity_id) for entity_id in ids)
+    return str(getattr(location, 'Name', location))
+
+
+def read_tree_inputs(parent):
+    """
+    Read the solve-relevant objects below a tree object, recursively.
+
+    Args:
+        parent: Tree object (e.g. an analysis or the connections)
+
+    Returns:
+        list: Per child, a dict with category, name, the properties in
+              OBJECT_PROPERTIES, the scopings in OBJECT_SCOPINGS and its children
+    """
+    objects = []
+    for child in parent.Children:
+        category = str(child.DataModelObjectCategory)
+        if category in SKIPPED_CATEGORIES:
+            continue
+        entry = {'category': category, 'name': child.Name}
+        entry.update(_read_properties(child, OBJECT_PROPERTIES))
+        for name in OBJECT_SCOPINGS:
+            scoping = _read_scoping(child, name)
+            if scoping is not None:
+                entry[name] = scoping
+        children = read_tree_inputs(child)
+        if children:
+            entry['children'] = children
+        objects.append(entry)
+    return objects
+
+
+def read_body_inputs():
+    """
+    Read suppression, material assignment, stiffness behavior and volume of every body.
+
+    Returns:
+        list: Per body, a dict with its name and the properties in BODY_PROPERTIES
+    """
+    bodies = []
+    for body in Model.Geometry.GetChildren(DataModelObjectCategory.Body, True):
+        entry = {'name': body.Name}
+        entry.update(_read_properties(body, BODY_PROPERTIES))
+        bodies.append(entry)
+    return bodies
+
+
+def read_analysis_inputs(analysis, named_selections):
+    """
+    Read the model inputs of one analysis for its fingerprint.
+
+    Args:
+        analysis: Analysis object
+        named_selections (list): Named selection names used by the automation
+
+    Returns:
+        dict: named_selections (name -> sorted entity IDs or None),
+              analysis_settings (global, per step and output controls),
+              objects (analysis tree), connections, bodies and mesh (nodes, elements)
+    """
+    settings = analysis.AnalysisSettings
+    steps = []
+    current = settings.CurrentStepNumber
+    for step in range(1, settings.NumberOfSteps + 1):
+        settings.CurrentStepNumber = step
+        steps.append(_read_properties(settings, STEP_PROPERTIES))
+    settings.CurrentStepNumber = current
+
+    mesh = {}
+    try:
+        mesh = {'nodes': int(Model.Mesh.Nodes), 'elements': int(Model.Mesh.Elements)}
+    except Exception as e:
+        log(f"Could not read mesh statistics: {str(e)}", "WARNING")
+
+    contents = {}
+    for name in named_selections:
+        ids = get_named_selection_ids(name)
+        contents[name] = sorted(ids) if ids is not None else None
+
+    return {
+        'named_selections': contents,
+        'analysis_settings': {
+            'global': _read_properties(settings, ANALYSIS_PROPERTIES),
+            'steps': steps,
+            'output': _read_properties(settings, OUTPUT_PROPERTIES),
+        },
+        'objects': read_tree_inputs(analysis),
+        'connections': read_tree_inputs(Model.Connections),
+        'bodies': read_body_inputs(),
+        'mesh': mesh,
+    }
+
+
+def input_fingerprint(analysis_inputs, config_inputs):
+    """
+    Fingerprint the inputs of one analysis.
+
+    Args:
+        analysis_inputs (dict): From read_analysis_inputs (or a solver backend)
+        config_inputs (dict): From load_config_inputs
+
+    Returns:
+        str: Fingerprint
+    """
+    return compute_fingerprint('solve', analysis_inputs, config_inputs)
+
+
+# ============================================================================
+# Cache Records
+# ============================================================================
+
+def result_file_signature(result_file):
+    """
+    Get the size and modification time of a result file.
+
+    Args:
+        result_file (str): Result file path
+
+    Returns:
+        dict: {'size', 'mtime'}, or None if the file is missing or empty
+    """
+    if not result_file or not os.path.isfile(result_file):
+        return None
+    stat = os.stat(result_file)
+    if stat.st_size == 0:
+        return None
+    return {'size': stat.st_size, 'mtime': round(stat.st_mtime, 3)}
+
+
+def is_cached(cache, key, fingerprint, result_file, solved=True):
+    """
+    Check whether an analysis can skip its solve.
+
+    Args:
+        cache (dict): Solve cache state
+        key (str): Analysis key (analysis_<n>)
+        fingerprint (str): Current input fingerprint
+        result_file (str): Current result file path
+        solved (bool): Whether the analysis is currently in the solved state;
+                       inputs outside the fingerprint (e.g. an object edited
+                       by hand) put it out of date
+
+    Returns:
+        bool: True if the analysis is solved, the last successful solve had
+              the same inputs and its result file is intact
+    """
+    if not solved:
+        return False
+    entry = cache.get('analyses', {}).get(key)
+    if not entry or entry.get('fingerprint') != fingerprint:
+        return False
+    if entry.get('result_file') != result_file:
+        return False
+    signature = result_file_signature(result_file)
+    return signature is not None and signature == entry.get('result')
+
+
+def record_solve(cache, key, fingerprint, result_file):
+    """
+    Record a successful solve and its result file.
+
+    Args:
+        cache (dict): Solve cache state (updated in place)
+        key (str): Analysis key (analysis_<n>)
+        fingerprint (str): Input fingerprint of the solve
+        result_file (str): Result file path
+    """
+    signature = result_file_signature(result_file)
+    if signature is None:
+        log(f"Result file not found after solve, not caching {key}: {result_file}", "WARNING")
+        cache.setdefault('analyses', {}).pop(key, None)
+        return
+    cache.setdefault('analyses', {})[key] = {
+        'fingerprint': fingerprint,
+        'result_file': result_file,
+        'result': signature,
+        'solved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+
+def load_solve_cache(state_file=None):
+    """Load the solve cache state (default: state/<model>/solve_cache.json)."""
+    return load_state(state_file or get_state_path(STATE_FILENAME))
+
+
+def save_solve_cache(cache, state_file=None):
+    """Save the solve cache state (default: state/<model>/solve_cache.json)."""
+    save_state(state_file or get_state_path(STATE_FILENAME), cache)
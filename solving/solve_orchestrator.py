@@ -0,0 +1,746 @@
+"""
+ANSYS Workbench Mechanical - Solve Orchestrator
+================================================
+
+Queues one or more analyses, applies the core count and distributed or
+shared-memory mode of each analysis, starts the solves without blocking
+and polls their status. As soon as an analysis finishes, a callback runs
+(by default the bolt force extraction of that analysis), so no one has to
+solve each analysis by hand and re-run main.py. With the solve cache
+enabled, analyses whose inputs and result file are unchanged since their
+last successful solve are not solved again (see solve_cache.py). With
+output trimming enabled, the output controls of analyses that are extracted
+afterwards are trimmed to what the extraction reads before solving (see
+output_controls.py). After every
+solve, the solver metrics are appended to the solve history (see
+solve_telemetry.py), from which the cores and mode of later solves are
+tuned (see solve_autotuner.py).
+
+Solver access goes through a small backend interface:
+- MechanicalSolverBackend: solves inside ANSYS Mechanical
+- FakeSolverBackend: local fake solver with configurable durations and
+  failures, for testing the orchestration outside Mechanical
+
+Configuration is loaded from config/solving_config.yaml
+
+Usage:
+    Run this script from within ANSYS Workbench Mechanical using the scripting console
+    or as an external script file, or run main.py --solve.
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: ExtAPI, Model, ObjectState are provided by ANSYS Mechanical runtime environment
+
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log, log_section, set_logging
+from utilities.named_selection_helper import invalidate_named_selection_cache
+from utilities.config_loader import load_yaml_config, get_config_path
+from solving.solve_cache import (RESULT_FILENAME, load_config_inputs, read_analysis_inputs, input_fingerprint,
+                                 is_cached, record_solve, load_solve_cache, save_solve_cache)
+from solving.output_controls import plan_output_controls, apply_output_controls
+from solving.solve_telemetry import (SOLVE_OUTPUT_FILENAME, read_solve_telemetry, build_solve_record,
+                                     append_history)
+from solving.solve_autotuner import autotune_jobs
+
+
+EMBEDDED_CONFIG = {
+    'global_settings': {
+        'log_details': True,
+        'run_with_all': False,
+        'stop_on_errors': True,
+        'backend': 'mechanical',
+        'solve_configuration': None,
+        'max_concurrent': 1,
+        'poll_interval': 10.0,
+        'timeout': None
+    },
+    'defaults': {
+        'cores': 4,
+        'distributed': False
+    },
+    'analyses': [0],
+    'extraction': {
+        'enabled': True,
+        'analyses': None
+    },
+    'cache': {
+        'enabled': True,
+        'state_file': None
+    },
+    'output_controls': {
+        'enabled': False,
+        'keep': [],
+        'store_results_at': 'last_time_point'
+    },
+    'telemetry': {
+        'enabled': True,
+        'history_file': None
+    },
+    'autotune': {
+        'enabled': True,
+        'dry_run': False,
+        'dof_tolerance': 0.25,
+        'min_samples': 1,
+        'min_gain': 0.05,
+        'max_cores': None,
+        'max_memory_mb': None
+    }
+}
+
+# Solver abort file (jobname.ABT); 'nonlinear' on its first line ends the solve cleanly
+ABORT_FILENAME = 'file.abt'
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+CACHED = 'cached'
+FINISHED_STATES = (DONE, FAILED, TIMEOUT)
+SUCCESS_STATES = (DONE, CACHED)
+
+
+# ============================================================================
+# Solver Backends
+# ============================================================================
+
+class MechanicalSolverBackend(object):
+    """
+    Solve analyses of the open Mechanical model.
+
+    Core count and distributed mode are set on the solve configuration
+    right before each solve is started, so every analysis is submitted
+    with its own settings; close() restores the original settings. Solves run in the background (Solve(False));
+    poll() maps the solution object state to a job state. A solution that
+    finished without its results loaded is reported as running until
+    GetResults() has loaded them. stop() interrupts a running solve with
+    an abort file in its working directory, as the solver's own interrupt
+    does.
+
+    Args:
+        solve_configuration (str): Solve configuration name (default: the default configuration)
+    """
+
+    def __init__(self, solve_configuration=None):
+        self.solve_configuration = solve_configuration
+        self.original_settings = None
+
+    def _solve_configuration(self):
+        configurations = ExtAPI.Application.SolveConfigurations
+        for configuration in configurations:
+            if self.solve_configuration is None and configuration.Default:
+                return configuration
+            if configuration.Name == self.solve_configuration:
+                return configuration
+        raise ValueError(f"Solve configuration '{self.solve_configuration}' not found")
+
+    def name(self, analysis_number):
+        return Model.Analyses[analysis_number].Name
+
+    def start(self, analysis_number, cores, distributed):
+        settings = self._solve_configuration().SolveProcessSettings
+        if self.original_settings is None:
+            self.original_settings = (settings.MaxNumberOfCores, settings.DistributeSolution)
+        settings.MaxNumberOfCores = int(cores)
+        settings.DistributeSolution = bool(distributed)
+        Model.Analyses[analysis_number].Solution.Solve(False)
+
+    def stop(self, analysis_number):
+        with open(os.path.join(self.working_directory(analysis_number), ABORT_FILENAME), 'w') as f:
+            f.write("nonlinear\n")
+
+    def is_solved(self, analysis_number):
+        return Model.Analyses[analysis_number].Solution.ObjectState == ObjectState.Solved
+
+    def poll(self, analysis_number):
+        solution = Model.Analyses[analysis_number].Solution
+        state = solution.ObjectState
+        if state == ObjectState.SolvedNotLoaded:
+            solution.GetResults()
+            state = solution.ObjectState
+        if state == ObjectState.Solved:
+            return DONE
+        if state in (ObjectState.SolveFailed, ObjectState.Error):
+            return FAILED
+        return RUNNING
+
+    def working_directory(self, analysis_number):
+        return Model.Analyses[analysis_number].WorkingDir
+
+    def result_file(self, analysis_number):
+        return os.path.join(self.working_directory(analysis_number), RESULT_FILENAME)
+
+    def solve_inputs(self, analysis_number, named_selections):
+        return read_analysis_inputs(Model.Analyses[analysis_number], named_selections)
+
+    def apply_output_controls(self, analysis_number, plan):
+        return apply_output_controls(Model.Analyses[analysis_number], plan)
+
+    def close(self):
+        if self.original_settings is None:
+            return
+        settings = self._solve_configuration().SolveProcessSettings
+        settings.MaxNumberOfCores, settings.DistributeSolution = self.original_settings
+        self.original_settings = None
+
+
+class FakeSolverBackend(object):
+    """
+    Local fake solver for testing the orchestration without Mechanical.
+
+    A solve finishes once its duration has elapsed on the given clock; with
+    a working directory, a successful solve writes a small result file and
+    solver output there (DOF = 3 x the mesh nodes in its inputs). An
+    analysis counts as solved once it solved successfully, is listed in
+    solved, or has a result file in its working directory.
+
+    Args:
+        durations (dict): Analysis number -> solve duration in seconds
+        failures (iterable): Analysis numbers whose solves fail
+        default_duration (float): Duration of analyses not in durations
+        duration_model (callable): Optional (analysis_number, cores, distributed) -> seconds
+        clock (callable): Time source (default: time.time)
+        working_dir (str): Optional directory per analysis for solver files
+        inputs (dict): Analysis number -> model inputs reported for the solve cache
+        solved (iterable): Analysis numbers that start out solved
+    """
+
+    def __init__(self, durations=None, failures=(), default_duration=0.0, duration_model=None,
+                 clock=time.time, working_dir=None, inputs=None, solved=()):
+        self.durations = dict(durations or {})
+        self.failures = set(failures)
+        self.default_duration = default_duration
+        self.duration_model = duration_model
+        self.clock = clock
+        self.working_dir = working_dir
+        self.inputs = dict(inputs or {})
+        self.solved = set(solved)
+        self.output_controls = {}
+        self.started = {}
+        self.stopped = []
+        self.closed = False
+        self.calls = []
+
+    def name(self, analysis_number):
+        return f"Analysis {analysis_number}"
+
+    def start(self, analysis_number, cores, distributed):
+        if self.duration_model is not None:
+            duration = self.duration_model(analysis_number, cores, distributed)
+        else:
+            duration = self.durations.get(analysis_number, self.default_duration)
+        self.calls.append({'analysis': analysis_number, 'cores': cores, 'distributed': distributed})
+        self.started[analysis_number] = (self.clock(), duration)
+        # Like Mechanical, a new solve clears the previous results
+        self.solved.discard(analysis_number)
+        result_file = self.result_file(analysis_number)
+        if result_file is not None and os.path.isfile(result_file):
+            os.remove(result_file)
+
+    def stop(self, analysis_number):
+        self.started.pop(analysis_number, None)
+        self.stopped.append(analysis_number)
+
+    def is_solved(self, analysis_number):
+        if analysis_number in self.solved:
+            return True
+        result_file = self.result_file(analysis_number)
+        return result_file is not None and os.path.isfile(result_file)
+
+    def poll(self, analysis_number):
+        started, duration = self.started[analysis_number]
+        if self.clock() - started < duration:
+            return RUNNING
+        if analysis_number in self.failures:
+            return FAILED
+        self._write_solver_files(analysis_number, duration)
+        self.solved.add(analysis_number)
+        return DONE
+
+    def working_directory(self, analysis_number):
+        if self.working_dir is None:
+            return None
+        return os.path.join(self.working_dir, f"analysis_{analysis_number}")
+
+    def result_file(self, analysis_number):
+        directory = self.working_directory(analysis_number)
+        return os.path.join(directory, RESULT_FILENAME) if directory else None
+
+    def solve_inputs(self, analysis_number, named_selections):
+        return self.inputs.get(analysis_number, {})
+
+    def apply_output_controls(self, analysis_number, plan):
+        self.output_controls[analysis_number] = plan
+        switched_off = [quantity for quantity, enabled in plan['outputs'].items() if not enabled]
+        return {'switched_off': switched_off, 'trimmed_steps': [], 'missing_steps': []}
+
+    def close(self):
+        self.closed = True
+
+    def _write_solver_files(self, analysis_number, duration):
+        directory = self.working_directory(analysis_number)
+        if directory is None:
+            return
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(os.path.join(directory, RESULT_FILENAME), 'w') as f:
+            f.write(f"fake result of analysis {analysis_number}\n")
+
+        calls = [call for call in self.calls if call['analysis'] == analysis_number]
+        call = calls[-1] if calls else {}
+        nodes = (self.inputs.get(analysis_number, {}).get('mesh') or {}).get('nodes') or 0
+        mode = 'Distributed Memory Parallel' if call.get('distributed') else 'Shared Memory Parallel'
+        with open(os.path.join(directory, SOLVE_OUTPUT_FILENAME), 'w') as f:
+            f.write(f" Number of equations = {3 * nodes}\n")
+            f.write(" EQUIL ITER   1 COMPLETED.\n")
+            f.write(" *** LOAD STEP     1   SUBSTEP     1  COMPLETED.    CUM ITER =      1\n")
+            f.write(" Equation solver used : Sparse (symmetric)\n")
+            f.write(f" Total number of cores requested : {call.get('cores', 1)} ({mode})\n")
+            f.write(f" Elapsed Time (sec) = {duration:.3f}\n")
+
+
+def create_backend(global_settings):
+    """
+    Create the solver backend named in the global settings.
+
+    Args:
+        global_settings (dict): 'backend' ('mechanical' or 'fake') and backend options
+
+    Returns:
+        Solver backend
+    """
+    backend = global_settings.get('backend', 'mechanical')
+    if backend == 'fake':
+        return FakeSolverBackend(default_duration=global_settings.get('fake_duration', 0.0),
+                                 working_dir=global_settings.get('fake_working_dir'))
+    if backend == 'mechanical':
+        return MechanicalSolverBackend(global_settings.get('solve_configuration'))
+    raise ValueError(f"Unknown solver backend: {backend}")
+
+
+# ============================================================================
+# Solve Queue
+# ============================================================================
+
+def build_solve_jobs(config):
+    """
+    Build the solve jobs from the configuration.
+
+    Entries of 'analyses' are analysis indices or dicts with analysis,
+    cores and distributed; missing values come from 'defaults'. Jobs whose
+    entry sets cores or distributed are pinned (not changed by the autotuner).
+
+    Args:
+        config (dict): Configuration dictionary
+
+    Returns:
+        list: Job dicts with keys analysis, cores, distributed and pinned (each analysis once)
+    """
+    defaults = config.get('defaults') or {}
+    entries = config.get('analyses', [0])
+    if isinstance(entries, (int, dict)):
+        entries = [entries]
+
+    jobs = []
+    seen = set()
+    for entry in entries:
+        if not isinstance(entry, dict):
+            entry = {'analysis': entry}
+        number = int(entry.get('analysis', 0))
+        if number in seen:
+            log(f"Analysis {number} is queued more than once; keeping the first entry", "WARNING")
+            continue
+        seen.add(number)
+        jobs.append({
+            'analysis': number,
+            'cores': int(entry.get('cores', defaults.get('cores', 4))),
+            'distributed': bool(entry.get('distributed', defaults.get('distributed', False))),
+            'pinned': 'cores' in entry or 'distributed' in entry,
+        })
+    return jobs
+
+
+def run_solve_queue(jobs, backend, max_concurrent=1, poll_interval=10.0, timeout=None, on_finished=None,
+                    sleep=time.sleep, clock=time.time):
+    """
+    Solve the queued analyses without blocking on any single solve.
+
+    Up to max_concurrent solves run at once. Running solves are polled
+    every poll_interval seconds; as soon as one finishes, on_finished is
+    called with its result and the next queued job is started. Solves
+    running longer than timeout are stopped before the next job starts.
+
+    Args:
+        jobs (list): Jobs from build_solve_jobs
+        backend: Solver backend
+        max_concurrent (int): Maximum number of simultaneous solves
+        poll_interval (float): Seconds between status polls
+        timeout (float): Optional maximum solve time per analysis in seconds
+        on_finished (callable): Optional callback(result) per finished job
+        sleep (callable): Sleep function (injectable for testing)
+        clock (callable): Time source (injectable for testing)
+
+    Returns:
+        list: One result dict per job with keys analysis, name, cores,
+              distributed, status, started, finished, wall_time and error
+    """
+    queue = [dict(job) for job in jobs]
+    running = {}
+    results = []
+    max_concurrent = max(int(max_concurrent), 1)
+
+    def finish(result, status, error=None):
+        result.update({'status': status, 'finished': clock(), 'error': error})
+        result['wall_time'] = result['finished'] - result['started'] if result['started'] is not None else 0.0
+        level = "INFO" if status == DONE else "ERROR"
+        log(f"{result['name']}: {status} after {result['wall_time']:.1f} s"
+            + (f" ({error})" if error else ""), level)
+        results.append(result)
+        if on_finished is not None:
+            try:
+                on_finished(result)
+            except Exception as e:
+                log(f"Post-solve callback failed for {result['name']}: {str(e)}", "ERROR")
+
+    while queue or running:
+        while queue and len(running) < max_concurrent:
+            job = queue.pop(0)
+            result = dict(job, status=QUEUED, started=None, finished=None, wall_time=None, error=None)
+            try:
+                result['name'] = backend.name(job['analysis'])
+                backend.start(job['analysis'], job['cores'], job['distributed'])
+                result.update({'status': RUNNING, 'started': clock()})
+                running[job['analysis']] = result
+                mode = 'distributed' if job['distributed'] else 'shared memory'
+                log(f"Started {result['name']}: {job['cores']} core(s), {mode}")
+            except Exception as e:
+                result.setdefault('name', f"Analysis {job['analysis']}")
+                finish(result, FAILED, f"could not start: {str(e)}")
+
+        freed = False
+        for number in list(running):
+            result = running[number]
+            try:
+                status = backend.poll(number)
+            except Exception as e:
+                status, result['error'] = FAILED, f"status unavailable: {str(e)}"
+            if status in FINISHED_STATES:
+                del running[number]
+                finish(result, status, result['error'])
+                freed = True
+            elif timeout is not None and clock() - result['started'] > timeout:
+                del running[number]
+                try:
+                    backend.stop(number)
+                except Exception as e:
+                    log(f"Could not stop {result['name']}: {str(e)}", "ERROR")
+                finish(result, TIMEOUT, f"exceeded {timeout} s")
+                freed = True
+
+        # Start the next queued job right away when a slot was freed
+        if running and not (freed and queue):
+            sleep(poll_interval)
+
+    return results
+
+
+# ============================================================================
+# Output Controls
+# ============================================================================
+
+def trim_output_controls(jobs, backend, extracted_analyses, output_config):
+    """
+    Trim the output controls of the extracted analyses before solving.
+
+    Only analyses extracted after their solve are trimmed; the outputs of
+    other analyses are left as they are.
+
+    Args:
+        jobs (list): Jobs from build_solve_jobs
+        backend: Solver backend (apply_output_controls)
+        extracted_analyses (list): Analysis numbers extracted after solving
+        output_config (dict): 'output_controls' section (keep, store_results_at)
+
+    Returns:
+        dict: Analysis number -> summary from apply_output_controls
+    """
+    if not extracted_analyses:
+        return {}
+
+    from postprocessing import bolt_force_extraction
+
+    plan = plan_output_controls([bolt_force_extraction.get_output_requirements()],
+                                keep=output_config.get('keep') or (),
+                                store_results_at=output_config.get('store_results_at', 'last_time_point'))
+    kept = [quantity for quantity, enabled in plan['outputs'].items() if enabled]
+    log(f"Output controls: keeping {', '.join(kept)}")
+
+    summaries = {}
+    for job in jobs:
+        number = job['analysis']
+        if number not in extracted_analyses:
+            continue
+        try:
+            summary = backend.apply_output_controls(number, plan)
+        except Exception as e:
+            log(f"Could not trim output controls of analysis {number}: {str(e)}", "WARNING")
+            continue
+        summaries[number] = summary
+        log(f"{backend.name(number)}: {len(summary['switched_off'])} output(s) off, "
+            f"{len(summary['trimmed_steps'])} step(s) reduced to the last time point")
+    return summaries
+
+
+# ============================================================================
+# Solve Telemetry
+# ============================================================================
+
+def record_solve_telemetry(result, backend, history_file=None):
+    """
+    Parse the solver output of a finished solve and append it to the history.
+
+    Args:
+        result (dict): Result from run_solve_queue
+        backend: Solver backend (working_directory)
+        history_file (str): Optional history path (default: state/solve_history.jsonl)
+
+    Returns:
+        dict: The appended solve record
+    """
+    telemetry = None
+    try:
+        telemetry = read_solve_telemetry(backend.working_directory(result['analysis']))
+    except Exception as e:
+        log(f"Could not read the solver output of {result['name']}: {str(e)}", "WARNING")
+    if telemetry is None:
+        log(f"{result['name']}: no solver output, recording the queue wall time only", "WARNING")
+
+    record = build_solve_record(result, telemetry, result.get('fingerprint'))
+    append_history(record, history_file)
+    if telemetry:
+        log(f"{result['name']}: {record['dof']} DOF, {record['equation_solver']}, "
+            f"{record['memory_mb']} MB, {record['iterations']} iteration(s), {record['wall_time'] or 0.0:.1f} s")
+    return record
+
+
+# ============================================================================
+# Solve Cache
+# ============================================================================
+
+def apply_solve_cache(jobs, backend, cache, on_cached=None):
+    """
+    Fingerprint every job and split off those whose solve can be skipped.
+
+    Named selection names and config inputs are collected once for all
+    analyses. The fingerprint is kept on each job so it can be recorded
+    after a successful solve.
+
+    Args:
+        jobs (list): Jobs from build_solve_jobs (fingerprint added in place)
+        backend: Solver backend (solve_inputs, result_file, is_solved)
+        cache (dict): Solve cache state
+        on_cached (callable): Optional callback(result) per skipped job
+
+    Returns:
+        tuple: (jobs to solve, results of skipped jobs with status 'cached')
+    """
+    from preprocessing.preflight import collect_named_selection_usages
+
+    named_selections = sorted(collect_named_selection_usages())
+    config_inputs = load_config_inputs()
+
+    to_solve = []
+    cached = []
+    for job in jobs:
+        number = job['analysis']
+        try:
+            job['fingerprint'] = input_fingerprint(backend.solve_inputs(number, named_selections), config_inputs)
+        except Exception as e:
+            log(f"Could not fingerprint analysis {number}, solving it: {str(e)}", "WARNING")
+            job['fingerprint'] = None
+            to_solve.append(job)
+            continue
+
+        if is_cached(cache, f"analysis_{number}", job['fingerprint'], backend.result_file(number),
+                     backend.is_solved(number)):
+            result = dict(job, name=backend.name(number), status=CACHED, started=None, finished=None,
+                          wall_time=0.0, error=None)
+            log(f"{result['name']}: inputs unchanged since the last solve, skipping")
+            cached.append(result)
+            if on_cached is not None:
+                try:
+                    on_cached(result)
+                except Exception as e:
+                    log(f"Post-solve callback failed for {result['name']}: {str(e)}", "ERROR")
+        else:
+            to_solve.append(job)
+    return to_solve, cached
+
+
+# ============================================================================
+# Post-Solve Extraction
+# ============================================================================
+
+def build_extraction_callback(extraction_config, jobs):
+    """
+    Build the callback that extracts bolt forces as soon as an analysis finishes.
+
+    Args:
+        extraction_config (dict): 'extraction' section (enabled, analyses)
+        jobs (list): Queued jobs
+
+    Returns:
+        tuple: (callback or None, list of analysis numbers extracted by the callback)
+    """
+    if not extraction_config.get('enabled', True):
+        return None, []
+
+    from postprocessing import bolt_force_extraction
+
+    analyses = extraction_config.get('analyses')
+    if analyses is None:
+        analyses = [bolt_force_extraction.load_config().get('analysis_number', 0)]
+    elif isinstance(analyses, int):
+        analyses = [analyses]
+    queued = set(job['analysis'] for job in jobs)
+    analyses = [number for number in analyses if number in queued]
+    csv_outfile = bolt_force_extraction.load_config().get('csv_outfile')
+
+    def extract(result):
+        number = result['analysis']
+        if result['status'] not in SUCCESS_STATES or number not in analyses:
+            return
+        outfile = None
+        if len(analyses) > 1 and csv_outfile:
+            base, extension = os.path.splitext(csv_outfile)
+            outfile = f"{base}_A{number}{extension}"
+        log(f"Extracting bolt forces of {result['name']}")
+        bolt_force_extraction.main(analysis_number=number, csv_outfile=outfile)
+        result['extracted'] = True
+
+    return extract, analyses
+
+
+# ============================================================================
+# Main Processing
+# ============================================================================
+
+def load_config():
+    """
+    Load configuration from YAML file, with fallback to embedded config.
+
+    Returns:
+        dict: Configuration dictionary
+    """
+    try:
+        config_path = get_config_path('solving_config.yaml')
+        config = load_yaml_config(config_path)
+        log(f"Loaded configuration from: {config_path}")
+        return config
+    except (ImportError, FileNotFoundError) as e:
+        log(f"Could not load YAML config: {str(e)}", "WARNING")
+        log("Using embedded configuration")
+        return EMBEDDED_CONFIG
+
+
+def run_from_config(config, backend=None):
+    """
+    Solve the configured analyses and extract results as they finish.
+
+    Args:
+        config (dict): Configuration dictionary
+        backend: Optional solver backend (default: from global_settings.backend)
+
+    Returns:
+        dict: Report with keys:
+            - results: One result per job (see run_solve_queue)
+            - errors: Results that did not finish successfully
+            - cached: Analysis numbers skipped by the solve cache
+            - extracted: Analysis numbers whose bolt forces were extracted
+    """
+    global_settings = config.get('global_settings', {})
+    set_logging(global_settings.get('log_details', True))
+    invalidate_named_selection_cache()
+    log_section("ANSYS Mechanical - Solve Orchestrator")
+
+    jobs = build_solve_jobs(config)
+    if not jobs:
+        log("No analyses queued for solving.", "WARNING")
+        return {'results': [], 'errors': [], 'extracted': []}
+    if backend is None:
+        backend = create_backend(global_settings)
+
+    telemetry_config = config.get('telemetry') or {}
+    autotune_config = config.get('autotune') or {}
+    if autotune_config.get('enabled', True):
+        autotune_jobs(jobs, backend, autotune_config, telemetry_config.get('history_file'))
+
+    extract, extracted_analyses = build_extraction_callback(config.get('extraction') or {}, jobs)
+
+    output_config = config.get('output_controls') or {}
+    if output_config.get('enabled', False):
+        trim_output_controls(jobs, backend, extracted_analyses, output_config)
+
+    cache_config = config.get('cache') or {}
+    cache = None
+    results = []
+    if cache_config.get('enabled', True):
+        cache = load_solve_cache(cache_config.get('state_file'))
+        jobs, results = apply_solve_cache(jobs, backend, cache, extract)
+
+    def on_finished(result):
+        if telemetry_config.get('enabled', True):
+            record_solve_telemetry(result, backend, telemetry_config.get('history_file'))
+        if cache is not None and result['status'] == DONE and result.get('fingerprint'):
+            record_solve(cache, f"analysis_{result['analysis']}", result['fingerprint'],
+                         backend.result_file(result['analysis']))
+            save_solve_cache(cache, cache_config.get('state_file'))
+        if extract is not None:
+            extract(result)
+
+    if jobs:
+        log(f"Queued {len(jobs)} analysis(es), up to {global_settings.get('max_concurrent', 1)} at a time")
+        try:
+            results.extend(run_solve_queue(jobs, backend,
+                                           max_concurrent=global_settings.get('max_concurrent', 1),
+                                           poll_interval=global_settings.get('poll_interval', 10.0),
+                                           timeout=global_settings.get('timeout'),
+                                           on_finished=on_finished))
+        finally:
+            # Leave the solve configuration as the user had it
+            backend.close()
+
+    report = {
+        'results': results,
+        'errors': [result for result in results if result['status'] not in SUCCESS_STATES],
+        'cached': [result['analysis'] for result in results if result['status'] == CACHED],
+        'extracted': [result['analysis'] for result in results if result.get('extracted')],
+    }
+    log("")
+    log(f"Solved {len(results) - len(report['errors']) - len(report['cached'])} of {len(results)} analysis(es), "
+        f"{len(report['cached'])} unchanged, extracted {len(report['extracted'])}")
+    log_section("Solving complete!")
+    return report
+
+
+def main():
+    """
+    Main function to solve the configured analyses.
+
+    Returns:
+        dict: Solve report
+    """
+    return run_from_config(load_config())
+
+
+# Run the script
+if __name__ == "__main__":
+    main()
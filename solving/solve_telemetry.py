@@ -0,0 +1,335 @@
+"""
+Solve Telemetry
+===============
+
+Records solver metrics of every solve so slow-downs can be tracked across
+models and runs.
+
+The solver output file (solve.out in the solver working directory) is
+streamed line by line, so memory use does not grow with the file size.
+Extracted per solve:
+- Degrees of freedom (number of equations)
+- Equation solver
+- Memory used (MB)
+- Cores and distributed/shared-memory mode
+- Wall time, total and per load step
+- Equilibrium iterations, total and per load step
+
+Per load step wall times come from the timing lines the solver prints
+while solving: cumulative elapsed times and the CP/TIME stamps of its
+notes, warnings and run summary. A load step ends at the first timing line
+after its last substep, or at the latest one before it if the solver
+continues with the next step first.
+
+One JSON record per solve is appended to state/solve_history.jsonl, shared
+by all models so the autotuner can learn across them; the query helpers
+below read it back for reports and other tooling.
+
+Used by solve_orchestrator.py when telemetry.enabled is set in
+config/solving_config.yaml.
+"""
+
+import sys
+import os
+import re
+import json
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.logging_config import log
+from utilities.state_helper import get_state_path
+
+
+HISTORY_FILENAME = 'solve_history.jsonl'
+SOLVE_OUTPUT_FILENAME = 'solve.out'
+
+# Solver output patterns (matched case-insensitively)
+DOF_PATTERN = re.compile(r'number of (?:equations|dofs?|degrees of freedom)\s*[=:]\s*(\d+)', re.I)
+SOLVER_PATTERN = re.compile(r'equation solver used\s*:\s*(.+?)\s*$', re.I)
+SOLVER_BANNERS = (
+    (re.compile(r'distributed sparse matrix direct solver', re.I), 'Sparse (distributed)'),
+    (re.compile(r'sparse matrix direct solver', re.I), 'Sparse'),
+    (re.compile(r'\bpcg\b|preconditioned conjugate gradient', re.I), 'PCG'),
+    (re.compile(r'jacobi conjugate gradient', re.I), 'JCG'),
+)
+MEMORY_PATTERN = re.compile(r'(?:sum of memory used on all processes|maximum total memory used|total memory used)'
+                            r'\s*[=:]\s*([\d.]+)\s*(KB|MB|GB)', re.I)
+CORES_PATTERN = re.compile(r'total number of cores requested\s*:\s*(\d+)\s*(?:\((.*?)\))?', re.I)
+ELAPSED_PATTERN = re.compile(r'elapsed time(?:\s*\(sec\))?\s*=\s*([\d.]+)', re.I)
+TIME_OF_DAY_PATTERN = re.compile(r'\bcp(?:\s+time)?(?:\s*\(sec\))?\s*=\s*[\d.]+\s+time\s*=\s*(\d{1,2}):(\d{2}):(\d{2})',
+                                 re.I)
+EQUILIBRIUM_PATTERN = re.compile(r'equil iter\s+\d+\s+completed', re.I)
+SUBSTEP_PATTERN = re.compile(r'load step\s+(\d+)\s+substep\s+(\d+)\s+completed\.?\s*(?:cum iter\s*=\s*(\d+))?', re.I)
+
+MEMORY_UNITS_MB = {'KB': 1.0 / 1024.0, 'MB': 1.0, 'GB': 1024.0}
+
+
+# ============================================================================
+# Solver Output Parsing
+# ============================================================================
+
+def parse_solve_output(lines):
+    """
+    Extract solve metrics from the lines of a solver output file.
+
+    The lines are consumed one at a time; only the metrics and one entry
+    per load step are kept.
+
+    Args:
+        lines: Iterable of lines (e.g. an open file)
+
+    Returns:
+        dict: dof, equation_solver, memory_mb, cores, distributed,
+              wall_time, iterations and load_steps (list of dicts with
+              load_step, substeps, iterations, wall_time)
+    """
+    record = {'dof': None, 'equation_solver': None, 'memory_mb': None, 'cores': None, 'distributed': None,
+              'wall_time': None, 'iterations': 0, 'load_steps': []}
+    steps = {}
+    pending_iterations = 0
+    elapsed = None
+    cumulative = None
+    # Seconds since the solve started, from the latest timing line
+    clock = None
+    day_offset = None
+    last_day_seconds = None
+    # Step whose end is taken from the next timing line, until the solver iterates again
+    open_step = None
+
+    for line in lines:
+        if EQUILIBRIUM_PATTERN.search(line):
+            pending_iterations += 1
+            open_step = None
+            continue
+
+        match = SUBSTEP_PATTERN.search(line)
+        if match:
+            number = int(match.group(1))
+            if number not in steps:
+                steps[number] = {'load_step': number, 'substeps': 0, 'iterations': 0, 'wall_time': None,
+                                 'wall_time_end': None}
+                record['load_steps'].append(steps[number])
+            step = steps[number]
+            step['substeps'] += 1
+            step['iterations'] += pending_iterations
+            record['iterations'] += pending_iterations
+            pending_iterations = 0
+            if match.group(3):
+                cumulative = int(match.group(3))
+            step['wall_time_end'] = clock
+            open_step = step
+            continue
+
+        seconds = None
+        match = ELAPSED_PATTERN.search(line)
+        if match:
+            elapsed = float(match.group(1))
+            seconds = elapsed
+        else:
+            match = TIME_OF_DAY_PATTERN.search(line)
+            if match:
+                day_seconds = 3600 * int(match.group(1)) + 60 * int(match.group(2)) + int(match.group(3))
+                if last_day_seconds is not None and day_seconds < last_day_seconds:
+                    day_offset += 86400  # past midnight
+                if day_offset is None:
+                    day_offset = (clock or 0.0) - day_seconds
+                last_day_seconds = day_seconds
+                seconds = day_seconds + day_offset
+        if seconds is not None:
+            clock = max(clock or 0.0, seconds)
+            if open_step is not None:
+                open_step['wall_time_end'] = clock
+                open_step = None
+            continue
+
+        match = DOF_PATTERN.search(line)
+        if match:
+            record['dof'] = max(record['dof'] or 0, int(match.group(1)))
+            continue
+
+        match = SOLVER_PATTERN.search(line)
+        if match:
+            record['equation_solver'] = match.group(1)
+            continue
+        if record['equation_solver'] is None:
+            for pattern, solver in SOLVER_BANNERS:
+                if pattern.search(line):
+                    record['equation_solver'] = solver
+                    break
+
+        match = MEMORY_PATTERN.search(line)
+        if match:
+            memory = float(match.group(1)) * MEMORY_UNITS_MB[match.group(2).upper()]
+            record['memory_mb'] = round(max(record['memory_mb'] or 0.0, memory), 1)
+            continue
+
+        match = CORES_PATTERN.search(line)
+        if match:
+            record['cores'] = int(match.group(1))
+            mode = (match.group(2) or '').lower()
+            if mode:
+                record['distributed'] = 'distributed' in mode
+
+    step_start = 0.0
+    for step in record['load_steps']:
+        end = step.pop('wall_time_end')
+        if end is not None:
+            step['wall_time'] = round(end - step_start, 3)
+            step_start = end
+    if cumulative is not None and cumulative > record['iterations']:
+        record['iterations'] = cumulative
+    record['wall_time'] = elapsed
+    return record
+
+
+def read_solve_telemetry(working_directory):
+    """
+    Parse solve.out in a solver working directory.
+
+    Args:
+        working_directory (str): Solver working directory
+
+    Returns:
+        dict: Metrics from parse_solve_output, or None if there is no solver output
+    """
+    if not working_directory:
+        return None
+    path = os.path.join(working_directory, SOLVE_OUTPUT_FILENAME)
+    if not os.path.isfile(path):
+        return None
+    with open(path, 'r', errors='replace') as f:
+        return parse_solve_output(f)
+
+
+# ============================================================================
+# History
+# ============================================================================
+
+def get_history_path(history_file=None):
+    """Get the solve history path (default: state/solve_history.jsonl, shared by all models)."""
+    return history_file or get_state_path(HISTORY_FILENAME, per_model=False)
+
+
+def append_history(record, history_file=None):
+    """
+    Append one solve record to the history.
+
+    Args:
+        record (dict): Solve record
+        history_file (str): Optional history path
+    """
+    path = get_history_path(history_file)
+    directory = os.path.dirname(path)
+    try:
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(path, 'a') as f:
+            f.write(json.dumps(record, sort_keys=True) + '\n')
+    except Exception as e:
+        log(f"Could not write solve history '{path}': {str(e)}", "WARNING")
+
+
+def iter_history(history_file=None):
+    """
+    Iterate over the recorded solves, oldest first.
+
+    Lines that cannot be parsed are skipped.
+
+    Args:
+        history_file (str): Optional history path
+
+    Yields:
+        dict: Solve records
+    """
+    path = get_history_path(history_file)
+    if not os.path.exists(path):
+        return
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def query_history(history_file=None, analysis=None, name=None, status=None, since=None, where=None):
+    """
+    Select recorded solves.
+
+    Args:
+        history_file (str): Optional history path
+        analysis (int): Only this analysis number
+        name (str): Only analyses with this name
+        status (str): Only solves with this status (e.g. 'done')
+        since (str): Only solves recorded at or after this time ('%Y-%m-%d %H:%M:%S')
+        where (callable): Optional extra predicate(record) -> bool
+
+    Returns:
+        list: Matching records, oldest first
+    """
+    records = []
+    for record in iter_history(history_file):
+        if analysis is not None and record.get('analysis') != analysis:
+            continue
+        if name is not None and record.get('name') != name:
+            continue
+        if status is not None and record.get('status') != status:
+            continue
+        if since is not None and (record.get('recorded_at') or '') < since:
+            continue
+        if where is not None and not where(record):
+            continue
+        records.append(record)
+    return records
+
+
+def latest_record(history_file=None, **filters):
+    """Get the most recent solve matching query_history filters, or None."""
+    latest = None
+    for record in query_history(history_file, **filters):
+        latest = record
+    return latest
+
+
+def build_solve_record(result, telemetry=None, fingerprint=None):
+    """
+    Combine an orchestrator result with the parsed solver metrics.
+
+    The requested cores and mode are kept from the orchestrator result;
+    the solver output fills in what it reports and the wall time measured
+    by the orchestrator is kept as queue_wall_time.
+
+    Args:
+        result (dict): Result from run_solve_queue
+        telemetry (dict): Metrics from read_solve_telemetry (or None)
+        fingerprint (str): Optional input fingerprint of the solve
+
+    Returns:
+        dict: Solve record
+    """
+    telemetry = telemetry or {}
+    record = {
+        'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'analysis': result['analysis'],
+        'name': result.get('name'),
+        'status': result['status'],
+        'error': result.get('error'),
+        'fingerprint': fingerprint,
+        'cores': result.get('cores'),
+        'distributed': result.get('distributed'),
+        'queue_wall_time': result.get('wall_time'),
+        'solver_output': bool(telemetry),
+    }
+    for key in ('dof', 'equation_solver', 'memory_mb', 'iterations', 'load_steps'):
+        record[key] = telemetry.get(key)
+    record['wall_time'] = telemetry['wall_time'] if telemetry.get('wall_time') is not None else result.get('wall_time')
+    if telemetry.get('cores') is not None:
+        record['solver_cores'] = telemetry['cores']
+    if telemetry.get('distributed') is not None:
+        record['solver_distributed'] = telemetry['distributed']
+    return record
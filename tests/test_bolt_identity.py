@@ -0,0 +1,37 @@
+"""Tests for the stable bolt numbering."""
+from types import SimpleNamespace
+
+from utilities import bolt_identity
+from utilities.bolt_identity import assign_bolt_indices, get_identity_state
+
+
+def face(face_id, x):
+    return SimpleNamespace(Id=face_id, Centroid=[x, 0.0, 0.0])
+
+
+def test_indices_survive_removed_and_renumbered_faces():
+    identity = {}
+    indices, retired = assign_bolt_indices([face(1, 0.0), face(2, 1.0), face(3, 2.0)], identity)
+    assert indices == [1, 2, 3] and retired == []
+
+    # Face 2 removed, face 3 renumbered to 30, a new face added
+    indices, retired = assign_bolt_indices([face(30, 2.0), face(1, 0.0), face(4, 5.0)], identity)
+    assert indices == [3, 1, 4]
+    assert retired == [2]
+
+
+def test_identity_state_is_dropped_for_another_model(monkeypatch):
+    monkeypatch.setattr(bolt_identity, 'get_model_key', lambda: 'first_0000')
+    state = {}
+    get_identity_state(state)['Bolts'] = {'next_index': 5}
+    assert get_identity_state(state) == {'Bolts': {'next_index': 5}}
+
+    monkeypatch.setattr(bolt_identity, 'get_model_key', lambda: 'second_1111')
+    assert get_identity_state(state) == {}
+    assert state['bolt_ids_model'] == 'second_1111'
+
+
+def test_identity_state_outside_mechanical_is_kept(monkeypatch):
+    monkeypatch.setattr(bolt_identity, 'get_model_key', lambda: None)
+    state = {'bolt_ids': {'Bolts': {}}, 'bolt_ids_model': 'first_0000'}
+    assert get_identity_state(state) == {'Bolts': {}}
@@ -0,0 +1,67 @@
+"""Tests for the pairwise contact detection on synthetic face boxes."""
+import numpy as np
+
+from preprocessing.contact_detection import find_contact_pairs, auto_pinball_radius
+from utilities.face_table import grid_triangles
+
+
+def plate_face(z, offset=0.0, size=10.0, samples=3):
+    """Square face at height z sampled on a coarse grid, shifted by offset in x and y."""
+    params = np.linspace(0.0, size, samples) + offset
+    grid = np.array([[[x, y, z] for y in params] for x in params])
+    points = grid.reshape(-1, 3)
+    return points, grid_triangles(grid)
+
+
+def face_boxes(faces):
+    return {
+        'face_id': np.array([face_id for face_id, _, _, _ in faces]),
+        'body_id': np.array([body_id for _, body_id, _, _ in faces]),
+        'low': np.array([points.min(axis=0) for _, _, points, _ in faces]),
+        'high': np.array([points.max(axis=0) for _, _, points, _ in faces]),
+        'points': [points for _, _, points, _ in faces],
+        'triangles': [triangles for _, _, _, triangles in faces],
+    }
+
+
+def test_touching_faces_with_offset_samples_are_detected():
+    # Coarse samples 5 apart: the closest sample points are 3.5 apart although the faces touch
+    top = plate_face(0.0, offset=2.5)
+    bottom = plate_face(0.0)
+    far = plate_face(3.0)
+    boxes = face_boxes([(11, 1, *top[:2]), (21, 2, *bottom[:2]), (31, 3, *far[:2])])
+
+    pairs = find_contact_pairs(boxes, pinball=0.5)
+
+    assert list(pairs) == [(1, 2)]
+    assert pairs[(1, 2)]['source'] == [11]
+    assert pairs[(1, 2)]['target'] == [21]
+    assert pairs[(1, 2)]['min_gap'] == 0.0
+    assert np.all(pairs[(1, 2)]['gaps'] <= 0.5)
+
+
+def test_gap_between_faces_is_measured_to_the_surface():
+    boxes = face_boxes([(11, 1, *plate_face(0.2, offset=2.5)), (21, 2, *plate_face(0.0))])
+
+    pairs = find_contact_pairs(boxes, pinball=0.5)
+
+    np.testing.assert_allclose(pairs[(1, 2)]['min_gap'], 0.2)
+    np.testing.assert_allclose(pairs[(1, 2)]['gaps'], 0.2)
+
+
+def test_faces_without_triangles_fall_back_to_sample_points():
+    top, _ = plate_face(0.1)
+    bottom, _ = plate_face(0.0)
+    boxes = face_boxes([(11, 1, top, np.zeros((0, 3, 3))), (21, 2, bottom, np.zeros((0, 3, 3)))])
+
+    np.testing.assert_allclose(find_contact_pairs(boxes, pinball=0.5)[(1, 2)]['min_gap'], 0.1)
+
+
+def test_auto_pinball_radius_covers_the_surface_gaps():
+    boxes = face_boxes([(11, 1, *plate_face(0.2, offset=2.5)), (21, 2, *plate_face(0.0))])
+    gaps = find_contact_pairs(boxes, pinball=1.0)[(1, 2)]['gaps']
+
+    np.testing.assert_allclose(auto_pinball_radius(gaps, safety_factor=1.5), 0.3)
+    assert auto_pinball_radius(gaps, min_radius=0.5) == 0.5
+    assert auto_pinball_radius(gaps, max_radius=0.25) == 0.25
+    assert auto_pinball_radius([], max_radius=1.0) == 1.0
@@ -0,0 +1,101 @@
+"""Tests for the cores and mode recommendations of the solve autotuner."""
+from solving.solve_autotuner import (DEFAULT_SETTINGS, estimate_dof, estimate_configurations,
+                                     recommend_configuration, autotune_jobs)
+from solving.solve_orchestrator import FakeSolverBackend
+from solving.solve_telemetry import append_history
+
+
+def record(cores, wall_time, dof=100000, distributed=False, memory_mb=None, analysis=0):
+    return {'analysis': analysis, 'status': 'done', 'dof': dof, 'wall_time': wall_time, 'cores': cores,
+            'distributed': distributed, 'memory_mb': memory_mb}
+
+
+def job(cores=4, distributed=False, pinned=False):
+    return {'analysis': 0, 'cores': cores, 'distributed': distributed, 'pinned': pinned}
+
+
+HISTORY = [
+    record(4, 100.0),
+    record(4, 110.0),
+    record(8, 60.0, memory_mb=8000.0),
+    record(16, 70.0, memory_mb=12000.0),
+    record(8, 40.0, distributed=True, dof=400000),
+]
+
+
+def test_estimate_configurations_scales_similar_solves_to_the_dof():
+    candidates = estimate_configurations(HISTORY, 120000, DEFAULT_SETTINGS)
+
+    assert [(candidate['cores'], candidate['distributed']) for candidate in candidates] == \
+        [(8, False), (16, False), (4, False)]
+    assert candidates[0]['expected_wall_time'] == 72.0
+    assert candidates[0]['expected_memory_mb'] == 9600.0
+    assert candidates[2]['samples'] == 2
+
+
+def test_recommend_configuration_picks_the_fastest_cores():
+    recommendation = recommend_configuration(job(cores=4), 100000, HISTORY, DEFAULT_SETTINGS)
+
+    assert recommendation['change']
+    assert recommendation['recommended'] == {'cores': 8, 'distributed': False}
+    assert recommendation['configured_wall_time'] == 105.0
+    assert recommendation['expected_wall_time'] == 60.0
+
+
+def test_recommend_configuration_keeps_the_fastest_configured_cores():
+    recommendation = recommend_configuration(job(cores=8), 100000, HISTORY, DEFAULT_SETTINGS)
+
+    assert not recommendation['change']
+    assert recommendation['reason'] == 'configured cores are the fastest'
+
+
+def test_recommend_configuration_ignores_small_gains():
+    settings = dict(DEFAULT_SETTINGS, min_gain=0.2)
+    recommendation = recommend_configuration(job(cores=16), 100000, HISTORY, settings)
+
+    assert recommendation['recommended'] == {'cores': 8, 'distributed': False}
+    assert not recommendation['change']
+
+
+def test_recommend_configuration_respects_limits():
+    settings = dict(DEFAULT_SETTINGS, max_cores=4)
+    assert recommend_configuration(job(cores=16), 100000, HISTORY, settings)['recommended'] == \
+        {'cores': 4, 'distributed': False}
+
+    settings = dict(DEFAULT_SETTINGS, max_memory_mb=10000)
+    assert recommend_configuration(job(cores=4), 100000, HISTORY, settings)['recommended'] == \
+        {'cores': 8, 'distributed': False}
+    settings = dict(DEFAULT_SETTINGS, max_memory_mb=5000)
+    assert recommend_configuration(job(cores=16), 100000, HISTORY, settings)['recommended'] == \
+        {'cores': 4, 'distributed': False}
+
+
+def test_recommend_configuration_keeps_pinned_and_unknown_jobs():
+    assert recommend_configuration(job(pinned=True), 100000, HISTORY, DEFAULT_SETTINGS)['reason'] == \
+        'cores set explicitly'
+    assert recommend_configuration(job(), None, HISTORY, DEFAULT_SETTINGS)['reason'] == 'DOF count unknown'
+    assert recommend_configuration(job(), 10, HISTORY, DEFAULT_SETTINGS)['reason'] == \
+        'no similar solves in the history'
+
+
+def test_estimate_dof_prefers_the_mesh_over_the_history():
+    backend = FakeSolverBackend(inputs={0: {'mesh': {'nodes': 1000}}})
+    assert estimate_dof(backend, 0, HISTORY) == 3000
+    assert estimate_dof(FakeSolverBackend(), 0, HISTORY) == 400000
+    assert estimate_dof(FakeSolverBackend(), 1, HISTORY) is None
+
+
+def test_autotune_jobs_applies_recommendations_unless_dry_run(tmp_path):
+    history_file = str(tmp_path / 'history.jsonl')
+    for entry in HISTORY:
+        append_history(entry, history_file)
+    backend = FakeSolverBackend(inputs={0: {'mesh': {'nodes': 33334}}})
+
+    jobs = [job(cores=4)]
+    autotune_jobs(jobs, backend, {'dry_run': True}, history_file)
+    assert jobs[0]['cores'] == 4
+
+    jobs = [job(cores=4), dict(job(cores=2, pinned=True), analysis=1)]
+    recommendations = autotune_jobs(jobs, backend, {}, history_file)
+    assert [entry['cores'] for entry in jobs] == [8, 2]
+    assert [recommendation['change'] for recommendation in recommendations] == [True, False]
@@ -0,0 +1,36 @@
+"""Tests for the tree inputs of the solve cache fingerprint."""
+from types import SimpleNamespace
+
+from solving.solve_cache import read_tree_inputs, input_fingerprint
+
+
+def tree_object(category, name, children=(), **properties):
+    return SimpleNamespace(DataModelObjectCategory=category, Name=name, Children=list(children), **properties)
+
+
+def make_analysis(magnitude='10 [N]', suppressed=False, face_ids=(3, 1)):
+    force = tree_object('Force', 'Force', Suppressed=suppressed, Magnitude=magnitude,
+                        Location=SimpleNamespace(Ids=list(face_ids)))
+    return tree_object('Analysis', 'Static Structural', [
+        tree_object('AnalysisSettings', 'Analysis Settings'),
+        force,
+        tree_object('Solution', 'Solution', [tree_object('EquivalentStress', 'Equivalent Stress')]),
+    ])
+
+
+def test_read_tree_inputs_reads_loads_and_skips_the_solution():
+    objects = read_tree_inputs(make_analysis())
+
+    assert objects == [{'category': 'Force', 'name': 'Force', 'Suppressed': 'False', 'Magnitude': '10 [N]',
+                        'Location': [1, 3]}]
+
+
+def test_tree_edits_change_the_fingerprint():
+    def fingerprint(analysis):
+        return input_fingerprint({'objects': read_tree_inputs(analysis)}, {})
+
+    original = fingerprint(make_analysis())
+    assert fingerprint(make_analysis()) == original
+    assert fingerprint(make_analysis(magnitude='20 [N]')) != original
+    assert fingerprint(make_analysis(suppressed=True)) != original
+    assert fingerprint(make_analysis(face_ids=(1, 4))) != original
@@ -0,0 +1,287 @@
+"""Tests for the solve queue, the fake solver backend and the solve cache."""
+import os
+
+import pytest
+
+from solving import solve_orchestrator
+from solving.solve_orchestrator import (FakeSolverBackend, build_solve_jobs, run_solve_queue, apply_solve_cache,
+                                        DONE, FAILED, TIMEOUT, RUNNING, CACHED)
+from solving.solve_cache import record_solve
+
+
+class FakeClock:
+    """Manual clock: sleep() advances the time instead of waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_jobs(*numbers, cores=4, distributed=False):
+    return [{'analysis': number, 'cores': cores, 'distributed': distributed, 'pinned': False}
+            for number in numbers]
+
+
+# ============================================================================
+# Jobs
+# ============================================================================
+
+def test_build_solve_jobs_applies_defaults_and_pins_explicit_entries():
+    config = {
+        'defaults': {'cores': 8, 'distributed': True},
+        'analyses': [0, {'analysis': 1, 'cores': 2}, 0],
+    }
+    jobs = build_solve_jobs(config)
+
+    assert jobs == [
+        {'analysis': 0, 'cores': 8, 'distributed': True, 'pinned': False},
+        {'analysis': 1, 'cores': 2, 'distributed': True, 'pinned': True},
+    ]
+
+
+# ============================================================================
+# Fake Backend
+# ============================================================================
+
+def test_fake_backend_runs_until_its_duration_has_elapsed():
+    clock = FakeClock()
+    backend = FakeSolverBackend(durations={0: 5.0}, clock=clock)
+
+    backend.start(0, 4, False)
+    assert backend.poll(0) == RUNNING
+    assert not backend.is_solved(0)
+
+    clock.now = 5.0
+    assert backend.poll(0) == DONE
+    assert backend.is_solved(0)
+    assert backend.calls == [{'analysis': 0, 'cores': 4, 'distributed': False}]
+
+
+def test_fake_backend_reports_failures():
+    backend = FakeSolverBackend(failures=[1], clock=FakeClock())
+
+    backend.start(1, 4, False)
+    assert backend.poll(1) == FAILED
+    assert not backend.is_solved(1)
+
+
+def test_fake_backend_writes_solver_files(tmp_path):
+    backend = FakeSolverBackend(clock=FakeClock(), working_dir=str(tmp_path), inputs={0: {'mesh': {'nodes': 100}}})
+
+    backend.start(0, 2, True)
+    assert backend.poll(0) == DONE
+
+    directory = backend.working_directory(0)
+    assert os.path.isfile(backend.result_file(0))
+    with open(os.path.join(directory, 'solve.out')) as f:
+        output = f.read()
+    assert 'Number of equations = 300' in output
+    assert 'Distributed Memory Parallel' in output
+
+
+def test_fake_backend_clears_old_results_when_a_solve_starts(tmp_path):
+    clock = FakeClock()
+    backend = FakeSolverBackend(durations={0: 1.0}, clock=clock, working_dir=str(tmp_path))
+    backend.start(0, 4, False)
+    clock.now = 1.0
+    backend.poll(0)
+
+    restarted = FakeSolverBackend(durations={0: 1.0}, clock=clock, working_dir=str(tmp_path))
+    assert restarted.is_solved(0)
+    restarted.start(0, 4, False)
+    assert not restarted.is_solved(0)
+
+
+def test_fake_backend_duration_model_sees_cores_and_mode():
+    clock = FakeClock()
+    backend = FakeSolverBackend(duration_model=lambda number, cores, distributed: 8.0 / cores, clock=clock)
+
+    backend.start(0, 4, False)
+    clock.now = 1.9
+    assert backend.poll(0) == RUNNING
+    clock.now = 2.0
+    assert backend.poll(0) == DONE
+
+
+# ============================================================================
+# Solve Queue
+# ============================================================================
+
+def test_run_solve_queue_solves_one_at_a_time_in_order():
+    clock = FakeClock()
+    backend = FakeSolverBackend(durations={0: 3.0, 1: 2.0}, clock=clock)
+    finished = []
+
+    results = run_solve_queue(make_jobs(0, 1), backend, max_concurrent=1, poll_interval=1.0,
+                              on_finished=lambda result: finished.append(result['analysis']),
+                              sleep=clock.sleep, clock=clock)
+
+    assert finished == [0, 1]
+    assert [result['status'] for result in results] == [DONE, DONE]
+    assert [result['started'] for result in results] == [0.0, 3.0]
+    assert [result['wall_time'] for result in results] == [3.0, 2.0]
+    assert clock.now == 5.0
+
+
+def test_run_solve_queue_limits_concurrent_solves():
+    clock = FakeClock()
+    backend = FakeSolverBackend(durations={0: 4.0, 1: 1.0, 2: 1.0}, clock=clock)
+    finished = []
+
+    results = run_solve_queue(make_jobs(0, 1, 2), backend, max_concurrent=2, poll_interval=1.0,
+                              on_finished=lambda result: finished.append(result['analysis']),
+                              sleep=clock.sleep, clock=clock)
+
+    started = {result['analysis']: result['started'] for result in results}
+    assert started == {0: 0.0, 1: 0.0, 2: 1.0}
+    assert finished == [1, 2, 0]
+    assert clock.now == 4.0
+
+
+def test_run_solve_queue_times_out_long_solves():
+    clock = FakeClock()
+    backend = FakeSolverBackend(durations={0: 100.0, 1: 1.0}, clock=clock)
+
+    results = run_solve_queue(make_jobs(0, 1), backend, max_concurrent=1, poll_interval=1.0, timeout=10.0,
+                              sleep=clock.sleep, clock=clock)
+
+    statuses = {result['analysis']: result['status'] for result in results}
+    assert statuses == {0: TIMEOUT, 1: DONE}
+    assert 'exceeded' in results[0]['error']
+    assert backend.stopped == [0]
+
+
+def test_run_solve_queue_stops_timed_out_solves_before_starting_the_next():
+    class Recording(FakeSolverBackend):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.events = []
+
+        def start(self, analysis_number, cores, distributed):
+            self.events.append(('start', analysis_number))
+            super().start(analysis_number, cores, distributed)
+
+        def stop(self, analysis_number):
+            self.events.append(('stop', analysis_number))
+            super().stop(analysis_number)
+
+    clock = FakeClock()
+    backend = Recording(durations={0: 100.0, 1: 1.0}, clock=clock)
+
+    run_solve_queue(make_jobs(0, 1), backend, max_concurrent=1, poll_interval=1.0, timeout=5.0,
+                    sleep=clock.sleep, clock=clock)
+
+    assert backend.events == [('start', 0), ('stop', 0), ('start', 1)]
+
+
+def test_run_solve_queue_continues_after_failures():
+    class StartFailure(FakeSolverBackend):
+        def start(self, analysis_number, cores, distributed):
+            if analysis_number == 0:
+                raise RuntimeError('no license')
+            super().start(analysis_number, cores, distributed)
+
+    clock = FakeClock()
+    backend = StartFailure(failures=[1], clock=clock)
+
+    def callback(result):
+        raise RuntimeError('extraction failed')
+
+    results = run_solve_queue(make_jobs(0, 1, 2), backend, on_finished=callback, sleep=clock.sleep, clock=clock)
+
+    statuses = {result['analysis']: result['status'] for result in results}
+    assert statuses == {0: FAILED, 1: FAILED, 2: DONE}
+    assert 'no license' in results[0]['error']
+
+
+# ============================================================================
+# Solve Cache
+# ============================================================================
+
+@pytest.fixture
+def no_model_inputs(monkeypatch):
+    """Replace the named selection and config inputs read from the model."""
+    import preprocessing.preflight
+    monkeypatch.setattr(preprocessing.preflight, 'collect_named_selection_usages', lambda: set())
+    monkeypatch.setattr(solve_orchestrator, 'load_config_inputs', lambda: {'contacts': []})
+
+
+def solved_backend(tmp_path, inputs):
+    clock = FakeClock()
+    backend = FakeSolverBackend(clock=clock, working_dir=str(tmp_path), inputs=inputs)
+    backend.start(0, 4, False)
+    backend.poll(0)
+    return backend
+
+
+def test_apply_solve_cache_skips_unchanged_solves(tmp_path, no_model_inputs):
+    inputs = {0: {'mesh': {'nodes': 10, 'elements': 2}}}
+    backend = solved_backend(tmp_path, inputs)
+    cache = {}
+    jobs = make_jobs(0)
+
+    to_solve, cached = apply_solve_cache(jobs, backend, cache)
+    assert to_solve == jobs
+    record_solve(cache, 'analysis_0', jobs[0]['fingerprint'], backend.result_file(0))
+
+    skipped = []
+    to_solve, cached = apply_solve_cache(make_jobs(0), backend, cache, on_cached=skipped.append)
+    assert to_solve == []
+    assert [result['status'] for result in cached] == [CACHED]
+    assert skipped == cached
+
+
+def test_apply_solve_cache_solves_changed_inputs(tmp_path, no_model_inputs):
+    backend = solved_backend(tmp_path, {0: {'mesh': {'nodes': 10, 'elements': 2}}})
+    cache = {}
+    jobs = make_jobs(0)
+    apply_solve_cache(jobs, backend, cache)
+    record_solve(cache, 'analysis_0', jobs[0]['fingerprint'], backend.result_file(0))
+
+    backend.inputs[0] = {'mesh': {'nodes': 12, 'elements': 2}}
+    to_solve, cached = apply_solve_cache(make_jobs(0), backend, cache)
+    assert [job['analysis'] for job in to_solve] == [0]
+    assert cached == []
+
+
+def test_apply_solve_cache_solves_analyses_that_are_not_solved(tmp_path, no_model_inputs):
+    backend = solved_backend(tmp_path, {0: {'mesh': {'nodes': 10, 'elements': 2}}})
+    cache = {}
+    jobs = make_jobs(0)
+    apply_solve_cache(jobs, backend, cache)
+    record_solve(cache, 'analysis_0', jobs[0]['fingerprint'], backend.result_file(0))
+
+    backend.is_solved = lambda analysis_number: False
+    to_solve, cached = apply_solve_cache(make_jobs(0), backend, cache)
+    assert [job['analysis'] for job in to_solve] == [0]
+    assert cached == []
+
+
+# ============================================================================
+# Run From Config
+# ============================================================================
+
+def test_run_from_config_closes_the_backend_when_the_queue_fails(monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError('solver crashed')
+
+    monkeypatch.setattr(solve_orchestrator, 'run_solve_queue', fail)
+    backend = FakeSolverBackend(clock=FakeClock())
+    config = {
+        'analyses': [0],
+        'autotune': {'enabled': False},
+        'cache': {'enabled': False},
+        'telemetry': {'enabled': False},
+        'extraction': {'enabled': False},
+    }
+
+    with pytest.raises(RuntimeError):
+        solve_orchestrator.run_from_config(config, backend)
+    assert backend.closed
@@ -0,0 +1,142 @@
+"""Tests for the solver output parser and the solve history."""
+from solving.solve_telemetry import parse_solve_output, append_history, query_history, latest_record
+
+
+def test_parse_solve_output_reads_the_solve_metrics():
+    lines = [
+        " Number of equations = 30000",
+        " EQUIL ITER   1 COMPLETED.",
+        " EQUIL ITER   2 COMPLETED.",
+        " *** LOAD STEP     1   SUBSTEP     1  COMPLETED.    CUM ITER =      2",
+        " EQUIL ITER   1 COMPLETED.",
+        " *** LOAD STEP     2   SUBSTEP     1  COMPLETED.    CUM ITER =      3",
+        " Equation solver used : Sparse (symmetric)",
+        " Sum of memory used on all processes = 2.5 GB",
+        " Total number of cores requested : 8 (Distributed Memory Parallel)",
+        " Elapsed Time (sec) = 42.500",
+    ]
+    record = parse_solve_output(lines)
+
+    assert record['dof'] == 30000
+    assert record['equation_solver'] == 'Sparse (symmetric)'
+    assert record['memory_mb'] == 2560.0
+    assert record['cores'] == 8
+    assert record['distributed'] is True
+    assert record['wall_time'] == 42.5
+    assert record['iterations'] == 3
+    assert [(step['load_step'], step['substeps'], step['iterations']) for step in record['load_steps']] == \
+        [(1, 1, 2), (2, 1, 1)]
+
+
+# Excerpt of a MAPDL solve.out of a two step nonlinear solve
+MAPDL_SOLVE_OUTPUT = """
+ *** NOTE ***                            CP =       2.016   TIME= 23:59:50
+ The automatic domain decomposition logic has selected the MESH domain
+ decomposition method with 8 processes per solution.
+
+ Total number of cores requested   :  8 (Distributed Memory Parallel)
+
+                      S O L U T I O N   O P T I O N S
+
+   PROBLEM DIMENSIONALITY. . . . . . . . . . . . .3-D
+   DEGREES OF FREEDOM. . . . . . UX   UY   UZ
+   ANALYSIS TYPE . . . . . . . . . . . . . . . . .STATIC (STEADY-STATE)
+   EQUATION SOLVER OPTION. . . . . . . . . . . . .SPARSE
+
+ *** NOTE ***                            CP =       2.297   TIME= 23:59:52
+ The conditions for direct assembly have been met for all elements.
+
+ DISTRIBUTED SPARSE MATRIX DIRECT SOLVER.
+  Number of equations =      151233,    Maximum wavefront =    183
+
+ FORCE CONVERGENCE VALUE  =  0.4517E+05  CRITERION=   225.9
+ EQUIL ITER   1 COMPLETED.  NEW TRIANG MATRIX.  MAX DOF INC=  0.1262E-01
+ FORCE CONVERGENCE VALUE  =   61.73      CRITERION=   226.0     <<< CONVERGED
+ EQUIL ITER   2 COMPLETED.  NEW TRIANG MATRIX.  MAX DOF INC=  0.8531E-04
+ *** LOAD STEP     1   SUBSTEP     1  COMPLETED.    CUM ITER =      2
+ *** TIME =   1.00000         TIME INC =   1.00000
+ *** NOTE ***                            CP =      19.484   TIME= 00:00:12
+ Results of load step 1 written to the result file.
+
+ FORCE CONVERGENCE VALUE  =  0.2231E+06  CRITERION=   1116.
+ EQUIL ITER   1 COMPLETED.  NEW TRIANG MATRIX.  MAX DOF INC=  0.5017E-01
+ FORCE CONVERGENCE VALUE  =   4093.      CRITERION=   1095.
+ EQUIL ITER   2 COMPLETED.  NEW TRIANG MATRIX.  MAX DOF INC=  0.1433E-02
+ FORCE CONVERGENCE VALUE  =   37.18      CRITERION=   1102.     <<< CONVERGED
+ EQUIL ITER   3 COMPLETED.  NEW TRIANG MATRIX.  MAX DOF INC=  0.2745E-04
+ *** LOAD STEP     2   SUBSTEP     1  COMPLETED.    CUM ITER =      5
+ *** TIME =   2.00000         TIME INC =   1.00000
+
+ *** PROBLEM STATISTICS
+     Sum of memory used on all processes   =     3124.0 MB
+
+ +--------------------- D I S T R I B U T E D   A N S Y S   S T A T S ------------------------+
+ |-----------------------------------------------------------------|
+ |                                                                 |
+ | CP Time      (sec) =         51.203       Time  =  00:00:41     |
+ | Elapsed Time (sec) =         53.000       Date  =  03/16/2024   |
+ |                                                                 |
+ *-----------------------------------------------------------------*
+""".splitlines()
+
+
+def test_parse_solve_output_reads_a_mapdl_solve_output():
+    record = parse_solve_output(MAPDL_SOLVE_OUTPUT)
+
+    assert record['dof'] == 151233
+    assert record['equation_solver'] == 'Sparse (distributed)'
+    assert record['memory_mb'] == 3124.0
+    assert record['cores'] == 8
+    assert record['distributed'] is True
+    assert record['wall_time'] == 53.0
+    assert record['iterations'] == 5
+    # Step ends from the CP/TIME stamps after each step, across midnight
+    assert [(step['load_step'], step['iterations'], step['wall_time']) for step in record['load_steps']] == \
+        [(1, 2, 22.0), (2, 3, 29.0)]
+
+
+def test_parse_solve_output_times_steps_from_elapsed_lines_on_either_side_of_the_substep():
+    after = [
+        " EQUIL ITER   1 COMPLETED.",
+        " *** LOAD STEP     1   SUBSTEP     1  COMPLETED.    CUM ITER =      1",
+        " *** ELAPSED TIME =     10.000",
+        " EQUIL ITER   1 COMPLETED.",
+        " *** LOAD STEP     2   SUBSTEP     1  COMPLETED.    CUM ITER =      2",
+        " *** ELAPSED TIME =     25.000",
+    ]
+    before = [
+        " EQUIL ITER   1 COMPLETED.",
+        " *** ELAPSED TIME =     10.000",
+        " *** LOAD STEP     1   SUBSTEP     1  COMPLETED.    CUM ITER =      1",
+        " EQUIL ITER   1 COMPLETED.",
+        " *** ELAPSED TIME =     25.000",
+        " *** LOAD STEP     2   SUBSTEP     1  COMPLETED.    CUM ITER =      2",
+    ]
+
+    for lines in (after, before):
+        record = parse_solve_output(lines)
+        assert [step['wall_time'] for step in record['load_steps']] == [10.0, 15.0]
+        assert record['wall_time'] == 25.0
+
+
+def test_parse_solve_output_handles_missing_metrics():
+    record = parse_solve_output(["unrelated line"])
+
+    assert record['dof'] is None
+    assert record['wall_time'] is None
+    assert record['load_steps'] == []
+
+
+def test_history_queries(tmp_path):
+    history_file = str(tmp_path / 'history.jsonl')
+    append_history({'analysis': 0, 'status': 'done', 'recorded_at': '2024-01-01 00:00:00'}, history_file)
+    append_history({'analysis': 1, 'status': 'failed', 'recorded_at': '2024-02-01 00:00:00'}, history_file)
+    append_history({'analysis': 0, 'status': 'done', 'recorded_at': '2024-03-01 00:00:00'}, history_file)
+    with open(history_file, 'a') as f:
+        f.write("not json\n")
+
+    assert len(query_history(history_file)) == 3
+    assert len(query_history(history_file, analysis=0, status='done')) == 2
+    assert len(query_history(history_file, since='2024-02-01 00:00:00')) == 2
+    assert latest_record(history_file, analysis=0)['recorded_at'] == '2024-03-01 00:00:00'
+    assert query_history(str(tmp_path / 'missing.jsonl')) == []
@@ -0,0 +1,108 @@
+"""Tests for the spatial hash, sweep-and-prune and point and surface distances."""
+import numpy as np
+
+from utilities.spatial_index import (SpatialHash, connected_components, cluster_coaxial_faces, sweep_and_prune,
+                                     nearest_distances, closest_points_on_triangles, nearest_surface_distances)
+
+
+def brute_force_pairs(points, radius):
+    pairs = [(i, j) for i in range(len(points)) for j in range(i + 1, len(points))
+             if np.linalg.norm(points[i] - points[j]) <= radius]
+    return sorted(pairs)
+
+
+def brute_force_overlaps(low, high, margin):
+    pairs = []
+    for i in range(len(low)):
+        for j in range(i + 1, len(low)):
+            if np.all(low[i] <= high[j] + margin) and np.all(low[j] <= high[i] + margin):
+                pairs.append((i, j))
+    return pairs
+
+
+def test_query_radius_matches_brute_force():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-5.0, 5.0, size=(300, 3))
+    index = SpatialHash(points, 1.0)
+
+    point = np.array([0.3, -0.2, 1.1])
+    expected = np.flatnonzero(np.linalg.norm(points - point, axis=1) <= 1.5)
+    np.testing.assert_array_equal(index.query_radius(point, 1.5), expected)
+
+
+def test_query_pairs_matches_brute_force():
+    rng = np.random.default_rng(1)
+    points = rng.uniform(0.0, 4.0, size=(200, 3))
+    pairs = SpatialHash(points, 0.5).query_pairs(0.7)
+
+    assert sorted(map(tuple, pairs.tolist())) == brute_force_pairs(points, 0.7)
+
+
+def test_empty_index():
+    index = SpatialHash(np.zeros((0, 3)), 1.0)
+    assert len(index.query_radius([0.0, 0.0, 0.0], 1.0)) == 0
+    assert index.query_pairs(1.0).shape == (0, 2)
+
+
+def test_connected_components_labels_in_order_of_first_node():
+    labels = connected_components(5, [(3, 4), (0, 2)])
+    np.testing.assert_array_equal(labels, [0, 1, 0, 2, 2])
+
+
+def test_cluster_coaxial_faces_groups_faces_per_bolt():
+    axis = np.array([0.0, 0.0, 1.0])
+    centroids = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 5.0], [0.0, 0.0, 10.0],
+                          [20.0, 0.0, 0.0], [20.0, 0.0, 5.0], [0.5, 0.0, 5.0]])
+    axes = np.array([axis, axis, -axis, axis, axis, [1.0, 0.0, 0.0]])
+    labels = cluster_coaxial_faces(centroids, axes, radial_tolerance=0.1, axial_reach=6.0)
+
+    assert labels[0] == labels[1] == labels[2]
+    assert labels[3] == labels[4] != labels[0]
+    assert labels[5] not in (labels[0], labels[3])
+
+
+def test_sweep_and_prune_matches_brute_force():
+    rng = np.random.default_rng(2)
+    low = rng.uniform(0.0, 10.0, size=(150, 3))
+    high = low + rng.uniform(0.1, 1.5, size=(150, 3))
+
+    for margin in (0.0, 0.3):
+        pairs = sweep_and_prune(low, high, margin)
+        assert list(map(tuple, pairs.tolist())) == brute_force_overlaps(low, high, margin)
+
+
+def test_sweep_and_prune_drops_pairs_within_a_group():
+    low = np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.5], [0.8, 0.0, 0.0]])
+    high = low + 1.0
+
+    assert sweep_and_prune(low, high).tolist() == [[0, 1], [0, 2], [1, 2]]
+    assert sweep_and_prune(low, high, groups=[7, 7, 8]).tolist() == [[0, 2], [1, 2]]
+    assert sweep_and_prune(low[:1], high[:1]).shape == (0, 2)
+
+
+def test_nearest_distances_in_chunks():
+    points = np.array([[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [0.0, 0.0, 2.0]])
+    targets = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 5.0]])
+
+    np.testing.assert_allclose(nearest_distances(points, targets, chunk_size=2), [1.0, 2.0, np.sqrt(5.0)])
+    assert np.all(np.isinf(nearest_distances(points, np.zeros((0, 3)))))
+
+
+def test_closest_points_on_triangles_projects_onto_face_edges_and_vertices():
+    a, b, c = np.array([0.0, 0.0, 0.0]), np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0])
+    points = np.array([[0.2, 0.2, 1.0], [0.5, -1.0, 0.0], [2.0, -1.0, 0.0], [1.0, 1.0, 0.0], [-1.0, 0.5, 0.0]])
+    closest = closest_points_on_triangles(points, a, b, c)
+
+    np.testing.assert_allclose(closest, [[0.2, 0.2, 0.0], [0.5, 0.0, 0.0], [1.0, 0.0, 0.0],
+                                         [0.5, 0.5, 0.0], [0.0, 0.5, 0.0]])
+
+
+def test_nearest_surface_distances_sees_the_surface_between_samples():
+    # Two coarse grids on the same plane, offset by half their spacing
+    triangles = np.array([[[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [2.0, 2.0, 0.0]],
+                          [[0.0, 0.0, 0.0], [2.0, 2.0, 0.0], [0.0, 2.0, 0.0]]])
+    points = np.array([[1.0, 1.0, 0.0], [1.0, 0.5, 0.25], [5.0, 1.0, 0.0]])
+
+    np.testing.assert_allclose(nearest_surface_distances(points, triangles, chunk_size=2), [0.0, 0.25, 3.0])
+    assert nearest_distances(points[:1], triangles.reshape(-1, 3))[0] > 1.0
+    assert np.all(np.isinf(nearest_surface_distances(points, np.zeros((0, 3, 3)))))
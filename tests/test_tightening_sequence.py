@@ -0,0 +1,70 @@
+"""Tests for the bolt tightening sequence scheduler."""
+import numpy as np
+
+from preprocessing.tightening_sequence import (OPEN, LOAD, LOCK, INCREMENT, star_groups, tightening_groups,
+                                               order_bolts_by_angle, build_step_table, schedule_bolts)
+
+
+def bolt_circle(count, start_angle=0.0):
+    angles = start_angle + 2.0 * np.pi * np.arange(count) / count
+    return np.column_stack([np.cos(angles), np.sin(angles), np.zeros(count)])
+
+
+def test_star_groups_pair_opposite_bolts():
+    groups = star_groups(np.arange(8))
+    assert [list(group) for group in groups] == [[0, 4], [2, 6], [1, 5], [3, 7]]
+
+
+def test_star_groups_odd_count_crosses_the_circle():
+    groups = star_groups(np.arange(5))
+    assert [int(group[0]) for group in groups] == [0, 3, 1, 4, 2]
+
+
+def test_order_bolts_by_angle_recovers_the_circle_order():
+    centroids = bolt_circle(6)
+    shuffled = [3, 0, 5, 1, 4, 2]
+    order = order_bolts_by_angle(centroids[shuffled])
+    positions = [shuffled[index] for index in order]
+    start = positions.index(0)
+    rotated = positions[start:] + positions[:start]
+    assert rotated in ([0, 1, 2, 3, 4, 5], [0, 5, 4, 3, 2, 1])
+
+
+def test_tightening_groups_patterns():
+    assert [list(group) for group in tightening_groups(4)] == [[0, 1, 2, 3]]
+    assert [list(group) for group in tightening_groups(5, 'sequential', group_size=2)] == [[0, 1], [2, 3], [4]]
+    assert len(tightening_groups(8, 'star', centroids=bolt_circle(8))) == 4
+    assert tightening_groups(0) == []
+
+
+def test_build_step_table_uses_one_step_per_group_and_pass():
+    groups = [np.array([0, 2]), np.array([1, 3])]
+    table = build_step_table(groups, 4, passes=[50, 100])
+
+    assert table['num_steps'] == 4
+    np.testing.assert_array_equal(table['codes'], [
+        [LOAD, OPEN, LOAD, OPEN],
+        [LOCK, LOAD, LOCK, LOAD],
+        [LOAD, LOCK, LOAD, LOCK],
+        [LOCK, LOAD, LOCK, LOAD],
+    ])
+    np.testing.assert_allclose(table['fractions'], [
+        [0.5, 0.0, 0.5, 0.0],
+        [0.5, 0.5, 0.5, 0.5],
+        [1.0, 0.5, 1.0, 0.5],
+        [1.0, 1.0, 1.0, 1.0],
+    ])
+
+
+def test_build_step_table_increment_pass():
+    table = build_step_table([np.arange(2)], 2, passes=[100, {'increment': 0.01}])
+
+    np.testing.assert_array_equal(table['codes'], [[LOAD, LOAD], [INCREMENT, INCREMENT]])
+    np.testing.assert_allclose(table['increments'][1], [0.01, 0.01])
+    np.testing.assert_allclose(table['fractions'][1], [1.0, 1.0])
+
+
+def test_schedule_bolts_simultaneous_default_is_a_single_step():
+    table = schedule_bolts(6, {})
+    assert table['num_steps'] == 1
+    assert np.all(table['codes'] == LOAD)
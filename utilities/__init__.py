@@ -12,31 +12,61 @@ from .logging_config import log, log_section, set_logging
 from .config_loader import load_yaml_config, get_config_path, get_project_root
 from .named_selection_helper import (
     get_named_selection,
+    get_named_selection_ids,
+    resolve_named_selections,
+    invalidate_named_selection_cache,
     get_faces_from_named_selection,
     named_selection_to_list,
     normalize_named_selection_list,
+    create_or_update_named_selections,
     refresh_tree
 )
 from .geometry_helper import (
     find_coordinate_system,
     create_face_aligned_coordinate_system,
+    index_coordinate_systems,
+    create_face_aligned_coordinate_systems,
+    create_axis_coordinate_systems,
+    find_construction_geometry,
     ensure_construction_geometry,
     find_surface,
     create_surface_from_coordinate_system,
+    index_surfaces,
+    create_surfaces_from_coordinate_systems,
+    create_face_aligned_surfaces,
     get_body_from_face,
     delete_coordinate_systems_by_pattern,
     delete_surfaces_by_pattern
 )
 from .probe_helper import (
     find_probe,
+    index_probes,
     create_force_reaction_probe,
     create_moment_reaction_probe,
+    create_beam_reaction_probes,
     extract_probe_results,
     find_group,
     create_probe_group,
     manage_probe_groups,
     delete_probes_by_pattern
 )
+from .tree_group_helper import find_tree_group, create_tree_group, sync_tree_group
+from .state_helper import (
+    get_state_path,
+    load_state,
+    save_state,
+    compute_fingerprint,
+    fingerprint_matches,
+    reconcile_objects
+)
+from .cleanup_helper import (
+    PrefixTrie,
+    build_cleanup_trie,
+    build_bolt_object_names,
+    delete_generated_objects,
+    delete_bolt_objects
+)
+from .bolt_identity import face_centroid_key, assign_bolt_indices, get_identity_state
 
 __all__ = [
     # Logging
@@ -44,15 +74,32 @@ __all__ = [
     # Config
     'load_yaml_config', 'get_config_path', 'get_project_root',
     # Named Selections
-    'get_named_selection', 'get_faces_from_named_selection',
-    'named_selection_to_list', 'normalize_named_selection_list', 'refresh_tree',
+    'get_named_selection', 'get_named_selection_ids', 'resolve_named_selections',
+    'invalidate_named_selection_cache', 'get_faces_from_named_selection',
+    'named_selection_to_list', 'normalize_named_selection_list',
+    'create_or_update_named_selections', 'refresh_tree',
     # Geometry
     'find_coordinate_system', 'create_face_aligned_coordinate_system',
-    'ensure_construction_geometry', 'find_surface',
-    'create_surface_from_coordinate_system', 'get_body_from_face',
+    'index_coordinate_systems', 'create_face_aligned_coordinate_systems',
+    'create_axis_coordinate_systems',
+    'find_construction_geometry', 'ensure_construction_geometry', 'find_surface',
+    'create_surface_from_coordinate_system', 'index_surfaces',
+    'create_surfaces_from_coordinate_systems', 'create_face_aligned_surfaces',
+    'get_body_from_face',
     'delete_coordinate_systems_by_pattern', 'delete_surfaces_by_pattern',
     # Probes
-    'find_probe', 'create_force_reaction_probe', 'create_moment_reaction_probe',
+    'find_probe', 'index_probes', 'create_force_reaction_probe', 'create_moment_reaction_probe',
+    'create_beam_reaction_probes',
     'extract_probe_results', 'find_group', 'create_probe_group',
-    'manage_probe_groups', 'delete_probes_by_pattern'
+    'manage_probe_groups', 'delete_probes_by_pattern',
+    # Tree Groups
+    'find_tree_group', 'create_tree_group', 'sync_tree_group',
+    # State
+    'get_state_path', 'load_state', 'save_state', 'compute_fingerprint',
+    'fingerprint_matches', 'reconcile_objects',
+    # Cleanup
+    'PrefixTrie', 'build_cleanup_trie', 'build_bolt_object_names',
+    'delete_generated_objects', 'delete_bolt_objects',
+    # Bolt identity
+    'face_centroid_key', 'assign_bolt_indices', 'get_identity_state'
 ]
@@ -0,0 +1,130 @@
+"""
+Bolt Identity Functions
+========================
+
+Stable bolt numbering that does not depend on named-selection ordering:
+- Primary key: geometry face ID
+- Fallback key: hash of the rounded face centroid (survives face renumbering)
+- Assignments persist in the run state, so indices never shift between runs
+- Assignments are stamped with the model they belong to, so a state file
+  shared between models (explicit state_file) never carries face IDs over
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+
+from .logging_config import log
+from .state_helper import compute_fingerprint, get_model_key
+
+
+def face_centroid_key(face, precision=6):
+    """
+    Compute a position-based key for a face from its rounded centroid.
+
+    Args:
+        face: Geometry face entity
+        precision (int): Decimal places kept (in geometry length units)
+
+    Returns:
+        str: Centroid hash, or None if the centroid is not available
+    """
+    try:
+        centroid = [round(float(value), precision) for value in face.Centroid]
+    except Exception:
+        return None
+    return compute_fingerprint('centroid', centroid)
+
+
+def assign_bolt_indices(faces, identity_state, precision=6):
+    """
+    Assign stable 1-based bolt indices to faces.
+
+    Faces keep the index they had in previous runs, matched first by face ID
+    and then by centroid hash. New faces get the next unused index; indices
+    of faces that disappeared are retired and never handed out again, so
+    adding or removing one face never shifts the others.
+
+    Args:
+        faces (list): Geometry face entities of one named selection
+        identity_state (dict): Persisted identity state for the named selection
+                               (updated in place)
+        precision (int): Decimal places used for the centroid hash
+
+    Returns:
+        tuple: (indices, retired)
+            - indices: List of bolt indices aligned with faces
+            - retired: Sorted list of indices no longer present
+    """
+    by_face = identity_state.get('by_face', {})
+    by_centroid = identity_state.get('by_centroid', {})
+    next_index = identity_state.get('next_index')
+    if next_index is None:
+        known = list(by_face.values()) + list(by_centroid.values())
+        next_index = max(known) + 1 if known else 1
+
+    indices = []
+    used = set()
+    new_by_face = {}
+    new_by_centroid = {}
+    matched_by_centroid = 0
+
+    for face in faces:
+        face_key = str(face.Id)
+        centroid_key = face_centroid_key(face, precision)
+
+        index = by_face.get(face_key)
+        if index is None or index in used:
+            index = by_centroid.get(centroid_key) if centroid_key is not None else None
+            if index is not None and index not in used:
+                matched_by_centroid += 1
+        if index is None or index in used:
+            index = next_index
+            next_index += 1
+
+        used.add(index)
+        indices.append(index)
+        new_by_face[face_key] = index
+        if centroid_key is not None:
+            new_by_centroid[centroid_key] = index
+
+    previous = set(by_face.values()) | set(by_centroid.values())
+    retired = sorted(previous - used)
+
+    identity_state['by_face'] = new_by_face
+    identity_state['by_centroid'] = new_by_centroid
+    identity_state['next_index'] = next_index
+
+    if matched_by_centroid:
+        log(f"Matched {matched_by_centroid} renumbered face(s) by centroid")
+    if retired:
+        log(f"Retired bolt indices no longer present: {retired}")
+
+    return indices, retired
+
+
+def get_identity_state(state):
+    """
+    Get the bolt numbering of the open model from a run state.
+
+    Face IDs and centroids only identify bolts within one model. If the
+    numbering in the state was recorded for another model, it is dropped
+    and the bolts of the open model are numbered from scratch.
+
+    Args:
+        state (dict): Run state (updated in place)
+
+    Returns:
+        dict: Named selection name -> identity state (see assign_bolt_indices)
+    """
+    identities = state.setdefault('bolt_ids', {})
+    model_key = get_model_key()
+    if model_key is None:
+        return identities
+
+    recorded = state.get('bolt_ids_model')
+    if recorded is not None and recorded != model_key and identities:
+        log(f"Bolt numbering in the state belongs to model '{recorded}'; "
+            f"numbering the bolts of '{model_key}' from scratch", "WARNING")
+        identities.clear()
+    state['bolt_ids_model'] = model_key
+    return identities
@@ -0,0 +1,285 @@
+"""
+Cleanup Helper Functions
+=========================
+
+One-sweep deletion of generated objects across many named selections:
+- Prefix trie matching all generated-name prefixes at once
+- Single walk per container (solution, coordinate systems, surfaces)
+- Whole probe groups deleted where possible
+- One Transaction and one tree refresh for the entire cleanup
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: Model, DataModelObjectCategory, Transaction, etc. provided by ANSYS Mechanical
+
+from .logging_config import log
+from .named_selection_helper import refresh_tree
+from .geometry_helper import find_construction_geometry
+
+
+# Object kinds reported by the cleanup engine
+FORCE_PROBE = 'force'
+MOMENT_PROBE = 'moment'
+SURFACE = 'surface'
+COORDINATE_SYSTEM = 'cs'
+PROBE_GROUP = 'group'
+
+_PREFIX_KEY = '__prefix__'
+_EXACT_KEY = '__exact__'
+
+
+# ============================================================================
+# Prefix Trie
+# ============================================================================
+
+class PrefixTrie:
+    """
+    Character trie mapping name prefixes (and exact names) to a tag.
+
+    Matching a name walks the trie once, so the cost is proportional to the
+    name length instead of the number of registered prefixes. Exact names
+    take precedence over prefixes; among prefixes the shortest match wins.
+    """
+
+    def __init__(self):
+        self._root = {}
+
+    def _node(self, key):
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        return node
+
+    def add_prefix(self, prefix, tag):
+        """Register a prefix: any name starting with it matches tag."""
+        self._node(prefix)[_PREFIX_KEY] = tag
+
+    def add_exact(self, name, tag):
+        """Register an exact name: only that name matches tag."""
+        self._node(name)[_EXACT_KEY] = tag
+
+    def match(self, name):
+        """
+        Return the tag matching a name, or None.
+
+        Args:
+            name (str): Object name to match
+
+        Returns:
+            Tag registered for the name, or None if nothing matches
+        """
+        node = self._root
+        prefix_tag = None
+        for char in name:
+            if prefix_tag is None and _PREFIX_KEY in node:
+                prefix_tag = node[_PREFIX_KEY]
+            node = node.get(char)
+            if node is None:
+                return prefix_tag
+        if _EXACT_KEY in node:
+            return node[_EXACT_KEY]
+        if prefix_tag is None:
+            return node.get(_PREFIX_KEY)
+        return prefix_tag
+
+
+def build_cleanup_trie(ns_list):
+    """
+    Build a trie matching every generated object name for a list of named selections.
+
+    Registers the naming patterns used by bolt force extraction:
+    Force_<NS>_*, Moment_<NS>_*, Surface_<NS>_*, CS_<NS>_* and the
+    Force_Probes_<NS> / Moment_Probes_<NS> groups.
+
+    Args:
+        ns_list (list): Named selection names
+
+    Returns:
+        PrefixTrie: Trie tagging names with the object kind constants
+    """
+    trie = PrefixTrie()
+    for ns_name in ns_list:
+        trie.add_prefix(f"Force_{ns_name}_", FORCE_PROBE)
+        trie.add_prefix(f"Moment_{ns_name}_", MOMENT_PROBE)
+        trie.add_prefix(f"Surface_{ns_name}_", SURFACE)
+        trie.add_prefix(f"CS_{ns_name}_", COORDINATE_SYSTEM)
+        trie.add_exact(f"Force_Probes_{ns_name}", PROBE_GROUP)
+        trie.add_exact(f"Moment_Probes_{ns_name}", PROBE_GROUP)
+    return trie
+
+
+# ============================================================================
+# Cleanup Engine
+# ============================================================================
+
+def _safe_name(obj):
+    """Return an object's name, or None if it has no readable name."""
+    try:
+        return obj.Name
+    except:
+        return None
+
+
+def _is_group(obj):
+    """Check whether a tree object is a grouping folder."""
+    try:
+        return obj.DataModelObjectCategory == DataModelObjectCategory.TreeGroupingFolder
+    except:
+        return False
+
+
+def _collect_solution_objects(solution, trie, to_delete, counts):
+    """
+    Walk the solution children once, collecting probes and probe groups.
+
+    A generated group whose members all match is deleted as a whole
+    (deleting a grouping folder removes its contents). Otherwise its
+    matching members are collected individually.
+    """
+    for child in solution.Children:
+        name = _safe_name(child)
+        if name is None:
+            continue
+        tag = trie.match(name)
+
+        if _is_group(child):
+            members = list(child.Children)
+            member_tags = [trie.match(_safe_name(member) or "") for member in members]
+
+            if tag == PROBE_GROUP and all(t in (FORCE_PROBE, MOMENT_PROBE) for t in member_tags):
+                to_delete.append(child)
+                counts[PROBE_GROUP] += 1
+                for member_tag in member_tags:
+                    counts[member_tag] += 1
+                continue
+
+            for member, member_tag in zip(members, member_tags):
+                if member_tag in (FORCE_PROBE, MOMENT_PROBE):
+                    to_delete.append(member)
+                    counts[member_tag] += 1
+            continue
+
+        if tag in (FORCE_PROBE, MOMENT_PROBE):
+            to_delete.append(child)
+            counts[tag] += 1
+
+
+def _collect_by_tag(objects, trie, wanted_tag, to_delete, counts):
+    """Collect objects whose names match a given tag."""
+    for obj in objects:
+        name = _safe_name(obj)
+        if name is not None and trie.match(name) == wanted_tag:
+            to_delete.append(obj)
+            counts[wanted_tag] += 1
+
+
+def delete_generated_objects(solution, ns_list):
+    """
+    Delete all generated probes, groups, surfaces and coordinate systems in one sweep.
+
+    Every container is walked once with a single trie covering all prefixes
+    of all named selections. All deletions happen inside one Transaction
+    followed by a single tree refresh.
+
+    Args:
+        solution: Analysis solution object
+        ns_list (list): Named selection names whose generated objects are deleted
+
+    Returns:
+        dict: Number of deleted objects per kind
+              (keys: 'force', 'moment', 'surface', 'cs', 'group')
+    """
+    if not ns_list:
+        return _empty_counts()
+
+    counts = _delete_matching(solution, build_cleanup_trie(ns_list))
+    log(f"Deleted {sum(counts.values())} generated object(s) for {len(ns_list)} named selection(s)")
+    return counts
+
+
+def build_bolt_object_names(ns_name, index):
+    """
+    Get the generated object names for one bolt of a named selection.
+
+    Args:
+        ns_name (str): Named selection name
+        index (int): Bolt index within the named selection
+
+    Returns:
+        dict: Mapping of object kind -> object name
+    """
+    return {
+        COORDINATE_SYSTEM: f"CS_{ns_name}_{index}",
+        SURFACE: f"Surface_{ns_name}_{index}",
+        FORCE_PROBE: f"Force_{ns_name}_{index}",
+        MOMENT_PROBE: f"Moment_{ns_name}_{index}",
+    }
+
+
+def delete_bolt_objects(solution, ns_name, indices):
+    """
+    Delete the generated objects of specific bolts of a named selection.
+
+    Uses exact-name matching, so deleting bolt 1 never touches bolt 10.
+
+    Args:
+        solution: Analysis solution object
+        ns_name (str): Named selection name
+        indices (list): Bolt indices whose objects are deleted
+
+    Returns:
+        dict: Number of deleted objects per kind
+    """
+    if not indices:
+        return _empty_counts()
+
+    trie = PrefixTrie()
+    for index in indices:
+        for kind, name in build_bolt_object_names(ns_name, index).items():
+            trie.add_exact(name, kind)
+
+    counts = _delete_matching(solution, trie)
+    log(f"Deleted {sum(counts.values())} object(s) of {len(indices)} retired bolt(s) in '{ns_name}'")
+    return counts
+
+
+def _empty_counts():
+    return {FORCE_PROBE: 0, MOMENT_PROBE: 0, SURFACE: 0, COORDINATE_SYSTEM: 0, PROBE_GROUP: 0}
+
+
+def _delete_matching(solution, trie):
+    """
+    Delete every generated object whose name matches the trie.
+
+    Walks each container once, then deletes inside one Transaction and
+    refreshes the tree once.
+    """
+    counts = _empty_counts()
+    to_delete = []
+
+    try:
+        _collect_solution_objects(solution, trie, to_delete, counts)
+
+        construction_geo = find_construction_geometry()
+        if construction_geo is not None:
+            _collect_by_tag(construction_geo.GetChildren(DataModelObjectCategory.Surface, True),
+                            trie, SURFACE, to_delete, counts)
+
+        _collect_by_tag(Model.CoordinateSystems.GetChildren(DataModelObjectCategory.CoordinateSystem, True),
+                        trie, COORDINATE_SYSTEM, to_delete, counts)
+    except Exception as e:
+        log(f"Error collecting generated objects: {str(e)}", "ERROR")
+
+    # Probes before surfaces before coordinate systems, so references are released in order
+    with Transaction():
+        for obj in to_delete:
+            try:
+                obj.Delete()
+            except:
+                log(f"Warning: Could not delete object: {_safe_name(obj)}", "WARNING")
+
+    if to_delete:
+        refresh_tree()
+
+    return counts
@@ -0,0 +1,435 @@
+"""
+Face Table Functions
+=====================
+
+Single-pass extraction of face geometry into NumPy arrays:
+- Surface type, area and centroid of every face
+- Radii of circular edges (cylinder radius, annulus inner/outer radius,
+  bolt diameters for mesh sizing, shank axes and hole rims for beam bolts)
+- Axis direction (cylinder axis or plane normal)
+- Bounding boxes, sample points and surface triangles of faces (contact detection)
+
+The resulting table lets classification and pairing run as vectorized
+array operations instead of per-face API calls.
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: ExtAPI, GeoSurfaceTypeEnum, GeoCurveTypeEnum provided by ANSYS Mechanical
+
+import numpy as np
+
+from .logging_config import log
+from .spatial_index import SpatialHash
+
+
+# Surface type codes used in the face table
+SURFACE_OTHER = 0
+SURFACE_PLANE = 1
+SURFACE_CYLINDER = 2
+
+
+def iter_geo_bodies():
+    """
+    Iterate over all geometry bodies of the model.
+
+    Yields:
+        Geometry body entities (GeoBody)
+    """
+    for assembly in ExtAPI.DataModel.GeoData.Assemblies:
+        for part in assembly.Parts:
+            for body in part.Bodies:
+                yield body
+
+
+def _surface_type_code(face):
+    try:
+        surface_type = face.SurfaceType
+    except Exception:
+        return SURFACE_OTHER
+    if surface_type == GeoSurfaceTypeEnum.GeoSurfacePlane:
+        return SURFACE_PLANE
+    if surface_type == GeoSurfaceTypeEnum.GeoSurfaceCylinder:
+        return SURFACE_CYLINDER
+    return SURFACE_OTHER
+
+
+def _circular_edges(face):
+    """Return (radius, center) pairs for all circular edges of a face."""
+    circles = []
+    for edge in face.Edges:
+        try:
+            if edge.CurveType == GeoCurveTypeEnum.GeoCurveCircle:
+                circles.append((float(edge.Radius), [float(v) for v in edge.Centroid]))
+        except Exception:
+            continue
+    return circles
+
+
+def _face_axis(face, type_code, circles):
+    """Return a unit axis: plane normal or cylinder axis (zeros if unknown)."""
+    axis = np.zeros(3)
+    try:
+        if type_code == SURFACE_PLANE:
+            axis = np.array([float(v) for v in face.NormalAtParam(0.5, 0.5)])
+        elif type_code == SURFACE_CYLINDER and len(circles) >= 2:
+            axis = np.array(circles[-1][1]) - np.array(circles[0][1])
+    except Exception:
+        pass
+    norm = np.linalg.norm(axis)
+    return axis / norm if norm > 0 else np.zeros(3)
+
+
+def build_face_table(bodies=None):
+    """
+    Extract geometry data for all faces in one pass over the geometry.
+
+    Args:
+        bodies (list): Optional geometry bodies to scan (default: all bodies)
+
+    Returns:
+        dict: Face table of aligned NumPy arrays (length N = number of faces):
+            - face_id (N,) int: Geometry face IDs
+            - body_id (N,) int: Owning body IDs
+            - surface_type (N,) int: SURFACE_PLANE, SURFACE_CYLINDER or SURFACE_OTHER
+            - area (N,) float: Face areas
+            - centroid (N, 3) float: Face centroids
+            - axis (N, 3) float: Unit plane normal / cylinder axis (zeros if unknown)
+            - radius (N,) float: Smallest circular edge radius (NaN if none)
+            - outer_radius (N,) float: Largest circular edge radius (NaN if none)
+            - circle_count (N,) int: Number of circular edges
+    """
+    if bodies is None:
+        bodies = list(iter_geo_bodies())
+
+    face_ids, body_ids, types, areas = [], [], [], []
+    centroids, axes, radii, outer_radii, circle_counts = [], [], [], [], []
+
+    for body in bodies:
+        for face in body.Faces:
+            try:
+                type_code = _surface_type_code(face)
+                circles = _circular_edges(face)
+                circle_radii = [radius for radius, _ in circles]
+
+                face_ids.append(face.Id)
+                body_ids.append(body.Id)
+                types.append(type_code)
+                areas.append(float(face.Area))
+                centroids.append([float(v) for v in face.Centroid])
+                axes.append(_face_axis(face, type_code, circles))
+                radii.append(min(circle_radii) if circle_radii else np.nan)
+                outer_radii.append(max(circle_radii) if circle_radii else np.nan)
+                circle_counts.append(len(circles))
+            except Exception as e:
+                log(f"Skipping face {face.Id}: {str(e)}", "WARNING")
+
+    table = {
+        'face_id': np.array(face_ids, dtype=int),
+        'body_id': np.array(body_ids, dtype=int),
+        'surface_type': np.array(types, dtype=int),
+        'area': np.array(areas, dtype=float),
+        'centroid': np.array(centroids, dtype=float).reshape(-1, 3),
+        'axis': np.array(axes, dtype=float).reshape(-1, 3),
+        'radius': np.array(radii, dtype=float),
+        'outer_radius': np.array(outer_radii, dtype=float),
+        'circle_count': np.array(circle_counts, dtype=int),
+    }
+
+    log(f"Extracted geometry of {len(face_ids)} face(s) from {len(bodies)} body(ies)")
+    return table
+
+
+def circular_edge_radii(faces):
+    """
+    Get the smallest circular edge radius of each face.
+
+    Args:
+        faces (list): Geometry face entities (GeoFace)
+
+    Returns:
+        np.ndarray: (N,) radii in geometry units (NaN for faces without circular edges)
+    """
+    radii = []
+    for face in faces:
+        circle_radii = [radius for radius, _ in _circular_edges(face)]
+        radii.append(min(circle_radii) if circle_radii else np.nan)
+    return np.array(radii, dtype=float)
+
+
+def shank_axes(faces):
+    """
+    Get the axis of each bolt shank face from its two farthest circular edges.
+
+    Args:
+        faces (list): Cylindrical shank faces (GeoFace), one per bolt
+
+    Returns:
+        dict: Aligned NumPy arrays (length N = number of faces):
+            - start (N, 3) float: Centre of the first end circle
+            - end (N, 3) float: Centre of the opposite end circle
+            - radius (N,) float: Smallest circular edge radius
+            Rows of faces with fewer than two circular edges are NaN.
+    """
+    starts, ends, radii = [], [], []
+    for face in faces:
+        circles = _circular_edges(face)
+        if len(circles) < 2:
+            starts.append([np.nan] * 3)
+            ends.append([np.nan] * 3)
+            radii.append(np.nan)
+            continue
+        centers = np.array([center for _, center in circles], dtype=float)
+        distances = np.linalg.norm(centers[:, None, :] - centers[None, :, :], axis=2)
+        first, second = np.unravel_index(np.argmax(distances), distances.shape)
+        starts.append(centers[first])
+        ends.append(centers[second])
+        radii.append(min(radius for radius, _ in circles))
+    return {
+        'start': np.array(starts, dtype=float).reshape(-1, 3),
+        'end': np.array(ends, dtype=float).reshape(-1, 3),
+        'radius': np.array(radii, dtype=float),
+    }
+
+
+def build_circle_table(bodies=None):
+    """
+    Extract the circular edges of all planar faces in one pass (bolt hole rims).
+
+    Args:
+        bodies (list): Optional geometry bodies to scan (default: all bodies)
+
+    Returns:
+        dict: Circle table of aligned NumPy arrays (length M = number of circles):
+            - face_id (M,) int: Planar face owning the circle
+            - body_id (M,) int: Owning body ID
+            - center (M, 3) float: Circle centre
+            - radius (M,) float: Circle radius
+            - normal (M, 3) float: Unit normal of the planar face
+    """
+    if bodies is None:
+        bodies = list(iter_geo_bodies())
+
+    face_ids, body_ids, centers, radii, normals = [], [], [], [], []
+    for body in bodies:
+        for face in body.Faces:
+            try:
+                if _surface_type_code(face) != SURFACE_PLANE:
+                    continue
+                circles = _circular_edges(face)
+                if not circles:
+                    continue
+                normal = _face_axis(face, SURFACE_PLANE, circles)
+                for radius, center in circles:
+                    face_ids.append(face.Id)
+                    body_ids.append(body.Id)
+                    centers.append(center)
+                    radii.append(radius)
+                    normals.append(normal)
+            except Exception as e:
+                log(f"Skipping face {face.Id}: {str(e)}", "WARNING")
+
+    log(f"Extracted {len(face_ids)} circular edge(s) of planar faces")
+    return {
+        'face_id': np.array(face_ids, dtype=int),
+        'body_id': np.array(body_ids, dtype=int),
+        'center': np.array(centers, dtype=float).reshape(-1, 3),
+        'radius': np.array(radii, dtype=float),
+        'normal': np.array(normals, dtype=float).reshape(-1, 3),
+    }
+
+
+def subset_face_table(table, mask):
+    """
+    Select rows of a face table.
+
+    Args:
+        table (dict): Face table from build_face_table
+        mask: Boolean mask or index array
+
+    Returns:
+        dict: Face table containing only the selected rows
+    """
+    return {key: values[mask] for key, values in table.items()}
+
+
+def face_surface_grid(face, samples_per_direction=5):
+    """
+    Evaluate a face on a regular parameter grid.
+
+    Args:
+        face: Geometry face entity (GeoFace)
+        samples_per_direction (int): Parameter grid size (n x n points)
+
+    Returns:
+        np.ndarray: (n, n, 3) grid points (NaN where the face cannot be evaluated)
+    """
+    count = max(int(samples_per_direction), 0)
+    grid = np.full((count, count, 3), np.nan)
+    params = np.linspace(0.0, 1.0, count)
+    for i, u in enumerate(params):
+        for j, v in enumerate(params):
+            try:
+                grid[i, j] = [float(c) for c in face.PointAtParam(u, v)]
+            except Exception:
+                continue
+    return grid
+
+
+def grid_triangles(grid):
+    """
+    Triangulate a parameter grid from face_surface_grid.
+
+    Every grid cell is split into two triangles; triangles touching a point
+    that could not be evaluated are dropped.
+
+    Args:
+        grid: (n, n, 3) grid points
+
+    Returns:
+        np.ndarray: (T, 3, 3) triangle corner points
+    """
+    grid = np.asarray(grid, dtype=float)
+    if grid.shape[0] < 2 or grid.shape[1] < 2:
+        return np.zeros((0, 3, 3))
+    a, b = grid[:-1, :-1], grid[1:, :-1]
+    c, d = grid[1:, 1:], grid[:-1, 1:]
+    triangles = np.concatenate([np.stack([a, b, c], axis=2).reshape(-1, 3, 3),
+                                np.stack([a, c, d], axis=2).reshape(-1, 3, 3)])
+    return triangles[~np.isnan(triangles).any(axis=(1, 2))]
+
+
+def face_sample_points(face, samples_per_direction=5, grid=None):
+    """
+    Sample points on a face: tessellation nodes, vertices and a parameter grid.
+
+    Args:
+        face: Geometry face entity (GeoFace)
+        samples_per_direction (int): Parameter grid size (n x n points)
+        grid: Optional precomputed grid from face_surface_grid
+
+    Returns:
+        np.ndarray: (M, 3) sample points (at least the centroid)
+    """
+    points = []
+    try:
+        points.extend(np.asarray([float(v) for v in face.Points]).reshape(-1, 3).tolist())
+    except Exception:
+        pass
+    for vertex in face.Vertices:
+        try:
+            points.append([float(vertex.X), float(vertex.Y), float(vertex.Z)])
+        except Exception:
+            continue
+    if grid is None and samples_per_direction > 0:
+        grid = face_surface_grid(face, samples_per_direction)
+    if grid is not None:
+        grid = np.asarray(grid, dtype=float).reshape(-1, 3)
+        points.extend(grid[~np.isnan(grid).any(axis=1)].tolist())
+    points.append([float(v) for v in face.Centroid])
+    return np.array(points, dtype=float)
+
+
+def build_face_boxes(faces, samples_per_direction=5):
+    """
+    Extract bounding boxes, sample points and surface triangles of faces in one pass.
+
+    Args:
+        faces (list): Geometry face entities (GeoFace)
+        samples_per_direction (int): Parameter grid size for the samples and triangles
+
+    Returns:
+        dict: Face box table (length N = number of faces):
+            - face_id (N,) int: Geometry face IDs
+            - body_id (N,) int: Owning body IDs
+            - low (N, 3) float: Bounding box minimum corners
+            - high (N, 3) float: Bounding box maximum corners
+            - points (list): (M, 3) sample points per face
+            - triangles (list): (T, 3, 3) triangulated parameter grid per face
+    """
+    face_ids, body_ids, lows, highs, points, triangles = [], [], [], [], [], []
+
+    for face in faces:
+        try:
+            grid = face_surface_grid(face, samples_per_direction)
+            samples = face_sample_points(face, samples_per_direction, grid)
+            face_ids.append(face.Id)
+            body_ids.append(face.Bodies[0].Id)
+            lows.append(samples.min(axis=0))
+            highs.append(samples.max(axis=0))
+            points.append(samples)
+            triangles.append(grid_triangles(grid))
+        except Exception as e:
+            log(f"Skipping face {face.Id}: {str(e)}", "WARNING")
+
+    return {
+        'face_id': np.array(face_ids, dtype=int),
+        'body_id': np.array(body_ids, dtype=int),
+        'low': np.array(lows, dtype=float).reshape(-1, 3),
+        'high': np.array(highs, dtype=float).reshape(-1, 3),
+        'points': points,
+        'triangles': triangles,
+    }
+
+
+# ============================================================================
+# Spatial Queries
+# ============================================================================
+
+def build_face_index(table, cell_size):
+    """
+    Build a spatial hash over the face centroids of a face table.
+
+    Args:
+        table (dict): Face table from build_face_table
+        cell_size (float): Grid cell size (typical query radius, geometry units)
+
+    Returns:
+        SpatialHash: Index whose point indices are face table rows
+    """
+    return SpatialHash(table['centroid'], cell_size)
+
+
+def faces_within_radius(table, index, point, radius):
+    """
+    Find faces whose centroid lies within a radius of a point.
+
+    Args:
+        table (dict): Face table from build_face_table
+        index (SpatialHash): Index from build_face_index
+        point: Query point (geometry units)
+        radius (float): Search radius (geometry units)
+
+    Returns:
+        np.ndarray: Face IDs within the radius
+    """
+    return table['face_id'][index.query_radius(point, radius)]
+
+
+def faces_along_axis(table, index, origin, axis, radial_tolerance, max_distance):
+    """
+    Find faces whose centroid lies on an axis line through a point.
+
+    Args:
+        table (dict): Face table from build_face_table
+        index (SpatialHash): Index from build_face_index
+        origin: Point on the axis (geometry units)
+        axis: Axis direction
+        radial_tolerance (float): Maximum distance from the axis line
+        max_distance (float): Maximum distance from origin along the axis
+
+    Returns:
+        np.ndarray: Face IDs on the axis, ordered by position along the axis
+    """
+    origin = np.asarray(origin, dtype=float)
+    axis = np.asarray(axis, dtype=float)
+    axis = axis / np.linalg.norm(axis)
+
+    rows = index.query_radius(origin, np.hypot(max_distance, radial_tolerance))
+    offset = table['centroid'][rows] - origin
+    axial = offset @ axis
+    radial = np.linalg.norm(offset - axial[:, None] * axis, axis=1)
+    keep = (radial <= radial_tolerance) & (np.abs(axial) <= max_distance)
+
+    rows, axial = rows[keep], axial[keep]
+    return table['face_id'][rows[np.argsort(axial, kind='stable')]]
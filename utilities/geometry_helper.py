@@ -13,6 +13,7 @@ Common functions for working with ANSYS geometry objects:
 # Note: ExtAPI, Model, DataModelObjectCategory, etc. provided by ANSYS Mechanical
 
 from .logging_config import log
+from .state_helper import compute_fingerprint, fingerprint_matches
 
 
 # ============================================================================
@@ -57,18 +58,160 @@ def create_face_aligned_coordinate_system(face, name):
     if existing_cs is not None:
         return existing_cs
     
+    return _add_face_aligned_coordinate_system(face, name)
+
+
+def index_coordinate_systems():
+    """
+    Build a name -> coordinate system lookup with a single tree scan.
+    
+    Returns:
+        dict: Mapping of coordinate system name to coordinate system object
+    """
+    index = {}
     try:
-        # Create geometry selection for the face
-        geo_selection = ExtAPI.SelectionManager.CreateSelectionInfo(SelectionTypeEnum.GeometryEntities)
-        geo_selection.Ids = [face.Id]
+        for cs in Model.CoordinateSystems.GetChildren(DataModelObjectCategory.CoordinateSystem, True):
+            index.setdefault(cs.Name, cs)
+    except Exception as e:
+        log(f"Error indexing coordinate systems: {str(e)}", "ERROR")
+    return index
+
+
+def create_face_aligned_coordinate_systems(faces, names, existing=None, fingerprints=None, registry=None):
+    """
+    Create face-aligned coordinate systems for a batch of faces.
+    
+    Existing coordinate systems are resolved from a single index instead of
+    one tree scan per face. Repeated names within the batch return the same
+    object, so duplicate faces never create duplicate coordinate systems.
+    Call inside a Transaction when creating many objects.
+    
+    When fingerprints and a registry are given, an existing coordinate system
+    is only reused untouched if its recorded fingerprint matches; otherwise it
+    is re-aligned in place and the registry is updated.
+    
+    Args:
+        faces (list): Geometry face entities
+        names (list): Coordinate system names, aligned with faces
+        existing (dict): Optional name -> coordinate system index to reuse
+        fingerprints (list): Optional input fingerprints, aligned with faces
+        registry (dict): Optional name -> fingerprint registry (updated in place)
+        
+    Returns:
+        list: Coordinate system objects, aligned with faces
+    """
+    if len(faces) != len(names):
+        raise ValueError("faces and names must have the same length")
+    if fingerprints is None:
+        fingerprints = [None] * len(faces)
+    
+    index = existing if existing is not None else index_coordinate_systems()
+    coordinate_systems = []
+    seen = set()
+    created = updated = 0
+    
+    for face, name, fingerprint in zip(faces, names, fingerprints):
+        cs = index.get(name)
+        if cs is None:
+            cs = _add_face_aligned_coordinate_system(face, name)
+            index[name] = cs
+            created += 1
+        elif name not in seen and not fingerprint_matches(registry, name, fingerprint):
+            _align_coordinate_system_to_face(cs, face)
+            log(f"Updated coordinate system: {name}")
+            updated += 1
+        if registry is not None and fingerprint is not None:
+            registry[name] = fingerprint
+        seen.add(name)
+        coordinate_systems.append(cs)
+    
+    log(f"Coordinate systems: {created} created, {updated} updated, "
+        f"{len(names) - created - updated} reused")
+    return coordinate_systems
+
+
+def create_axis_coordinate_systems(names, origins, axes, length_unit="mm", existing=None, registry=None):
+    """
+    Create coordinate systems at fixed points with the Z-axis along a direction.
+    
+    Used where no face defines the orientation (e.g. beam bolt connections).
+    Existing coordinate systems are resolved from a single index; those whose
+    recorded fingerprint (origin, axis) matches are reused untouched, others
+    are re-aligned in place. Call inside a Transaction when creating many objects.
+    
+    Args:
+        names (list): Coordinate system names
+        origins (list): Origin points, aligned with names
+        axes (list): Z-axis directions, aligned with names
+        length_unit (str): Unit of the origin coordinates
+        existing (dict): Optional name -> coordinate system index to reuse
+        registry (dict): Optional name -> fingerprint registry (updated in place)
+        
+    Returns:
+        list: Coordinate system objects, aligned with names
+    """
+    index = existing if existing is not None else index_coordinate_systems()
+    coordinate_systems = []
+    created = updated = 0
+    
+    for name, origin, axis in zip(names, origins, axes):
+        origin = [round(float(v), 9) for v in origin]
+        axis = [round(float(v), 9) for v in axis]
+        fingerprint = compute_fingerprint('axis_cs', origin, axis, length_unit)
+        cs = index.get(name)
+        if cs is None:
+            cs = Model.CoordinateSystems.AddCoordinateSystem()
+            cs.Name = name
+            _align_coordinate_system_to_axis(cs, origin, axis, length_unit)
+            index[name] = cs
+            created += 1
+        elif not fingerprint_matches(registry, name, fingerprint):
+            _align_coordinate_system_to_axis(cs, origin, axis, length_unit)
+            updated += 1
+        if registry is not None:
+            registry[name] = fingerprint
+        coordinate_systems.append(cs)
+    
+    log(f"Coordinate systems: {created} created, {updated} updated, "
+        f"{len(names) - created - updated} reused")
+    return coordinate_systems
+
+
+def _align_coordinate_system_to_axis(cs, origin, axis, length_unit):
+    """
+    Place a coordinate system at a fixed origin with its Z-axis along a direction.
+    
+    Args:
+        cs: Coordinate system object
+        origin (list): Origin coordinates
+        axis (list): Z-axis direction
+        length_unit (str): Unit of the origin coordinates
+    """
+    cs.OriginDefineBy = CoordinateSystemAlignmentType.Fixed
+    cs.OriginX = Quantity(origin[0], length_unit)
+    cs.OriginY = Quantity(origin[1], length_unit)
+    cs.OriginZ = Quantity(origin[2], length_unit)
+    cs.PrimaryAxis = CoordinateSystemAxisType.PositiveZAxis
+    cs.PrimaryAxisDefineBy = CoordinateSystemAlignmentType.Fixed
+    cs.PrimaryAxisDirection = Vector3D(axis[0], axis[1], axis[2])
+
+
+def _add_face_aligned_coordinate_system(face, name):
+    """
+    Add a new coordinate system aligned to a face (no existence check).
+    
+    Args:
+        face: Geometry face entity
+        name (str): Name for the coordinate system
         
+    Returns:
+        Coordinate system object
+    """
+    try:
         # Create coordinate system
         cs = Model.CoordinateSystems.AddCoordinateSystem()
         cs.Name = name
-        cs.OriginLocation = geo_selection
-        cs.PrimaryAxisDefineBy = CoordinateSystemAlignmentType.Associative
-        cs.PrimaryAxisLocation = geo_selection
-        cs.PrimaryAxis = CoordinateSystemAxisType.PositiveZAxis
+        _align_coordinate_system_to_face(cs, face)
         
         log(f"Created coordinate system: {name}")
         return cs
@@ -77,10 +220,40 @@ def create_face_aligned_coordinate_system(face, name):
         raise
 
 
+def _align_coordinate_system_to_face(cs, face):
+    """
+    Place a coordinate system on a face with its Z-axis along the face normal.
+    
+    Args:
+        cs: Coordinate system object
+        face: Geometry face entity
+    """
+    # Create geometry selection for the face
+    geo_selection = ExtAPI.SelectionManager.CreateSelectionInfo(SelectionTypeEnum.GeometryEntities)
+    geo_selection.Ids = [face.Id]
+    
+    cs.OriginLocation = geo_selection
+    cs.PrimaryAxisDefineBy = CoordinateSystemAlignmentType.Associative
+    cs.PrimaryAxisLocation = geo_selection
+    cs.PrimaryAxis = CoordinateSystemAxisType.PositiveZAxis
+
+
 # ============================================================================
 # Construction Geometry Functions
 # ============================================================================
 
+def find_construction_geometry():
+    """
+    Find the Construction Geometry section without creating it.
+    
+    Returns:
+        Construction geometry object or None if the model has none
+    """
+    for child in Model.GetChildren(DataModelObjectCategory.ConstructionGeometry, False):
+        return child
+    return None
+
+
 def ensure_construction_geometry():
     """
     Ensure that the Construction Geometry section exists in the model.
@@ -91,8 +264,9 @@ def ensure_construction_geometry():
     """
     try:
         # Check if Construction Geometry folder exists
-        for child in Model.GetChildren(DataModelObjectCategory.ConstructionGeometry, False):
-            return child
+        construction_geo = find_construction_geometry()
+        if construction_geo is not None:
+            return construction_geo
         
         # If it doesn't exist, add it
         construction_geo = Model.AddConstructionGeometry()
@@ -144,6 +318,95 @@ def create_surface_from_coordinate_system(coordinate_system, name):
     if existing_surface is not None:
         return existing_surface
     
+    return _add_surface(construction_geo, coordinate_system, name)
+
+
+def index_surfaces(construction_geo):
+    """
+    Build a name -> surface lookup with a single construction geometry scan.
+    
+    Args:
+        construction_geo: Construction geometry object
+        
+    Returns:
+        dict: Mapping of surface name to surface object
+    """
+    index = {}
+    try:
+        for surface in construction_geo.GetChildren(DataModelObjectCategory.Surface, True):
+            index.setdefault(surface.Name, surface)
+    except Exception as e:
+        log(f"Error indexing surfaces: {str(e)}", "ERROR")
+    return index
+
+
+def create_surfaces_from_coordinate_systems(coordinate_systems, names, construction_geo=None, existing=None,
+                                            fingerprints=None, registry=None):
+    """
+    Create construction geometry surfaces for a batch of coordinate systems.
+    
+    The Construction Geometry folder is resolved once for the whole batch and
+    existing surfaces are looked up in a single index. Call inside a
+    Transaction when creating many objects.
+    
+    When fingerprints and a registry are given, an existing surface is only
+    reused untouched if its recorded fingerprint matches; otherwise it is
+    re-attached to its coordinate system in place.
+    
+    Args:
+        coordinate_systems (list): Coordinate system objects
+        names (list): Surface names, aligned with coordinate_systems
+        construction_geo: Optional construction geometry object (resolved if None)
+        existing (dict): Optional name -> surface index to reuse
+        fingerprints (list): Optional input fingerprints, aligned with coordinate_systems
+        registry (dict): Optional name -> fingerprint registry (updated in place)
+        
+    Returns:
+        list: Surface objects, aligned with coordinate_systems
+    """
+    if len(coordinate_systems) != len(names):
+        raise ValueError("coordinate_systems and names must have the same length")
+    if fingerprints is None:
+        fingerprints = [None] * len(coordinate_systems)
+    
+    if construction_geo is None:
+        construction_geo = ensure_construction_geometry()
+    index = existing if existing is not None else index_surfaces(construction_geo)
+    surfaces = []
+    seen = set()
+    created = updated = 0
+    
+    for cs, name, fingerprint in zip(coordinate_systems, names, fingerprints):
+        surface = index.get(name)
+        if surface is None:
+            surface = _add_surface(construction_geo, cs, name)
+            index[name] = surface
+            created += 1
+        elif name not in seen and not fingerprint_matches(registry, name, fingerprint):
+            surface.CoordinateSystem = cs
+            log(f"Updated surface: {name}")
+            updated += 1
+        if registry is not None and fingerprint is not None:
+            registry[name] = fingerprint
+        seen.add(name)
+        surfaces.append(surface)
+    
+    log(f"Surfaces: {created} created, {updated} updated, {len(names) - created - updated} reused")
+    return surfaces
+
+
+def _add_surface(construction_geo, coordinate_system, name):
+    """
+    Add a new construction geometry surface (no existence check).
+    
+    Args:
+        construction_geo: Construction geometry object
+        coordinate_system: Coordinate system object
+        name (str): Name for the surface
+        
+    Returns:
+        Construction geometry surface
+    """
     try:
         # Create new surface
         surface = construction_geo.AddSurface()
@@ -156,6 +419,46 @@ def create_surface_from_coordinate_system(coordinate_system, name):
         raise
 
 
+def create_face_aligned_surfaces(faces, cs_names, surface_names, registry=None):
+    """
+    Create coordinate systems and surfaces for all faces in one transaction.
+    
+    Resolves the Construction Geometry folder once, indexes existing
+    coordinate systems and surfaces once, and creates everything that is
+    missing inside a single Transaction.
+    
+    If a fingerprint registry is given, each coordinate system and surface is
+    fingerprinted from its face ID; objects whose inputs changed since the
+    last run are updated in place, unchanged objects are left untouched.
+    
+    Args:
+        faces (list): Geometry face entities (e.g., all faces of a named selection)
+        cs_names (list): Coordinate system names, aligned with faces
+        surface_names (list): Surface names, aligned with faces
+        registry (dict): Optional name -> fingerprint registry (updated in place)
+        
+    Returns:
+        tuple: (coordinate_systems, surfaces) - lists aligned with faces
+    """
+    construction_geo = ensure_construction_geometry()
+    
+    cs_fingerprints = None
+    surface_fingerprints = None
+    if registry is not None:
+        cs_fingerprints = [compute_fingerprint('cs', face.Id) for face in faces]
+        surface_fingerprints = [compute_fingerprint('surface', cs_name, fingerprint)
+                                for cs_name, fingerprint in zip(cs_names, cs_fingerprints)]
+    
+    with Transaction():
+        coordinate_systems = create_face_aligned_coordinate_systems(
+            faces, cs_names, fingerprints=cs_fingerprints, registry=registry)
+        surfaces = create_surfaces_from_coordinate_systems(
+            coordinate_systems, surface_names, construction_geo=construction_geo,
+            fingerprints=surface_fingerprints, registry=registry)
+    
+    return coordinate_systems, surfaces
+
+
 # ============================================================================
 # Body Scoping Functions
 # ============================================================================
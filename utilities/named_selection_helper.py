@@ -7,14 +7,51 @@ Common functions for working with ANSYS named selections.
 # pylint: disable=undefined-variable
 # pyright: reportUndefinedVariable=false
 # type: ignore
-# Note: ExtAPI is provided by ANSYS Mechanical runtime environment
+# Note: ExtAPI, DataModelObjectCategory are provided by ANSYS Mechanical runtime environment
 
 from .logging_config import log
 
 
+# Run-wide resolution cache shared by all modules:
+# name -> named selection object, and name -> {'ids': [...], 'entities': [...]}
+_NAMED_SELECTIONS = None
+_CONTENTS = {}
+
+
+def invalidate_named_selection_cache():
+    """
+    Drop all cached named selections and their contents.
+
+    Called at the start of every entry point, since the module stays loaded
+    between script runs, and after named selections are created, renamed,
+    deleted or regenerated.
+    """
+    global _NAMED_SELECTIONS
+    _NAMED_SELECTIONS = None
+    _CONTENTS.clear()
+
+
+def _named_selection_index():
+    """Return the name -> named selection index, walking Model.NamedSelections once."""
+    global _NAMED_SELECTIONS
+    if _NAMED_SELECTIONS is None:
+        _NAMED_SELECTIONS = {}
+        try:
+            if Model.NamedSelections is not None:
+                for ns in Model.NamedSelections.Children:
+                    _NAMED_SELECTIONS.setdefault(ns.Name, ns)
+        except Exception as e:
+            log(f"Error indexing named selections: {str(e)}", "ERROR")
+    return _NAMED_SELECTIONS
+
+
 def get_named_selection(named_selection_name):
     """
-    Retrieve a named selection by name using ANSYS best practice API.
+    Retrieve a named selection by name.
+
+    Uses the shared resolution cache built from a single walk of
+    Model.NamedSelections, falling back to GetObjectsByName for names
+    that are not in the cache.
 
     Args:
         named_selection_name (str): Name of the named selection
@@ -23,12 +60,22 @@ def get_named_selection(named_selection_name):
         Named selection object or None if not found
     """
     try:
-        # Use GetObjectsByName as per ANSYS best practices
-        results = ExtAPI.DataModel.GetObjectsByName(named_selection_name)
+        index = _named_selection_index()
+        named_selection = index.get(named_selection_name)
+
+        if named_selection is None:
+            # Fallback: model-wide search (e.g., selection created outside this run).
+            # Other objects can share the name, so only named selections are used.
+            results = ExtAPI.DataModel.GetObjectsByName(named_selection_name) or []
+            for result in results:
+                if result.DataModelObjectCategory == DataModelObjectCategory.NamedSelection:
+                    named_selection = result
+                    index[named_selection_name] = named_selection
+                    break
 
-        if results and len(results) > 0:
+        if named_selection is not None:
             log(f"Found named selection '{named_selection_name}'")
-            return results[0]
+            return named_selection
         else:
             log(f"Named selection '{named_selection_name}' not found", "WARNING")
             return None
@@ -38,6 +85,88 @@ def get_named_selection(named_selection_name):
         return None
 
 
+def _named_selection_contents(named_selection):
+    """Return cached {'ids', 'entities'} for a named selection, resolving it once."""
+    name = named_selection.Name
+    contents = _CONTENTS.get(name)
+    if contents is None:
+        selection = ExtAPI.SelectionManager.CreateSelectionInfo(SelectionTypeEnum.GeometryEntities)
+        selection.Ids = named_selection.Ids
+        contents = {'ids': list(selection.Ids), 'entities': list(selection.Entities)}
+        _CONTENTS[name] = contents
+    return contents
+
+
+def get_named_selection_ids(named_selection_name):
+    """
+    Get the geometry entity IDs of a named selection (cached).
+
+    Args:
+        named_selection_name (str): Name of the named selection
+
+    Returns:
+        list: Geometry entity IDs, or None if the named selection is not found
+    """
+    named_selection = get_named_selection(named_selection_name)
+    if named_selection is None:
+        return None
+    try:
+        return list(_named_selection_contents(named_selection)['ids'])
+    except Exception as e:
+        log(f"Error reading named selection '{named_selection_name}': {str(e)}", "ERROR")
+        return None
+
+
+def resolve_named_selections(named_selection_names):
+    """
+    Resolve several named selections at once and detect shared entities.
+
+    Each named selection is resolved once through the shared resolution
+    cache. Entities that appear in more than one named selection are owned
+    by the first named selection (in the given order) that contains them.
+
+    Args:
+        named_selection_names (list): Named selection names, in priority order
+
+    Returns:
+        dict: Resolution result with keys:
+            - entities: Name -> list of geometry entities (missing names omitted)
+            - missing: Names that could not be found or read
+            - owner: Entity ID -> name of the owning named selection
+            - members: Entity ID -> list of names containing the entity
+            - overlaps: Entity ID -> list of names, only for shared entities
+    """
+    resolved = {'entities': {}, 'missing': [], 'owner': {}, 'members': {}, 'overlaps': {}}
+
+    for name in named_selection_names:
+        if name in resolved['entities'] or name in resolved['missing']:
+            continue
+
+        named_selection = get_named_selection(name)
+        if named_selection is None:
+            resolved['missing'].append(name)
+            continue
+        try:
+            entities = list(_named_selection_contents(named_selection)['entities'])
+        except Exception as e:
+            log(f"Error reading named selection '{name}': {str(e)}", "ERROR")
+            resolved['missing'].append(name)
+            continue
+
+        resolved['entities'][name] = entities
+        for entity in entities:
+            resolved['owner'].setdefault(entity.Id, name)
+            members = resolved['members'].setdefault(entity.Id, [])
+            if name not in members:
+                members.append(name)
+
+    resolved['overlaps'] = {entity_id: names for entity_id, names in resolved['members'].items()
+                            if len(names) > 1}
+    if resolved['overlaps']:
+        log(f"{len(resolved['overlaps'])} entity(ies) shared between named selections")
+    return resolved
+
+
 def get_faces_from_named_selection(named_selection):
     """
     Extract individual faces from a named selection.
@@ -85,6 +214,9 @@ def named_selection_to_list(named_selection):
     Uses the selection manager to properly extract entities from named selections.
     This is the recommended approach for working with named selection contents.
     
+    Entities are resolved once per named selection and served from the
+    shared resolution cache afterwards.
+    
     Args:
         named_selection: ANSYS named selection object
         
@@ -92,9 +224,7 @@ def named_selection_to_list(named_selection):
         list: List of geometry entities from the named selection
     """
     try:
-        selection = ExtAPI.SelectionManager.CreateSelectionInfo(SelectionTypeEnum.GeometryEntities)
-        selection.Ids = named_selection.Ids
-        entities = list(selection.Entities)
+        entities = list(_named_selection_contents(named_selection)['entities'])
         log(f"Extracted {len(entities)} entities from named selection")
         return entities
     except Exception as e:
@@ -124,3 +254,44 @@ def normalize_named_selection_list(ns_config):
     else:
         raise ValueError("Named selection configuration must be a string or list/tuple")
 
+
+
+def create_or_update_named_selections(selections):
+    """
+    Create or update many geometry named selections in one transaction.
+    
+    Existing named selections are indexed once and re-scoped in place;
+    missing ones are added. Entries with no IDs are skipped. The shared
+    resolution cache is invalidated afterwards.
+    
+    Args:
+        selections (dict): Mapping of named selection name -> list of geometry entity IDs
+        
+    Returns:
+        dict: Mapping of named selection name -> named selection object
+    """
+    existing = _named_selection_index()
+    
+    created = {}
+    with Transaction():
+        for name, ids in selections.items():
+            if not ids:
+                continue
+            try:
+                selection = ExtAPI.SelectionManager.CreateSelectionInfo(SelectionTypeEnum.GeometryEntities)
+                selection.Ids = [int(entity_id) for entity_id in ids]
+                
+                ns = existing.get(name)
+                if ns is None:
+                    ns = Model.AddNamedSelection()
+                    ns.Name = name
+                    log(f"Created named selection '{name}' with {len(ids)} entities")
+                else:
+                    log(f"Updated named selection '{name}' with {len(ids)} entities")
+                ns.Location = selection
+                created[name] = ns
+            except Exception as e:
+                log(f"Error creating named selection '{name}': {str(e)}", "ERROR")
+    
+    invalidate_named_selection_cache()
+    return created
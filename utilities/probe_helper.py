@@ -5,6 +5,7 @@ Probe Helper Functions
 Common functions for working with ANSYS reaction probes:
 - Force reaction probes
 - Moment reaction probes
+- Reaction probes on beam connections
 - Probe grouping and management
 """
 # pylint: disable=undefined-variable
@@ -13,6 +14,8 @@ Common functions for working with ANSYS reaction probes:
 # Note: ExtAPI, Model, DataModelObjectCategory, etc. provided by ANSYS Mechanical
 
 from .logging_config import log
+from .state_helper import fingerprint_matches
+from .tree_group_helper import find_tree_group, create_tree_group, sync_tree_group
 
 
 # ============================================================================
@@ -41,81 +44,210 @@ def find_probe(solution, name, probe_type):
     return None
 
 
+def index_probes(solution, probe_type):
+    """
+    Build a name -> probe lookup for one probe type with a single solution scan.
+    
+    Args:
+        solution: Analysis solution object
+        probe_type: Type category (e.g., DataModelObjectCategory.ForceReaction)
+        
+    Returns:
+        dict: Mapping of probe name to probe object
+    """
+    index = {}
+    try:
+        for probe in solution.GetChildren(probe_type, True):
+            index.setdefault(probe.Name, probe)
+    except Exception as e:
+        log(f"Error indexing probes: {str(e)}", "ERROR")
+    return index
+
+
 # ============================================================================
 # Probe Creation Functions
 # ============================================================================
 
-def create_force_reaction_probe(solution, surface, coordinate_system, body_selection, name):
+def create_force_reaction_probe(solution, surface, coordinate_system, body_selection, name,
+                                fingerprint=None, registry=None, existing=None):
     """
     Create a force reaction probe, or return existing one if it exists.
     
+    When a fingerprint and registry are given, an existing probe is only
+    reused untouched if its recorded fingerprint matches. A probe whose
+    inputs changed is re-scoped in place and the registry is updated.
+    
     Args:
         solution: Analysis solution object
         surface: Construction geometry surface for probe location
         coordinate_system: Coordinate system for orientation
         body_selection: Body selection info for scoping
         name (str): Name for the probe
+        fingerprint (str): Optional fingerprint of the probe inputs
+        registry (dict): Optional name -> fingerprint registry (updated in place)
+        existing (dict): Optional name -> probe index (see index_probes)
         
     Returns:
         Force reaction probe object
     """
     # Check if probe already exists
-    existing_probe = find_probe(solution, name, DataModelObjectCategory.ForceReaction)
-    if existing_probe is not None:
-        return existing_probe
+    if existing is not None:
+        existing_probe = existing.get(name)
+    else:
+        existing_probe = find_probe(solution, name, DataModelObjectCategory.ForceReaction)
     
     try:
-        # Create new probe
-        probe = solution.AddForceReaction()
-        probe.LocationMethod = LocationDefinitionMethod.Surface
-        probe.SurfaceSelection = surface
-        probe.Orientation = coordinate_system
-        probe.GeometryLocation = body_selection
-        probe.Name = name
+        if existing_probe is None:
+            probe = solution.AddForceReaction()
+            _configure_reaction_probe(probe, surface, coordinate_system, body_selection)
+            probe.Name = name
+            log(f"Created force reaction probe: {name}")
+        elif not fingerprint_matches(registry, name, fingerprint):
+            probe = existing_probe
+            _configure_reaction_probe(probe, surface, coordinate_system, body_selection)
+            log(f"Updated force reaction probe: {name}")
+        else:
+            return existing_probe
         
-        log(f"Created force reaction probe: {name}")
+        if registry is not None and fingerprint is not None:
+            registry[name] = fingerprint
         return probe
     except Exception as e:
         log(f"Error creating force probe '{name}': {str(e)}", "ERROR")
         raise
 
 
-def create_moment_reaction_probe(solution, surface, coordinate_system, body_selection, name):
+def create_moment_reaction_probe(solution, surface, coordinate_system, body_selection, name,
+                                 fingerprint=None, registry=None, existing=None):
     """
     Create a moment reaction probe, or return existing one if it exists.
     
+    When a fingerprint and registry are given, an existing probe is only
+    reused untouched if its recorded fingerprint matches. A probe whose
+    inputs changed is re-scoped in place and the registry is updated.
+    
     Args:
         solution: Analysis solution object
         surface: Construction geometry surface for probe location
         coordinate_system: Coordinate system for orientation
         body_selection: Body selection info for scoping
         name (str): Name for the probe
+        fingerprint (str): Optional fingerprint of the probe inputs
+        registry (dict): Optional name -> fingerprint registry (updated in place)
+        existing (dict): Optional name -> probe index (see index_probes)
         
     Returns:
         Moment reaction probe object
     """
     # Check if probe already exists
-    existing_probe = find_probe(solution, name, DataModelObjectCategory.MomentReaction)
-    if existing_probe is not None:
-        return existing_probe
+    if existing is not None:
+        existing_probe = existing.get(name)
+    else:
+        existing_probe = find_probe(solution, name, DataModelObjectCategory.MomentReaction)
     
     try:
-        # Create new probe
-        probe = solution.AddMomentReaction()
-        probe.LocationMethod = LocationDefinitionMethod.Surface
-        probe.SurfaceSelection = surface
-        probe.Orientation = coordinate_system
-        probe.GeometryLocation = body_selection
-        probe.Summation = MomentsAtSummationPointType.OrientationSystem
-        probe.Name = name
+        if existing_probe is None:
+            probe = solution.AddMomentReaction()
+            _configure_reaction_probe(probe, surface, coordinate_system, body_selection)
+            probe.Summation = MomentsAtSummationPointType.OrientationSystem
+            probe.Name = name
+            log(f"Created moment reaction probe: {name}")
+        elif not fingerprint_matches(registry, name, fingerprint):
+            probe = existing_probe
+            _configure_reaction_probe(probe, surface, coordinate_system, body_selection)
+            probe.Summation = MomentsAtSummationPointType.OrientationSystem
+            log(f"Updated moment reaction probe: {name}")
+        else:
+            return existing_probe
         
-        log(f"Created moment reaction probe: {name}")
+        if registry is not None and fingerprint is not None:
+            registry[name] = fingerprint
         return probe
     except Exception as e:
         log(f"Error creating moment probe '{name}': {str(e)}", "ERROR")
         raise
 
 
+def create_beam_reaction_probes(solution, beam, coordinate_system, force_name, moment_name,
+                                fingerprint=None, registry=None, existing_force=None, existing_moment=None):
+    """
+    Create (or reuse) the force and moment reaction probes of a beam connection.
+    
+    The probes are scoped to the beam as boundary condition and oriented in
+    the given coordinate system, so their components are reported in the
+    same layout as the face-based probes.
+    
+    Args:
+        solution: Analysis solution object
+        beam: Beam connection object
+        coordinate_system: Coordinate system for orientation (Z along the bolt axis)
+        force_name (str): Name for the force probe
+        moment_name (str): Name for the moment probe
+        fingerprint (str): Optional fingerprint of the probe inputs
+        registry (dict): Optional name -> fingerprint registry (updated in place)
+        existing_force (dict): Optional name -> force probe index (see index_probes)
+        existing_moment (dict): Optional name -> moment probe index (see index_probes)
+        
+    Returns:
+        tuple: (force_probe, moment_probe)
+    """
+    if existing_force is None:
+        existing_force = index_probes(solution, DataModelObjectCategory.ForceReaction)
+    if existing_moment is None:
+        existing_moment = index_probes(solution, DataModelObjectCategory.MomentReaction)
+    
+    probes = []
+    for name, existing, add in ((force_name, existing_force, solution.AddForceReaction),
+                                (moment_name, existing_moment, solution.AddMomentReaction)):
+        probe = existing.get(name)
+        try:
+            if probe is None:
+                probe = add()
+                probe.Name = name
+                _configure_beam_reaction_probe(probe, beam, coordinate_system)
+                log(f"Created beam reaction probe: {name}")
+            elif not fingerprint_matches(registry, name, fingerprint):
+                _configure_beam_reaction_probe(probe, beam, coordinate_system)
+                log(f"Updated beam reaction probe: {name}")
+            if registry is not None and fingerprint is not None:
+                registry[name] = fingerprint
+        except Exception as e:
+            log(f"Error creating beam probe '{name}': {str(e)}", "ERROR")
+            raise
+        probes.append(probe)
+    return probes[0], probes[1]
+
+
+def _configure_beam_reaction_probe(probe, beam, coordinate_system):
+    """
+    Scope a reaction probe to a beam connection and orientation.
+    
+    Args:
+        probe: Force or moment reaction probe
+        beam: Beam connection object
+        coordinate_system: Coordinate system for orientation
+    """
+    probe.LocationMethod = LocationDefinitionMethod.BoundaryCondition
+    probe.BoundaryConditionSelection = beam
+    probe.Orientation = coordinate_system
+
+
+def _configure_reaction_probe(probe, surface, coordinate_system, body_selection):
+    """
+    Scope a reaction probe to a surface, orientation and body.
+    
+    Args:
+        probe: Force or moment reaction probe
+        surface: Construction geometry surface for probe location
+        coordinate_system: Coordinate system for orientation
+        body_selection: Body selection info for scoping
+    """
+    probe.LocationMethod = LocationDefinitionMethod.Surface
+    probe.SurfaceSelection = surface
+    probe.Orientation = coordinate_system
+    probe.GeometryLocation = body_selection
+
+
 # ============================================================================
 # Probe Data Extraction
 # ============================================================================
@@ -169,14 +301,7 @@ def find_group(solution, group_name):
     Returns:
         Group object or None if not found
     """
-    try:
-        for child in solution.Children:
-            if hasattr(child, 'Name') and child.Name == group_name:
-                log(f"Found existing group: {group_name}")
-                return child
-    except Exception as e:
-        log(f"Error searching for group '{group_name}': {str(e)}", "ERROR")
-    return None
+    return find_tree_group(solution, group_name)
 
 
 def create_probe_group(probes, group_name):
@@ -190,14 +315,7 @@ def create_probe_group(probes, group_name):
     Returns:
         Group object
     """
-    try:
-        group = Tree.Group(probes)
-        group.Name = group_name
-        log(f"Created probe group: {group_name} with {len(probes)} probe(s)")
-        return group
-    except Exception as e:
-        log(f"Error creating group '{group_name}': {str(e)}", "ERROR")
-        raise
+    return create_tree_group(probes, group_name)
 
 
 def manage_probe_groups(solution, force_probes, moment_probes, base_name):
@@ -208,6 +326,11 @@ def manage_probe_groups(solution, force_probes, moment_probes, base_name):
     - Force_Probes_{base_name}
     - Moment_Probes_{base_name}
     
+    Existing groups are updated incrementally (see
+    tree_group_helper.sync_tree_group) so probes added on a re-run end up
+    inside the group. Both groups are
+    synchronized in a single transaction.
+    
     Args:
         solution: Analysis solution object
         force_probes (list): List of force probe objects
@@ -220,19 +343,9 @@ def manage_probe_groups(solution, force_probes, moment_probes, base_name):
     force_group_name = f"Force_Probes_{base_name}"
     moment_group_name = f"Moment_Probes_{base_name}"
     
-    # Check if groups already exist
-    existing_force_group = find_group(solution, force_group_name)
-    existing_moment_group = find_group(solution, moment_group_name)
-    
-    if existing_force_group is not None:
-        force_group = existing_force_group
-    else:
-        force_group = create_probe_group(force_probes, force_group_name)
-    
-    if existing_moment_group is not None:
-        moment_group = existing_moment_group
-    else:
-        moment_group = create_probe_group(moment_probes, moment_group_name)
+    with Transaction():
+        force_group = sync_tree_group(solution, force_probes, force_group_name)
+        moment_group = sync_tree_group(solution, moment_probes, moment_group_name)
     
     return force_group, moment_group
 
@@ -0,0 +1,340 @@
+"""
+Spatial Index Functions
+========================
+
+Uniform-grid spatial hash over 3D points for neighbourhood queries:
+- Points within a radius of a query point
+- All point pairs closer than a radius
+- Clustering of coaxial faces (bolt shank, head and nut faces) into bolts
+- Sweep-and-prune over axis-aligned bounding boxes (contact candidates)
+- Nearest-neighbour distances between two point sets
+- Point-to-surface distances onto triangulated faces (contact gaps)
+
+Building the index sorts the cell keys once (O(N log N)); queries only
+touch neighbouring cells instead of comparing every pair of points.
+"""
+import numpy as np
+
+
+class SpatialHash:
+    """
+    Spatial hash of 3D points on a uniform grid.
+
+    Args:
+        points: (N, 3) array of point coordinates
+        cell_size (float): Grid cell edge length (use the typical query radius)
+    """
+
+    def __init__(self, points, cell_size):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+
+        self.points = np.asarray(points, dtype=float).reshape(-1, 3)
+        self.cell_size = float(cell_size)
+        self._cells = {}
+
+        if len(self.points) == 0:
+            return
+
+        keys = np.floor(self.points / self.cell_size).astype(np.int64)
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = np.asarray(inverse).reshape(-1)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique_keys) + 1))
+
+        for cell, start, stop in zip(unique_keys, bounds[:-1], bounds[1:]):
+            self._cells[tuple(int(v) for v in cell)] = order[start:stop]
+
+    def _cells_in_box(self, low, high):
+        low_key = np.floor(np.asarray(low) / self.cell_size).astype(np.int64)
+        high_key = np.floor(np.asarray(high) / self.cell_size).astype(np.int64)
+        found = []
+        for x in range(low_key[0], high_key[0] + 1):
+            for y in range(low_key[1], high_key[1] + 1):
+                for z in range(low_key[2], high_key[2] + 1):
+                    indices = self._cells.get((x, y, z))
+                    if indices is not None:
+                        found.append(indices)
+        return np.concatenate(found) if found else np.zeros(0, dtype=int)
+
+    def query_radius(self, point, radius):
+        """
+        Find all points within a radius of a query point.
+
+        Args:
+            point: Query point (3 coordinates)
+            radius (float): Search radius
+
+        Returns:
+            np.ndarray: Indices of points within the radius (sorted)
+        """
+        point = np.asarray(point, dtype=float)
+        candidates = self._cells_in_box(point - radius, point + radius)
+        if len(candidates) == 0:
+            return candidates
+        distances = np.linalg.norm(self.points[candidates] - point, axis=1)
+        return np.sort(candidates[distances <= radius])
+
+    def query_pairs(self, radius):
+        """
+        Find all pairs of points closer than a radius.
+
+        Args:
+            radius (float): Maximum pair distance
+
+        Returns:
+            np.ndarray: (M, 2) array of index pairs (i < j)
+        """
+        reach = int(np.ceil(radius / self.cell_size))
+        offsets = [(dx, dy, dz)
+                   for dx in range(-reach, reach + 1)
+                   for dy in range(-reach, reach + 1)
+                   for dz in range(-reach, reach + 1)]
+
+        pairs = []
+        for cell, members in self._cells.items():
+            neighbours = []
+            for dx, dy, dz in offsets:
+                indices = self._cells.get((cell[0] + dx, cell[1] + dy, cell[2] + dz))
+                if indices is not None:
+                    neighbours.append(indices)
+            neighbours = np.concatenate(neighbours)
+
+            first = np.repeat(members, len(neighbours))
+            second = np.tile(neighbours, len(members))
+            keep = first < second
+            first, second = first[keep], second[keep]
+            distances = np.linalg.norm(self.points[first] - self.points[second], axis=1)
+            close = distances <= radius
+            if np.any(close):
+                pairs.append(np.column_stack([first[close], second[close]]))
+
+        if not pairs:
+            return np.zeros((0, 2), dtype=int)
+        return np.concatenate(pairs)
+
+
+def connected_components(count, pairs):
+    """
+    Label connected components of a graph given as index pairs.
+
+    Args:
+        count (int): Number of nodes
+        pairs: (M, 2) array of connected node pairs
+
+    Returns:
+        np.ndarray: Component label per node (0..K-1, in order of first node)
+    """
+    parent = np.arange(count)
+
+    def find(node):
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    for first, second in np.asarray(pairs, dtype=int).reshape(-1, 2):
+        root_first, root_second = find(first), find(second)
+        if root_first != root_second:
+            parent[max(root_first, root_second)] = min(root_first, root_second)
+
+    roots = np.array([find(node) for node in range(count)], dtype=int)
+    _, labels = np.unique(roots, return_inverse=True)
+    return np.asarray(labels).reshape(-1)
+
+
+def coaxial_pairs(centroids, axes, radial_tolerance, axial_reach, angle_tolerance=2.0, index=None):
+    """
+    Find pairs of faces that lie on a common axis.
+
+    Two faces are coaxial when their axes are parallel (or anti-parallel)
+    within the angle tolerance and each centroid lies within the radial
+    tolerance of the other face's axis line.
+
+    Args:
+        centroids: (N, 3) face centroids
+        axes: (N, 3) unit face axes (zero rows are never paired)
+        radial_tolerance (float): Maximum distance from the axis line
+        axial_reach (float): Maximum distance between paired centroids
+        angle_tolerance (float): Maximum angle between axes in degrees
+        index (SpatialHash): Optional prebuilt index over the centroids
+
+    Returns:
+        np.ndarray: (M, 2) array of coaxial index pairs
+    """
+    centroids = np.asarray(centroids, dtype=float).reshape(-1, 3)
+    axes = np.asarray(axes, dtype=float).reshape(-1, 3)
+    if index is None:
+        index = SpatialHash(centroids, axial_reach)
+
+    pairs = index.query_pairs(axial_reach)
+    if len(pairs) == 0:
+        return pairs
+
+    first, second = pairs[:, 0], pairs[:, 1]
+    cos_angle = np.abs(np.sum(axes[first] * axes[second], axis=1))
+    parallel = cos_angle >= np.cos(np.radians(angle_tolerance))
+
+    offset = centroids[second] - centroids[first]
+    axial = np.sum(offset * axes[first], axis=1)
+    radial = np.linalg.norm(offset - axial[:, None] * axes[first], axis=1)
+
+    return pairs[parallel & (radial <= radial_tolerance)]
+
+
+def cluster_coaxial_faces(centroids, axes, radial_tolerance, axial_reach, angle_tolerance=2.0):
+    """
+    Cluster faces that share a common axis (one cluster per bolt).
+
+    Args:
+        centroids: (N, 3) face centroids
+        axes: (N, 3) unit face axes
+        radial_tolerance (float): Maximum distance from the common axis
+        axial_reach (float): Maximum distance between faces of one bolt
+        angle_tolerance (float): Maximum angle between axes in degrees
+
+    Returns:
+        np.ndarray: Cluster label per face
+    """
+    pairs = coaxial_pairs(centroids, axes, radial_tolerance, axial_reach, angle_tolerance)
+    return connected_components(len(np.asarray(centroids).reshape(-1, 3)), pairs)
+
+
+def sweep_and_prune(low, high, margin=0.0, groups=None):
+    """
+    Find pairs of axis-aligned bounding boxes that overlap.
+
+    Boxes are sorted once along X; for every box the boxes whose minimum X
+    falls inside its X extent are found with a binary search, and the Y and
+    Z extents of those candidates are checked with array operations.
+
+    Args:
+        low: (N, 3) box minimum corners
+        high: (N, 3) box maximum corners
+        margin (float): Gap up to which boxes still count as overlapping
+        groups: Optional (N,) group label per box; pairs within a group are dropped
+
+    Returns:
+        np.ndarray: (M, 2) array of overlapping box index pairs (i < j)
+    """
+    low = np.asarray(low, dtype=float).reshape(-1, 3)
+    high = np.asarray(high, dtype=float).reshape(-1, 3)
+    count = len(low)
+    if count < 2:
+        return np.zeros((0, 2), dtype=int)
+
+    order = np.argsort(low[:, 0], kind='stable')
+    sorted_low = low[order, 0]
+    stop = np.searchsorted(sorted_low, high[order, 0] + margin, side='right')
+    counts = np.maximum(stop - np.arange(count) - 1, 0)
+
+    first = np.repeat(np.arange(count), counts)
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    second = np.arange(len(first)) - starts + first + 1
+    first, second = order[first], order[second]
+
+    overlap = np.all((low[first, 1:] <= high[second, 1:] + margin)
+                     & (low[second, 1:] <= high[first, 1:] + margin), axis=1)
+    if groups is not None:
+        groups = np.asarray(groups)
+        overlap &= groups[first] != groups[second]
+    first, second = first[overlap], second[overlap]
+
+    pairs = np.column_stack([np.minimum(first, second), np.maximum(first, second)])
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))] if len(pairs) else pairs.astype(int)
+
+
+def nearest_distances(points, targets, chunk_size=2048):
+    """
+    Distance from every point to its nearest target point.
+
+    Args:
+        points: (N, 3) query points
+        targets: (M, 3) target points
+        chunk_size (int): Query points processed per block (bounds memory use)
+
+    Returns:
+        np.ndarray: (N,) nearest distances (inf if there are no targets)
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    targets = np.asarray(targets, dtype=float).reshape(-1, 3)
+    if len(targets) == 0:
+        return np.full(len(points), np.inf)
+
+    distances = np.empty(len(points))
+    for start in range(0, len(points), chunk_size):
+        block = points[start:start + chunk_size]
+        squared = np.sum((block[:, None, :] - targets[None, :, :]) ** 2, axis=2)
+        distances[start:start + chunk_size] = np.sqrt(squared.min(axis=1))
+    return distances
+
+
+def closest_points_on_triangles(points, a, b, c):
+    """
+    Closest point on a triangle to a point, for broadcast arrays of both.
+
+    Uses the Voronoi-region tests of the triangle's vertices, edges and
+    face, so points beyond an edge or vertex are projected onto it.
+
+    Args:
+        points: (..., 3) query points
+        a, b, c: (..., 3) triangle corners (broadcast against points)
+
+    Returns:
+        np.ndarray: (..., 3) closest points
+    """
+    points, a, b, c = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (points, a, b, c)))
+    ab, ac = b - a, c - a
+    ap, bp, cp = points - a, points - b, points - c
+    d1, d2 = np.sum(ab * ap, axis=-1), np.sum(ac * ap, axis=-1)
+    d3, d4 = np.sum(ab * bp, axis=-1), np.sum(ac * bp, axis=-1)
+    d5, d6 = np.sum(ab * cp, axis=-1), np.sum(ac * cp, axis=-1)
+    vc = d1 * d4 - d3 * d2
+    vb = d5 * d2 - d1 * d6
+    va = d3 * d6 - d5 * d4
+
+    def ratio(numerator, denominator):
+        safe = np.where(denominator != 0.0, denominator, 1.0)
+        return np.where(denominator != 0.0, numerator / safe, 0.0)[..., None]
+
+    total = va + vb + vc
+    candidates = [
+        (d1 <= 0.0) & (d2 <= 0.0), a,
+        (d3 >= 0.0) & (d4 <= d3), b,
+        (vc <= 0.0) & (d1 >= 0.0) & (d3 <= 0.0), a + ratio(d1, d1 - d3) * ab,
+        (d6 >= 0.0) & (d5 <= d6), c,
+        (vb <= 0.0) & (d2 >= 0.0) & (d6 <= 0.0), a + ratio(d2, d2 - d6) * ac,
+        (va <= 0.0) & (d4 >= d3) & (d5 >= d6), b + ratio(d4 - d3, (d4 - d3) + (d5 - d6)) * (c - b),
+    ]
+    closest = a + ratio(vb, total) * ab + ratio(vc, total) * ac
+    for index in range(len(candidates) - 2, -1, -2):
+        closest = np.where(candidates[index][..., None], candidates[index + 1], closest)
+    return closest
+
+
+def nearest_surface_distances(points, triangles, chunk_size=256):
+    """
+    Distance from every point to the nearest point of a triangulated surface.
+
+    Args:
+        points: (N, 3) query points
+        triangles: (T, 3, 3) triangle corner points
+        chunk_size (int): Query points processed per block (bounds memory use)
+
+    Returns:
+        np.ndarray: (N,) point-to-surface distances (inf if there are no triangles)
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    triangles = np.asarray(triangles, dtype=float).reshape(-1, 3, 3)
+    if len(triangles) == 0:
+        return np.full(len(points), np.inf)
+
+    a, b, c = triangles[None, :, 0], triangles[None, :, 1], triangles[None, :, 2]
+    distances = np.empty(len(points))
+    for start in range(0, len(points), chunk_size):
+        block = points[start:start + chunk_size, None, :]
+        closest = closest_points_on_triangles(block, a, b, c)
+        distances[start:start + chunk_size] = np.sqrt(np.sum((block - closest) ** 2, axis=-1).min(axis=1))
+    return distances
@@ -0,0 +1,248 @@
+"""
+State Helper Functions
+=======================
+
+Persistent run state shared between automation runs:
+- JSON state files stored per model in the project's state/ directory
+- Input fingerprints used to detect which generated objects changed
+- Reconciliation of generated tree objects with their planned inputs
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: ExtAPI is provided by ANSYS Mechanical runtime environment
+
+import os
+import re
+import json
+import hashlib
+
+from .logging_config import log
+from .config_loader import get_project_root
+
+
+# ============================================================================
+# State Files
+# ============================================================================
+
+def get_model_key():
+    """
+    Get the state key of the open Mechanical model.
+
+    The key combines the project file name with a hash of its full path,
+    so models with the same file name in different folders do not share
+    state.
+
+    Returns:
+        str: '<project name>_<path hash>', 'unsaved' for a project that was
+             never saved, or None outside Mechanical
+    """
+    try:
+        file_path = ExtAPI.DataModel.Project.FilePath
+    except Exception:
+        return None
+    if not file_path:
+        return 'unsaved'
+    name = re.sub(r'[^A-Za-z0-9_.-]+', '_', os.path.splitext(os.path.basename(file_path))[0])
+    digest = hashlib.sha1(os.path.normcase(os.path.abspath(file_path)).encode('utf-8')).hexdigest()[:8]
+    return f"{name}_{digest}"
+
+
+def get_state_path(state_filename, per_model=True):
+    """
+    Get the full path to a state file in the state/ directory.
+
+    Generated object names, fingerprints and bolt numbering belong to one
+    model, so by default each model gets its own subdirectory (see
+    get_model_key). Outside Mechanical the state/ directory itself is used.
+
+    Args:
+        state_filename (str): Name of state file (e.g., 'bolt_force_extraction_state.json')
+        per_model (bool): Keep the file in the subdirectory of the open model
+
+    Returns:
+        str: Full path to state file
+    """
+    model_key = get_model_key() if per_model else None
+    if model_key is None:
+        return os.path.join(get_project_root(), 'state', state_filename)
+    return os.path.join(get_project_root(), 'state', model_key, state_filename)
+
+
+def load_state(state_path):
+    """
+    Load a JSON state file.
+
+    A missing or unreadable state file is not an error: the run simply
+    starts from an empty state and rebuilds what it needs.
+
+    Args:
+        state_path (str): Path to state file
+
+    Returns:
+        dict: Parsed state dictionary (empty if unavailable)
+    """
+    if not os.path.exists(state_path):
+        return {}
+
+    try:
+        with open(state_path, 'r') as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except Exception as e:
+        log(f"Could not read state file '{state_path}': {str(e)}", "WARNING")
+        return {}
+
+
+def save_state(state_path, state):
+    """
+    Write a JSON state file atomically.
+
+    Args:
+        state_path (str): Path to state file
+        state (dict): State dictionary to write
+    """
+    directory = os.path.dirname(state_path)
+    try:
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        temp_path = state_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(temp_path, state_path)
+    except Exception as e:
+        log(f"Could not write state file '{state_path}': {str(e)}", "WARNING")
+
+
+# ============================================================================
+# Fingerprints
+# ============================================================================
+
+def compute_fingerprint(*parts):
+    """
+    Compute a short, stable fingerprint of the given input values.
+
+    Args:
+        *parts: JSON-serializable values (non-serializable values use str())
+
+    Returns:
+        str: 16-character hexadecimal fingerprint
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def fingerprint_matches(registry, name, fingerprint):
+    """
+    Check whether an object's recorded fingerprint matches the expected one.
+
+    Args:
+        registry (dict): Mapping of object name -> recorded fingerprint (or None)
+        name (str): Object name
+        fingerprint (str): Expected fingerprint (or None to skip the check)
+
+    Returns:
+        bool: True if no check is requested or the fingerprints match
+    """
+    if fingerprint is None or registry is None:
+        return True
+    return registry.get(name) == fingerprint
+
+
+# ============================================================================
+# Reconciliation
+# ============================================================================
+
+def reconcile_objects(items, existing, registry, create, update, unsettled_owners=(), label='object'):
+    """
+    Reconcile generated tree objects with their planned items by name.
+
+    For every planned item (a dict with at least 'name', 'owner' and
+    'fingerprint'; the owner is what the item was planned from, e.g. its
+    named selection):
+    - Extra objects sharing its name (duplicates from earlier runs) are deleted
+    - An object whose recorded fingerprint matches is left untouched
+    - A changed object is passed to update(obj, item, recorded), which
+      returns False if nothing had to change, or True (or a short detail
+      string for the log) if it was updated
+    - A missing object is created with create(item)
+    An item that fails keeps its existing object and its registry entry.
+
+    Objects recorded in the registry that are no longer planned are
+    orphans and are deleted, unless their owner is unsettled (configured
+    but could not be planned this run, e.g. a missing named selection):
+    those are kept until their owner plans again or is removed from the
+    configuration. Objects never recorded (created by hand) are never
+    touched. Call inside a Transaction.
+
+    Args:
+        items (list): Planned items
+        existing (dict): Name -> list of existing tree objects with that name
+        registry (dict): Name -> {'owner', 'fingerprint'} (updated in place)
+        create (callable): create(item) -> new tree object
+        update (callable): update(obj, item, recorded fingerprint) -> False, True or detail string
+        unsettled_owners (iterable): Owners whose recorded objects are kept
+        label (str): Object label used in log messages
+
+    Returns:
+        tuple: (counts dict with 'created', 'updated', 'unchanged', 'deleted'
+                and 'failed', name -> tree object of every planned item that has one)
+    """
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0, 'failed': 0}
+    objects = {}
+    planned = set()
+    unsettled_owners = set(unsettled_owners)
+
+    for item in items:
+        name = item['name']
+        planned.add(name)
+        found = existing.get(name, [])
+        try:
+            for duplicate in found[1:]:
+                duplicate.Delete()
+                counts['deleted'] += 1
+
+            entry = registry.get(name)
+            recorded = entry.get('fingerprint') if isinstance(entry, dict) else None
+            if found and recorded == item['fingerprint']:
+                counts['unchanged'] += 1
+                objects[name] = found[0]
+                continue
+
+            if found:
+                obj = found[0]
+                changed = update(obj, item, recorded)
+                if changed:
+                    counts['updated'] += 1
+                    detail = f" ({changed})" if isinstance(changed, str) else ""
+                    log(f"  Updated {label}: {name}{detail}")
+                else:
+                    counts['unchanged'] += 1
+            else:
+                obj = create(item)
+                counts['created'] += 1
+                log(f"  Created {label}: {name}")
+            registry[name] = {'owner': item['owner'], 'fingerprint': item['fingerprint']}
+            objects[name] = obj
+        except Exception as e:
+            counts['failed'] += 1
+            log(f"  Error reconciling {label} {name}: {str(e)}", "ERROR")
+            if found:
+                objects[name] = found[0]
+
+    kept = {}
+    for name in [name for name in registry if name not in planned]:
+        entry = registry[name]
+        if isinstance(entry, dict) and entry.get('owner') in unsettled_owners:
+            kept[entry['owner']] = kept.get(entry['owner'], 0) + 1
+            continue
+        for obj in existing.get(name, []):
+            obj.Delete()
+            counts['deleted'] += 1
+        del registry[name]
+        log(f"  Deleted {label} no longer planned: {name}")
+    for owner, count in sorted(kept.items()):
+        log(f"  Kept {count} {label}(s) of '{owner}' (could not be planned this run)", "WARNING")
+
+    return counts, objects
@@ -0,0 +1,125 @@
+"""
+Tree Group Helper Functions
+============================
+
+Common functions for keeping generated tree objects (reaction probes,
+bolt pretensions, ...) in named groups of the Mechanical tree:
+- Group lookup by name
+- Incremental group synchronization
+
+Objects placed in a generated group by hand are never deleted; they are
+moved back out of the group.
+"""
+# pylint: disable=undefined-variable
+# pyright: reportUndefinedVariable=false
+# type: ignore
+# Note: Tree is provided by ANSYS Mechanical runtime environment
+
+from .logging_config import log
+
+
+def find_tree_group(parent, group_name):
+    """
+    Find an existing group among the children of a tree object.
+
+    Args:
+        parent: Tree object holding the group (e.g. a solution or analysis)
+        group_name (str): Name of the group to find
+
+    Returns:
+        Group object or None if not found
+    """
+    try:
+        for child in parent.Children:
+            if hasattr(child, 'Name') and child.Name == group_name:
+                log(f"Found existing group: {group_name}")
+                return child
+    except Exception as e:
+        log(f"Error searching for group '{group_name}': {str(e)}", "ERROR")
+    return None
+
+
+def create_tree_group(objects, group_name):
+    """
+    Group tree objects under a new group.
+
+    Args:
+        objects (list): Tree objects with a common parent
+        group_name (str): Name for the group
+
+    Returns:
+        Group object
+    """
+    try:
+        group = Tree.Group(objects)
+        group.Name = group_name
+        log(f"Created group: {group_name} with {len(objects)} object(s)")
+        return group
+    except Exception as e:
+        log(f"Error creating group '{group_name}': {str(e)}", "ERROR")
+        raise
+
+
+def sync_tree_group(parent, objects, group_name, retired_names=()):
+    """
+    Create a group or bring an existing one up to date incrementally.
+
+    Computes the membership difference between the group and the wanted
+    objects and adds only the missing ones. Members that are not wanted are
+    deleted only if their name is in retired_names (generated objects that
+    are no longer planned); any other member is moved out of the group by
+    regrouping the kept members. Unchanged groups are left untouched. Call
+    inside a Transaction.
+
+    Args:
+        parent: Tree object holding the group (e.g. a solution or analysis)
+        objects (list): Tree objects that should be in the group
+        group_name (str): Name of the group
+        retired_names (iterable): Names of generated objects that may be deleted
+
+    Returns:
+        Group object, or None if there is no group and nothing to group
+    """
+    group = find_tree_group(parent, group_name)
+
+    if group is None:
+        if not objects:
+            return None
+        return create_tree_group(objects, group_name)
+
+    try:
+        retired_names = set(retired_names)
+        members = list(group.Children)
+        member_ids = set(member.ObjectId for member in members)
+        wanted_ids = set(obj.ObjectId for obj in objects)
+
+        to_add = [obj for obj in objects if obj.ObjectId not in member_ids]
+        stale = [member for member in members if member.ObjectId not in wanted_ids]
+        to_delete = [member for member in stale if member.Name in retired_names]
+        to_move = [member for member in stale if member.Name not in retired_names]
+
+        if not to_add and not stale:
+            log(f"Group {group_name} is up to date ({len(members)} object(s))")
+            return group
+
+        for member in to_delete:
+            member.Delete()
+
+        if to_move:
+            # Tree objects cannot be taken out of a group one by one:
+            # ungroup everything and group the wanted objects again
+            kept = [member for member in members if member.ObjectId in wanted_ids]
+            Tree.Ungroup(group)
+            group = create_tree_group(kept + to_add, group_name) if kept or to_add else None
+            for member in to_move:
+                log(f"  Moved '{member.Name}' out of group {group_name} (not generated)", "WARNING")
+        else:
+            for obj in to_add:
+                group.AddChild(obj)
+
+        log(f"Updated group: {group_name} (+{len(to_add)} / -{len(to_delete)} deleted / "
+            f"-{len(to_move)} moved out)")
+        return group
+    except Exception as e:
+        log(f"Error updating group '{group_name}': {str(e)}", "ERROR")
+        raise